@@ -1,28 +1,57 @@
+import importlib
 import streamlit as st
 import streamlit_analytics
 from streamlit import secrets
 
-from pages.utilities import create_session_state_variables
-from pages.simulation import load_models, set_default_parameters
+from pages.session import create_session_state_variables, set_default_parameters
+from pages.preload import PresetPreload
+from pages.metrics import PAGE_SECONDS, PRELOAD_WAIT_SECONDS, start_metrics_server
 
 
 class Application:
 
     def __init__(self):
         self.pages = {}
+        self.preset_pages = set()
 
-    def create_page(self, page_name, page):
+    def create_page(self, page_name, page, requires_presets=False):
+        """
+        page: the page module, or its name (e.g. 'pages.simulation') to import it only when the page is
+        first shown, so that the libraries it needs are not loaded at start-up.
+        requires_presets: the page is only available once all of the presets have been loaded.
+        """
         self.pages[page_name] = page
+        if requires_presets:
+            self.preset_pages.add(page_name)
+
+    def page_module(self, page_name):
+        page = self.pages[page_name]
+        if isinstance(page, str):
+            page = self.pages[page_name] = importlib.import_module(page)
+        return page
+
+    def page_available(self, page_name):
+        return page_name not in self.preset_pages or st.session_state.presets_loaded
+
+    def page_label(self, page_name):
+        return page_name if self.page_available(page_name) else page_name + " (loading...)"
 
     def execute(self):
         """
         Function sets up the sidebar and adds dropdown for page select. Then runs the
         page_code for the selected page.
+
+        Pages that need the presets wait for the background loads (see pages/preload.py).
         """
         if 'config' not in st.session_state:
             from config import Config
             st.session_state.config = Config()
 
+        start_metrics_server(
+            st.session_state.config.config_params['metrics_port'],
+            st.session_state.config.config_params['metrics_address']
+        )
+
         if 'comparison_data' not in st.session_state:
             st.session_state.presets_loaded = False
             st.session_state.comparison_data = {
@@ -32,6 +61,18 @@ class Application:
                 }
                 for preset in st.session_state.config.simulation_presets.keys()
             }
+            st.session_state.preset_preload = PresetPreload(st.session_state.config)
+
+        create_session_state_variables()
+
+        preload = st.session_state.preset_preload
+        if 'A' in preload.collect(st.session_state.comparison_data):
+            if st.session_state.simulation_data['model_vars'] is None:
+                st.session_state.simulation_data = st.session_state.comparison_data['A'][st.session_state.replicate]
+        presets_loaded = preload.complete()
+        if presets_loaded and not st.session_state.presets_loaded:
+            PRELOAD_WAIT_SECONDS.observe(preload.elapsed())
+        st.session_state.presets_loaded = presets_loaded
 
         st.sidebar.image('images/logo.png', use_column_width=True)
         st.sidebar.header('Simulation engine for a social teamwork game.')
@@ -41,44 +82,34 @@ class Application:
             firestore_key_file=secrets["FIRESTORE_KEY_FILE"],
             firestore_collection_name=secrets["FIRESTORE_COLLECTION"]
         ):
-
-            if st.session_state.presets_loaded:
-                selected_page = st.sidebar.selectbox(
-                    label="App Navigation",
-                    options=[*self.pages.keys()],
-                    help="Select page to view.",
-                    key="nav1",
-                    index=0
-                )
-            else:
-                selected_page = "About"
-                st.sidebar.markdown("_Please wait while we load the simulations in the background._")
-
-        create_session_state_variables()
-        set_default_parameters()
-        self.pages[selected_page].page_code()
-
+            selected_page = st.sidebar.selectbox(
+                label="App Navigation",
+                options=[*self.pages.keys()],
+                format_func=self.page_label,
+                help="Select page to view.",
+                key="nav1",
+                index=0
+            )
+
+        progress_bars = {}
         if not st.session_state.presets_loaded:
+            st.sidebar.markdown("_Please wait while we load the simulations in the background._")
+            for preset in preload.futures:
+                label, bar = st.sidebar.columns([1, 6])
+                label.write(preset)
+                progress_bars[preset] = bar.progress(preload.progress(preset))
 
-            for preset, parameters in st.session_state.config.simulation_presets.items():
-
-                preset_e_flag = True if preset == 'E' else False
-                parameter_dict = parameters
-
-                for rep in range(st.session_state.config.config_params['max_replicates']):
-
-                    st.session_state.comparison_data[preset][rep] = load_models(
-                        project_count=parameter_dict['project_count'],
-                        dept_workload=parameter_dict['dept_workload'],
-                        budget_func=parameter_dict['budget_func'],
-                        train_load=parameter_dict['train_load'],
-                        skill_decay=parameter_dict['skill_decay'],
-                        rep=rep,
-                        team_allocation=parameter_dict['team_allocation'],
-                        preset_e=preset_e_flag,
-                        use_preloaded_data=False
-                    )
-
-            st.session_state.simulation_data = st.session_state.comparison_data['A'][st.session_state.replicate]
-            st.session_state.presets_loaded = True
+        set_default_parameters()
+        if self.page_available(selected_page):
+            with PAGE_SECONDS.labels(selected_page).time():
+                self.page_module(selected_page).page_code()
+        else:
+            st.title(selected_page)
+            st.info("This page will be available as soon as the simulations have loaded.")
+
+            def update_progress():
+                for preset, bar in progress_bars.items():
+                    bar.progress(preload.progress(preset))
+
+            preload.wait_until_complete(on_progress=update_progress)
             st.experimental_rerun()
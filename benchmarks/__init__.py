@@ -0,0 +1,80 @@
+"""
+Benchmarks for the hot paths of the app: loading the simulation data, replaying and drawing the social
+network, updating the time series plots and the Comparison page aggregation.
+
+The suites (benchmarks/benchmarks.py) follow the asv conventions: time_* methods, params/param_names
+and a setup method that is run before each timed call. They can be run without asv, against the local
+data/ tree, with:
+
+    python -m benchmarks [name filter ...] [--repeat N]
+
+which reports the best and median time of each benchmark, and the peak memory allocated during one call
+(measured with tracemalloc). The results depend on which of the derived data has been built (see
+data_pipeline.py), so build or remove it to compare the alternatives.
+
+The import time of the app's modules (what each adds to a cold start) is reported separately, with:
+
+    python -m benchmarks.imports [module ...] [--top N]
+
+The page code runs outside of `streamlit run` here: st.session_state is replaced with a plain dict (see
+bare_session), and the Streamlit elements are built but not sent anywhere.
+"""
+import streamlit as st
+
+
+class BareSessionState(dict):
+    """Stands in for st.session_state outside of a Streamlit script run."""
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+    def __delattr__(self, key):
+        del self[key]
+
+
+def bare_session(**state):
+    """Installs a new session state with the app's defaults, updated with state."""
+    from config import Config
+    from pages.session import create_session_state_variables, set_default_parameters
+
+    st.session_state = BareSessionState(config=Config())
+    create_session_state_variables()
+    set_default_parameters()
+    st.session_state.global_time = 0
+    st.session_state.update(state)
+    return st.session_state
+
+
+def reset_caches():
+    """Drops the process-wide caches and singletons, so that the next load starts cold (in this process)."""
+    from pages import aggregates, data_cache, model_store, results_cube
+
+    data_cache._data_cache = None
+    model_store._model_store = None
+    aggregates._aggregates = None
+    results_cube._results_cube = None
+
+
+def load_default_replicate(load_networks=True):
+    """load_models for the default simulation parameters (replicate 0)."""
+    from pages.simulation import preset_e_selected
+    from pages.utilities import load_models
+
+    session = st.session_state
+    return load_models(
+        project_count=session.project_count,
+        dept_workload=session.dept_workload,
+        budget_func=session.budget_func,
+        train_load=session.train_load,
+        skill_decay=session.skill_decay,
+        rep=0,
+        team_allocation=session.team_allocation,
+        load_networks=load_networks,
+        preset_e=preset_e_selected()
+    )
@@ -0,0 +1,87 @@
+"""
+Runs the benchmark suites without asv:  python -m benchmarks [name filter ...] [--repeat N]
+"""
+import sys
+import inspect
+import itertools
+import logging
+import statistics
+import time
+import tracemalloc
+
+# Streamlit warns when its elements are used outside of `streamlit run`.
+logging.getLogger().setLevel(logging.ERROR)
+logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+from . import benchmarks as suites
+
+
+def parameter_combinations(suite):
+    params = getattr(suite, 'params', None)
+    if params is None:
+        return [()]
+    # (As in asv, several parameters are given as a list of lists of values.)
+    if len(getattr(suite, 'param_names', [])) <= 1:
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def describe(suite, method, combination):
+    names = getattr(suite, 'param_names', [])
+    arguments = ", ".join("%s=%r" % (name, value) for name, value in zip(names, combination))
+    return "%s.%s(%s)" % (suite.__name__, method, arguments)
+
+
+def run_once(suite, method, combination, trace_memory=False):
+    """Returns (seconds, peak allocated bytes or None) for one call, after a fresh setup."""
+    instance = suite()
+    if hasattr(instance, 'setup'):
+        instance.setup(*combination)
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    getattr(instance, method)(*combination)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    if hasattr(instance, 'teardown'):
+        instance.teardown(*combination)
+    return elapsed, peak
+
+
+def format_time(seconds):
+    return "%8.2f ms" % (seconds * 1e3) if seconds < 1 else "%8.2f s " % seconds
+
+
+def main(args):
+    repeat = 5
+    if '--repeat' in args:
+        i = args.index('--repeat')
+        repeat = int(args[i + 1])
+        args = args[:i] + args[i + 2:]
+
+    for suite in [cls for _, cls in inspect.getmembers(suites, inspect.isclass) if cls.__module__ == suites.__name__]:
+        for method in [name for name in dir(suite) if name.startswith('time_')]:
+            for combination in parameter_combinations(suite):
+                name = describe(suite, method, combination)
+                if args and not any(pattern in name for pattern in args):
+                    continue
+
+                try:
+                    times = [run_once(suite, method, combination)[0] for _ in range(repeat)]
+                    _, peak = run_once(suite, method, combination, trace_memory=True)
+                except NotImplementedError as e:
+                    print("%-70s skipped: %s" % (name, e))
+                    continue
+
+                print("%-70s best %s   median %s   peak memory %8.2f MB" % (
+                    name, format_time(min(times)), format_time(statistics.median(times)), peak / 2 ** 20
+                ))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,98 @@
+import streamlit as st
+
+from pages import comparison
+from pages.simulation import NetworkPlot, TimeSeriesPlot, simulation_plots
+
+from . import bare_session, reset_caches, load_default_replicate
+
+
+class LoadModels:
+    """
+    load_models for one replicate. Cold: nothing cached in the process (the files may still be in the
+    operating system's page cache). Warm: the replicate is already in the shared data cache.
+    """
+    params = [[False, True], [False, True]]
+    param_names = ['warm', 'load_networks']
+
+    def setup(self, warm, load_networks):
+        bare_session()
+        reset_caches()
+        if warm:
+            load_default_replicate(load_networks)
+
+    def time_load_models(self, warm, load_networks):
+        load_default_replicate(load_networks)
+
+
+class NetworkSeek:
+    """NetworkPlot.get_network_at_t on a newly loaded replay (so without any keyframes yet)."""
+    params = [1, 50, 99]
+    param_names = ['timestep']
+
+    def setup(self, timestep):
+        bare_session()
+        st.session_state.simulation_data = load_default_replicate()
+        # Always replay, even if the frame cache has been built:
+        st.session_state.simulation_data['networks']['frames'] = None
+        # (A new session, so the replay is new too.)
+        self.plot = NetworkPlot(info="", timestep=0)
+
+    def time_get_network_at_t(self, timestep):
+        self.plot.get_network_at_t(timestep)
+
+
+class DrawGraph:
+    """NetworkPlot.draw_graph for one frame (timestep 50), rendered or served from the frame cache."""
+    params = ['render', 'frames']
+    param_names = ['source']
+
+    def setup(self, source):
+        bare_session(display_net=True)
+        st.session_state.simulation_data = load_default_replicate()
+        networks = st.session_state.simulation_data['networks']
+        if source == 'render':
+            networks['frames'] = None
+        elif networks['frames'] is None:
+            raise NotImplementedError("The frame cache has not been built for this replicate.")
+
+        self.plot = NetworkPlot(info="", timestep=50, placeholder=st.empty())
+
+    def time_draw_graph(self, source):
+        self.plot.draw_graph()
+
+
+class TimeSeriesUpdate:
+    """TimeSeriesPlot.update of all of the Simulation page plots, for one playback step."""
+
+    def setup(self):
+        bare_session(global_time=49)
+        st.session_state.simulation_data = load_default_replicate()
+        self.plots = [
+            TimeSeriesPlot(
+                column_names=details['column_names'],
+                column_colours=details['column_colours'],
+                plot_name=plot,
+                y_label=details['y_label'],
+                info=details['info']
+            )
+            for plot, details in simulation_plots().items()
+        ]
+
+    def time_update(self):
+        for plot in self.plots:
+            plot.update(50)
+
+
+class ComparisonPage:
+    """The Comparison page: replicate aggregation and chart data for all of its charts."""
+    params = [False, True]
+    param_names = ['warm']
+
+    def setup(self, warm):
+        bare_session()
+        reset_caches()
+        if warm:
+            comparison.page_code()
+
+    def time_page_code(self, warm):
+        comparison.page_code()
@@ -0,0 +1,55 @@
+"""
+Import-time report for the app's modules:  python -m benchmarks.imports [module ...] [--top N]
+
+Each module is imported in a fresh interpreter with `python -X importtime`, after the modules that
+`streamlit run` has already loaded before it runs the app script (BASELINE), so that the report shows
+what the module itself adds to a cold start. For each module the total is followed by the N slowest
+imports it pulled in (cumulative times, as reported by -X importtime).
+"""
+import re
+import sys
+import subprocess
+
+BASELINE = ['streamlit', 'streamlit.bootstrap']
+MODULES = ['application', 'pages.about', 'pages.preload', 'pages.simulation', 'pages.comparison']
+IMPORT_TIME_PATTERN = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def import_times(module, baseline=BASELINE):
+    """[(module, cumulative microseconds, depth)] for the imports made by module after the baseline."""
+    code = "; ".join("import %s" % m for m in baseline + ['sys', 'time'])
+    code += "; print('--', file=sys.stderr); import %s" % module
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+
+    times = []
+    for line in result.stderr.split('--\n', 1)[1].splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is not None:
+            times.append((match.group(4), int(match.group(2)), (len(match.group(3)) - 1) // 2))
+    return times
+
+
+def main(args):
+    top = 10
+    if '--top' in args:
+        i = args.index('--top')
+        top = int(args[i + 1])
+        args = args[:i] + args[i + 2:]
+
+    for module in args or MODULES:
+        try:
+            times = import_times(module)
+        except ImportError as e:
+            print("%-20s could not be imported: %s" % (module, e))
+            continue
+
+        total = sum(t for _, t, depth in times if depth == 0)
+        print("%-20s %8.1f ms" % (module, total / 1e3))
+        for name, t, depth in sorted((entry for entry in times if entry[2] > 0), key=lambda e: -e[1])[:top]:
+            print("    %-40s %8.1f ms" % (name, t / 1e3))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -14,7 +14,21 @@ class Config:
     def __init__(self):
 
         self.config_params = {
-            'max_replicates': 5
+            'max_replicates': 5,
+            'network_plot_dpi': 100,
+            'preload_workers': 4,
+            'data_cache_mb': 512,
+            # See pages/prefetch.py. Keep prefetch_mb well below data_cache_mb; 0 disables prefetching.
+            'prefetch_workers': 2,
+            'prefetch_mb': 128,
+            # 'server': the app steps through the timesteps and updates the charts on each one.
+            # 'client': the browser animates the charts, and only play/pause/seek events reach the app.
+            'playback_mode': 'server',
+            # 'separate': one chart per simulation plot. 'combined': all plots as panels of a single chart.
+            'simulation_layout': 'separate',
+            # Prometheus endpoint (see pages/metrics.py), e.g. 9464. None disables it.
+            'metrics_port': None,
+            'metrics_address': '127.0.0.1'
         }
 
         self.simulation_variables = {
@@ -37,7 +51,12 @@ class Config:
             'RecentSuccessRate': 'Fraction of projects that were successful over previous XX timesteps.',
             'WorkerTurnover': 'Number of workers replaced due to inactivity on this timestep.',
             'ProjectsPerWorker': 'Mean number of projects that a worker is engaged in, across the workforce.',
-            'AverageTeamSize': 'Mean number of workers in a team, across active projects.'
+            'AverageTeamSize': 'Mean number of workers in a team, across active projects.',
+            'NetworkSize': 'Number of workers in the largest connected part of the social network.',
+            'NetworkIsolates': 'Number of workers outside the largest connected part of the social network.',
+            'NetworkTurnover': 'Number of workers replaced due to inactivity since the start of the simulation.',
+            'NetworkEdges': 'Number of pairs of workers with successful collaborations in the largest connected '
+                            'part of the social network.'
         }
 
         self.simulation_presets = {
@@ -176,6 +195,15 @@ class Config:
                         'Projects per worker: mean number of projects that each worker contributes to.  \n'
                         'Average team size: mean number of workers per team.'
             },
+            # (Only shown when the network metrics have been computed, see pages/network_metrics.py.)
+            'Network Plot': {
+                'column_names': ['NetworkSize', 'NetworkIsolates', 'NetworkTurnover'],
+                'column_colours': ['blue', 'orange', 'red'],
+                'y_label': 'Number of workers',
+                'info': 'Network size: workers in the largest connected part of the social network.  \n'
+                        'Isolates: workers outside it.  \n'
+                        'Turnover: workers replaced due to inactivity since the start of the simulation.'
+            },
         }
 
     def __repr__(self):
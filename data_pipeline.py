@@ -0,0 +1,58 @@
+"""
+Script to build the derived data files that the Streamlit app reads in place of the raw simulation
+files. Run after data_transfer_complete.py has populated ./data.
+
+usage:  python data_pipeline.py [stage ...]
+
+With no arguments all of the default stages are run, in the order listed below. The 'frames' stage is
+optional (it is slow and its output is large) and only runs when requested by name.
+
+Stages:
+    networks        : binary, per-timestep indexed network diffs next to the json files (see
+                      pages/network_diff.py).
+    network_metrics : per-timestep network statistics, merged into model_vars (see pages/network_metrics.py).
+    store           : columnar model_vars/ROI store at data/store (see pages/model_store.py). Includes the
+                      network metrics if they have been computed.
+    aggregates      : replicate mean, std and confidence interval per combination (see pages/aggregates.py).
+                      Requires the store.
+    cube            : all of the results as one labelled N-dimensional array, for the cross-combination queries
+                      of the Comparison page (see pages/results_cube.py). Requires the store.
+    frames          : pre-rendered social network frames for the preset replicates (see pages/network_frames.py).
+    catalog         : index of the replicates and files available under data/ (see pages/catalog.py). Run it
+                      last, and again after the frames stage, e.g. python data_pipeline.py frames catalog.
+"""
+
+import sys
+
+from pages.model_store import build_model_store
+from pages.aggregates import build_aggregates
+from pages.results_cube import build_results_cube
+from pages.network_diff import convert_network_diffs
+from pages.network_metrics import build_network_metrics
+from pages.network_frames import build_network_frames
+from pages.catalog import build_catalog
+
+
+STAGES = {
+    'networks': convert_network_diffs,
+    'network_metrics': build_network_metrics,
+    'store': build_model_store,
+    'aggregates': build_aggregates,
+    'cube': build_results_cube,
+    'frames': build_network_frames,
+    'catalog': build_catalog,
+}
+DEFAULT_STAGES = ['networks', 'network_metrics', 'store', 'aggregates', 'cube', 'catalog']
+
+
+if __name__ == '__main__':
+
+    stages = sys.argv[1:] if len(sys.argv) > 1 else DEFAULT_STAGES
+
+    for stage in stages:
+        if stage not in STAGES:
+            raise Exception("Unknown stage '%s'. Available stages: %s" % (stage, ', '.join(STAGES)))
+
+    for stage in stages:
+        print("Running stage: %s" % stage)
+        STAGES[stage]()
@@ -2,67 +2,41 @@
 Script to transfer data from a local copy of main SuperScript/simulation_io directory into a stripped
 down version at ./data which is used to drive the Streamlit app.
 
-usage:  python data_transfer_partial.py <path_to_simulation_io>
+usage:  python data_transfer_complete.py <path_to_simulation_io> [--processes N]
 
 Note: currently only model_vars files are retained (more granular agent, project and network data are stripped out).
-Note: this also limits the number of replicate simulations to 10 by default (can reduce to save space).
+Note: this also limits the number of replicate simulations to MAX_REP (can reduce to save space).
 Note: train = 2 encodes the 'training boost' scenario
+
+Unwanted files are filtered out before copying (rather than copied and then deleted), and the parameter
+combinations are transferred in parallel, one per process. Every copied file is recorded in
+data/transfer_manifest.json with the size, modification time and SHA-256 checksum of its source, so that
+a re-run only copies files that have changed: files with an unchanged size and modification time are
+skipped, and files that have only been touched (same checksum) are not rewritten. Files from an earlier
+transfer that are no longer in the source are removed.
+
+Run data_pipeline.py afterwards to rebuild the derived data.
 """
 
 import os
+import re
 import sys
-import shutil
-import glob
+import json
+import hashlib
 import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
+from pages.data_paths import DATA_DIR, PRESET_E_PARAMETERS, REP_PATTERN, get_sub_dir
 
-MAX_REP = 5  # Will only copy up to MAX_REP replicates
-
-if len(sys.argv) != 2:
-    raise Exception("You need to input the path to simulation_io")
-
-sim_path = sys.argv[1]
-
-
-def data_not_found(path):
-    print("Could not find simulation data at: " + path)
-
-
-def strip_unwanted(path, max_reps=True):
-
-    names = ['Niter0', 'Basic']
-    for name in names:
-        for f in glob.glob(to_path + "/%s" % name):
-            shutil.rmtree(f)
-
-    names = ['agents', 'project', 'network_timestep']
-    for name in names:
-        for f in glob.glob(to_path + "/*/%s*" % name):
-            os.remove(f)
-
-    for f in glob.glob(to_path + "/*/network_rep_*_timestep_*"):
-        file_name = f.split('/')[-1]
-        _t = file_name.split('_')[4].split('.')[0]
-        if int(_t) > 1:
-            os.remove(f)
-
-    if max_reps:
-        for f in glob.glob(to_path + "/*/*"):
-            file_name = f.split('/')[-1]
-            if 'rep' in file_name:
-                rep_num = file_name.split('rep')[1].split('_')[1].split('.')[0]
-                if int(rep_num) > MAX_REP:
-                    os.remove(f)
 
+MAX_REP = 5  # Will only copy up to MAX_REP replicates
 
-def copy_data(src, dst, overwrite=False):
-    if not os.path.isdir(src):
-        data_not_found(src)
-    else:
-        if overwrite or not os.path.isdir(dst):
-            shutil.copytree(src, dst)
-            strip_unwanted(dst)
+SKIPPED_DIRS = ['Niter0', 'Basic']
+SKIPPED_PREFIXES = ('agents', 'project', 'network_timestep')
+NETWORK_TIMESTEP_PATTERN = re.compile(r'network_rep_\d+_timestep_(\d+)')
 
+MANIFEST_FILE = os.path.join(DATA_DIR, 'transfer_manifest.json')
+CHUNK_SIZE = 2 ** 20
 
 PPS = [1, 2, 3, 5, 10]
 SD = [0.95, 0.99, 0.995]
@@ -70,56 +44,172 @@ DW = [0.1, 0.3]
 TL = [0.1, 0.3, 0.0, 2.0]
 BF = [0, 1]
 
-combinations = list(itertools.product(PPS, SD, DW, TL, BF))
-
-for parameters in combinations:
-
-    new_projects = parameters[0]
-    skill_decay = parameters[1]
-    departmental_workload = parameters[2]
-    training_load = 0.1 if parameters[3] == 2.0 else parameters[3]
-    training_boost = True if parameters[3] == 2.0 else False
-    training_flag = False if training_load == 0.0 else True
-    budget_functionality = parameters[4]
-
-    batch_name = (
-            'pps_%d_sd_%.3f_dw_%.1f_tl_%.1f_tf_%d_tb_%d_bf_%d_010921_v1.1'
-            % (
-                new_projects, skill_decay, departmental_workload,
-                training_load, training_flag, training_boost, budget_functionality
-            )
-    )
-
-    from_path = sim_path + batch_name
-    to_path = 'data/' + batch_name
-    copy_data(from_path, to_path, overwrite=True)
-
-## Now run Preset E transfer:
-combinations = [
-        [3, 0.95, 0.1, 0.1, 1],
-        [3, 0.99, 0.1, 0.1, 1],
-        [3, 0.995, 0.1, 0.1, 1],
-        [3, 0.995, 0.1, 0.0, 1],
-        [3, 0.995, 0.1, 0.3, 1],
-        [3, 0.995, 0.1, 2.0, 1]
+# Preset E: (skill decay, training load)
+PRESET_E_COMBINATIONS = [
+    (0.95, 0.1),
+    (0.99, 0.1),
+    (0.995, 0.1),
+    (0.995, 0.0),
+    (0.995, 0.3),
+    (0.995, 2.0)
+]
+
+
+def data_not_found(path):
+    print("Could not find simulation data at: " + path)
+
+
+def batch_names():
+    names = [
+        get_sub_dir(new_projects, departmental_workload, budget_functionality, skill_decay, training_load)
+        for new_projects, skill_decay, departmental_workload, training_load, budget_functionality
+        in itertools.product(PPS, SD, DW, TL, BF)
+    ]
+    names += [
+        get_sub_dir(
+            PRESET_E_PARAMETERS['project_count'], PRESET_E_PARAMETERS['dept_workload'],
+            PRESET_E_PARAMETERS['budget_func'], skill_decay, training_load, preset_e=True
+        )
+        for skill_decay, training_load in PRESET_E_COMBINATIONS
     ]
+    return names
+
 
-for parameters in combinations:
+def wanted(relative_path):
+    """Whether the app uses the file at relative_path ('/'-separated) within a batch directory."""
+    parts = relative_path.split('/')
+    if parts[0] in SKIPPED_DIRS:
+        return False
+    if len(parts) != 2:
+        return True
+
+    file_name = parts[1]
+    if file_name.startswith(SKIPPED_PREFIXES):
+        return False
+
+    timestep = NETWORK_TIMESTEP_PATTERN.match(file_name)
+    if timestep is not None and int(timestep.group(1)) > 1:
+        return False
+
+    rep = REP_PATTERN.search(file_name)
+    return rep is None or int(rep.group(1)) <= MAX_REP
+
+
+def file_checksum(path):
+    checksum = hashlib.sha256()
+    with open(path, 'rb') as ifile:
+        for chunk in iter(lambda: ifile.read(CHUNK_SIZE), b''):
+            checksum.update(chunk)
+    return checksum.hexdigest()
 
-    new_projects = parameters[0]
-    skill_decay = parameters[1]
-    departmental_workload = parameters[2]
-    training_load = 0.1 if parameters[3] == 2.0 else parameters[3]
-    training_boost = True if parameters[3] == 2.0 else False
-    training_flag = False if training_load == 0.0 else True
-    budget_functionality = parameters[4]
 
-    batch_name = (
-            'preset_E_sd_%.3f_tl_%.1f_tf_%d_tb_%d_251021_v1.1'
-            % (skill_decay, training_load, training_flag, training_boost)
-    )
+def copy_file(src, dst):
+    """Copies src to dst (replacing it only once complete), returning the checksum of the data."""
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    checksum = hashlib.sha256()
+    with open(src, 'rb') as ifile, open(dst + '.tmp', 'wb') as ofile:
+        for chunk in iter(lambda: ifile.read(CHUNK_SIZE), b''):
+            checksum.update(chunk)
+            ofile.write(chunk)
+    os.replace(dst + '.tmp', dst)
+    return checksum.hexdigest()
+
+
+def transfer_batch(src_dir, dst_dir, manifest):
+    """
+    Copies the files of one batch directory that the app uses and that have changed since the previous
+    transfer (manifest: the batch's entries from then). Returns (the batch's new entries, files copied).
+    """
+    entries = {}
+    copied = 0
+
+    for root, dirs, files in os.walk(src_dir):
+        relative_root = os.path.relpath(root, src_dir).replace(os.sep, '/')
+        if relative_root == '.':
+            dirs[:] = [d for d in dirs if d not in SKIPPED_DIRS]
+
+        for file_name in files:
+            relative_path = file_name if relative_root == '.' else relative_root + '/' + file_name
+            if not wanted(relative_path):
+                continue
+
+            src = os.path.join(root, file_name)
+            dst = os.path.join(dst_dir, *relative_path.split('/'))
+            stat = os.stat(src)
+            entry = {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+            previous = manifest.get(relative_path)
+            if previous is not None and os.path.isfile(dst) and os.path.getsize(dst) == stat.st_size:
+                if previous['size'] == entry['size'] and previous['mtime'] == entry['mtime']:
+                    entries[relative_path] = previous
+                    continue
+
+                entry['sha256'] = file_checksum(src)
+                if entry['sha256'] == previous['sha256']:
+                    entries[relative_path] = entry
+                    continue
+
+            entry['sha256'] = copy_file(src, dst)
+            entries[relative_path] = entry
+            copied += 1
+
+    # Remove the files of an earlier transfer that are no longer in the source (or no longer wanted).
+    for relative_path in set(manifest) - set(entries):
+        path = os.path.join(dst_dir, *relative_path.split('/'))
+        if os.path.isfile(path):
+            os.remove(path)
+
+    return entries, copied
+
+
+def load_manifest():
+    if not os.path.isfile(MANIFEST_FILE):
+        return {}
+    with open(MANIFEST_FILE, 'r') as ifile:
+        return json.load(ifile)
+
+
+def save_manifest(manifest):
+    with open(MANIFEST_FILE + '.tmp', 'w') as ofile:
+        json.dump(manifest, ofile, indent=1, sort_keys=True)
+    os.replace(MANIFEST_FILE + '.tmp', MANIFEST_FILE)
+
+
+def transfer(sim_path, processes=None):
+    manifest = load_manifest()
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = {}
+        for batch_name in batch_names():
+            from_path = os.path.join(sim_path, batch_name)
+            if not os.path.isdir(from_path):
+                data_not_found(from_path)
+                continue
 
-    from_path = sim_path + batch_name
-    to_path = 'data/' + batch_name
-    copy_data(from_path, to_path, overwrite=True)
+            to_path = os.path.join(DATA_DIR, batch_name)
+            futures[executor.submit(transfer_batch, from_path, to_path, manifest.get(batch_name, {}))] = batch_name
+
+        for future in as_completed(futures):
+            batch_name = futures[future]
+            entries, copied = future.result()
+
+            # Saved after each batch, so that an interrupted transfer keeps its progress.
+            manifest[batch_name] = entries
+            save_manifest(manifest)
+            print("%s: copied %d of %d files" % (batch_name, copied, len(entries)))
+
+
+if __name__ == '__main__':
+
+    args = sys.argv[1:]
+    processes = None
+    if '--processes' in args:
+        i = args.index('--processes')
+        processes = int(args[i + 1])
+        args = args[:i] + args[i + 2:]
+
+    if len(args) != 1:
+        raise Exception("You need to input the path to simulation_io")
 
+    transfer(args[0], processes)
@@ -0,0 +1,117 @@
+"""
+Mean, std and 95% confidence interval half-width over the replicates of each (combination, allocator),
+as a (combinations, statistics, timesteps, variables) array in store/aggregates.npy. The combinations are
+listed in store/aggregates.json.
+
+Build with:  python data_pipeline.py store aggregates
+"""
+import os
+import json
+import numpy as np
+import pandas as pd
+
+from .model_store import STORE_DIR, ModelStore
+
+AGGREGATES_FILE = 'aggregates.npy'
+AGGREGATES_INDEX_FILE = 'aggregates.json'
+STATISTICS = ['mean', 'std', 'ci95']
+TERMINAL_WINDOW = 25
+
+# Two-sided 95% critical values of Student's t distribution, by degrees of freedom.
+T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571,
+    6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228
+}
+
+
+def t_critical(degrees_of_freedom):
+    return T_CRITICAL_95.get(degrees_of_freedom, 1.96)
+
+
+def build_aggregates(store_dir=STORE_DIR, verbose=True):
+    store = ModelStore(store_dir)
+
+    groups = {}
+    for i, row in enumerate(store.rows):
+        groups.setdefault((row['sub_dir'], row['allocator']), []).append(i)
+
+    # (rows, timesteps, variables)
+    values = np.stack([np.asarray(store.array(v), dtype=np.float64) for v in store.variables], axis=-1)
+
+    aggregates = np.full(
+        (len(groups), len(STATISTICS), store.timesteps, len(store.variables)), np.nan, dtype=np.float32
+    )
+    index = []
+    for g, ((sub_dir, allocator), rows) in enumerate(sorted(groups.items())):
+        replicates = values[rows]
+        n = len(rows)
+
+        aggregates[g, 0] = np.nanmean(replicates, axis=0)
+        if n > 1:
+            std = np.nanstd(replicates, axis=0, ddof=1)
+            aggregates[g, 1] = std
+            aggregates[g, 2] = t_critical(n - 1) * std / np.sqrt(n)
+
+        group = {key: value for key, value in store.rows[rows[0]].items() if key not in ('rep', 'length')}
+        group['replicates'] = n
+        index.append(group)
+
+    np.save(os.path.join(store_dir, AGGREGATES_FILE), aggregates)
+    with open(os.path.join(store_dir, AGGREGATES_INDEX_FILE), 'w') as ofile:
+        json.dump(
+            {'statistics': STATISTICS, 'variables': store.variables, 'timesteps': store.timesteps, 'groups': index},
+            ofile
+        )
+
+    if verbose:
+        print("Wrote replicate statistics for %d combinations to %s" % (len(index), store_dir))
+
+
+class Aggregates:
+
+    def __init__(self, store_dir=STORE_DIR):
+        with open(os.path.join(store_dir, AGGREGATES_INDEX_FILE), 'r') as ifile:
+            index = json.load(ifile)
+
+        self.statistics = index['statistics']
+        self.variables = index['variables']
+        self.timesteps = index['timesteps']
+        self.groups = index['groups']
+        self._group_lookup = {
+            (group['sub_dir'], group['allocator']): g
+            for g, group in enumerate(self.groups)
+        }
+        self.array = np.load(os.path.join(store_dir, AGGREGATES_FILE), mmap_mode='r')
+        # Changes whenever the aggregates are rebuilt.
+        self.version = os.stat(os.path.join(store_dir, AGGREGATES_FILE)).st_mtime_ns
+
+    def group(self, sub_dir, allocator):
+        return self._group_lookup.get((sub_dir, allocator))
+
+    def frame(self, sub_dir, allocator, statistic='mean'):
+        """Per-timestep statistic over the replicates, with the model_vars columns (and 'time')."""
+        g = self._group_lookup[(sub_dir, allocator)]
+        data = pd.DataFrame(
+            np.asarray(self.array[g, self.statistics.index(statistic)], dtype=np.float64),
+            columns=self.variables
+        )
+        data['time'] = data.index
+        return data
+
+    def terminal(self, sub_dir, allocator, variables=None, window=TERMINAL_WINDOW, statistic='mean'):
+        """Statistic averaged over the final window timesteps, as a Series indexed by variable."""
+        g = self._group_lookup[(sub_dir, allocator)]
+        columns = self.variables if variables is None else variables
+        values = np.nanmean(self.array[g, self.statistics.index(statistic), -window:], axis=0)
+        return pd.Series(values[[self.variables.index(c) for c in columns]], index=columns)
+
+
+_aggregates = None
+
+
+def get_aggregates(store_dir=STORE_DIR):
+    """Process-wide Aggregates, or None if they have not been built."""
+    global _aggregates
+    if _aggregates is None and os.path.isfile(os.path.join(store_dir, AGGREGATES_INDEX_FILE)):
+        _aggregates = Aggregates(store_dir)
+    return _aggregates
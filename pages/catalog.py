@@ -0,0 +1,101 @@
+"""
+Catalog of the simulation data under ./data: every (sub_dir, allocator, replicate) that has data, with
+the size of each of its files (see data_paths.REPLICATE_FILES).
+
+The catalog is built once, offline, and loaded at start-up. Loading then looks up which files a replicate
+has instead of probing the filesystem, a missing combination or replicate is reported without touching
+the disk, and the sidebar marks the parameter values that have no data.
+
+Build with:  python data_pipeline.py catalog
+(It is one of the default stages, run last. Re-run it after any stage that adds files, e.g. frames.)
+"""
+import os
+import json
+
+from .data_paths import DATA_DIR, REPLICATE_FILES, list_replicates, parse_sub_dir, replicate_path
+
+CATALOG_FILE = 'catalog.json'
+
+
+def build_catalog(data_dir=DATA_DIR, verbose=True):
+    combinations = {}
+    for sub_dir, allocator, rep in list_replicates(data_dir):
+        combination = combinations.setdefault(sub_dir, {'parameters': parse_sub_dir(sub_dir), 'allocators': {}})
+
+        files = {}
+        for kind, file_name in REPLICATE_FILES.items():
+            path = replicate_path(sub_dir, allocator, file_name % rep, data_dir)
+            if os.path.isfile(path):
+                files[kind] = os.path.getsize(path)
+        combination['allocators'].setdefault(allocator, {})[rep] = files
+
+    path = os.path.join(data_dir, CATALOG_FILE)
+    with open(path + '.tmp', 'w') as ofile:
+        json.dump({'combinations': combinations}, ofile, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+    if verbose:
+        replicates = sum(len(reps) for c in combinations.values() for reps in c['allocators'].values())
+        print("Catalogued %d replicates of %d combinations in %s" % (replicates, len(combinations), path))
+
+
+class Catalog:
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = data_dir
+
+        with open(os.path.join(data_dir, CATALOG_FILE), 'r') as ifile:
+            combinations = json.load(ifile)['combinations']
+
+        self.parameters = {sub_dir: combination['parameters'] for sub_dir, combination in combinations.items()}
+        # (json keys are strings.)
+        self._files = {
+            (sub_dir, allocator, int(rep)): files
+            for sub_dir, combination in combinations.items()
+            for allocator, reps in combination['allocators'].items()
+            for rep, files in reps.items()
+        }
+        self._allocators = set((sub_dir, allocator) for sub_dir, allocator, _ in self._files)
+
+    def has(self, sub_dir, allocator, rep):
+        return (sub_dir, allocator, rep) in self._files
+
+    def files(self, sub_dir, allocator, rep):
+        """{kind: size in bytes} of the files of a replicate, or None if it has no data."""
+        return self._files.get((sub_dir, allocator, rep))
+
+    def paths(self, sub_dir, allocator, rep):
+        """{kind: path} of the files of a replicate (empty if it has no data)."""
+        return {
+            kind: replicate_path(sub_dir, allocator, REPLICATE_FILES[kind] % rep, self.data_dir)
+            for kind in self._files.get((sub_dir, allocator, rep), {})
+        }
+
+    def replicates(self, sub_dir, allocator):
+        return sorted(rep for s, a, rep in self._files if s == sub_dir and a == allocator)
+
+    def available(self, sub_dir, allocator=None):
+        """Whether there is data for the combination (with the given allocator, if any)."""
+        if allocator is None:
+            return sub_dir in self.parameters
+        return (sub_dir, allocator) in self._allocators
+
+
+def probe_paths(sub_dir, allocator, rep, data_dir=DATA_DIR):
+    """As Catalog.paths, but looking for the files on disk (for when the catalog has not been built)."""
+    paths = {
+        kind: replicate_path(sub_dir, allocator, file_name % rep, data_dir)
+        for kind, file_name in REPLICATE_FILES.items()
+    }
+    return {kind: path for kind, path in paths.items() if os.path.isfile(path)}
+
+
+_catalog = None
+
+
+def get_catalog(data_dir=DATA_DIR):
+    """Process-wide Catalog, or None if the catalog has not been built."""
+    global _catalog
+    if _catalog is None and os.path.isfile(os.path.join(data_dir, CATALOG_FILE)):
+        _catalog = Catalog(data_dir)
+    return _catalog
@@ -0,0 +1,126 @@
+"""
+Long-format data for the multi-series Altair charts.
+
+Altair draws several series in one chart from a single 'long' table, with one row per (series, timestep)
+and the series name in a label column. The table is assembled with one concat over all of the series
+(linear in the number of rows), rather than by appending series one at a time.
+
+The data behind a chart only changes when the data on disk does, so the tables are kept across reruns
+and sessions with cached_chart_data(), in the shared data cache (within its memory budget), keyed by the
+version of the precomputed aggregates and results cube. Cached tables are shared: treat them as read-only.
+
+The time series on the Simulation page are converted to long format once, when a replicate is loaded (see
+PlotSeries), so that playback only takes row ranges of them.
+"""
+import numpy as np
+import pandas as pd
+
+from .aggregates import get_aggregates
+from .data_cache import get_data_cache
+from .results_cube import get_results_cube
+
+
+def long_format(frames, columns, label='variable', rename=None, transform=None):
+    """
+    frames: {series name: DataFrame}. Returns the given columns of every frame stacked into one DataFrame,
+    with the series name in the label column.
+
+    rename: {column: new name}, applied to the stacked columns.
+    transform: {column: function}, applied to each series separately (after renaming), e.g. smoothing.
+    """
+    names = list(frames.keys())
+    parts = []
+    for name in names:
+        part = frames[name][columns]
+        if rename:
+            part = part.rename(columns=rename)
+        if transform:
+            part = part.assign(**{
+                column: np.asarray(function(part[column]))
+                for column, function in transform.items()
+            })
+        parts.append(part)
+
+    data = pd.concat(parts, ignore_index=True)
+    data[label] = np.repeat(names, [len(part) for part in parts])
+    return data
+
+
+def time_series_data(frames, column, label='variable', transform=None):
+    """Long-format ('time', 'value', label) table of one column of each frame, for time_series_plot."""
+    return long_format(
+        frames, ['time', column], label=label,
+        rename={column: 'value'},
+        transform=None if transform is None else {'value': transform}
+    )
+
+
+def data_version():
+    aggregates = get_aggregates()
+    cube = get_results_cube()
+    return (None if aggregates is None else aggregates.version, None if cube is None else cube.version)
+
+
+def cached_chart_data(key, build):
+    """
+    Returns the chart data for key, calling build() on the first request. key must identify the data
+    that build() reads (parameters, replicates and columns); the data version is added to it.
+    """
+    return get_data_cache().get_or_load(('chart', data_version(), key), build)
+
+
+class PlotSeries:
+    """
+    The columns of one Simulation page plot in long format ('time', 'variable', 'value', 'description'),
+    ordered by timestep. offsets[t] is the first row of timestep t, so the rows for a range of timesteps
+    are a slice.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        times = data['time'].to_numpy()
+        self.offsets = np.searchsorted(times, np.arange(times.max() + 2))
+
+    @classmethod
+    def from_model_vars(cls, model_vars, columns, descriptions):
+        times = model_vars['time'].to_numpy()
+        return cls(pd.DataFrame({
+            'time': np.repeat(times, len(columns)),
+            'variable': np.tile(columns, len(times)),
+            'value': model_vars[columns].to_numpy(dtype=np.float64).ravel(),
+            'description': np.tile([descriptions.get(c, '(undefined)') for c in columns], len(times))
+        }))
+
+    @classmethod
+    def combine(cls, plot_series, label='plot'):
+        """One PlotSeries for several plots ({plot name: PlotSeries}), with the plot name in the label column."""
+        data = long_format(
+            {plot: series.data for plot, series in plot_series.items()},
+            ['time', 'variable', 'value', 'description'], label=label
+        )
+        return cls(data.sort_values('time', kind='stable', ignore_index=True))
+
+    def rows(self, start, stop):
+        """Rows for timesteps start to stop (inclusive, as with .loc)."""
+        start = min(max(start, 0), len(self.offsets) - 1)
+        stop = min(max(stop + 1, start), len(self.offsets) - 1)
+        return self.data.iloc[self.offsets[start]:self.offsets[stop]]
+
+
+def available_plots(plots, model_vars):
+    """The plots (as config.simulation_plots) that model_vars has all of the columns for."""
+    return {
+        plot: details for plot, details in plots.items()
+        if all(column in model_vars for column in details['column_names'])
+    }
+
+
+def build_plot_series(model_vars):
+    """PlotSeries for each of the plots in config.simulation_plots that model_vars has, keyed by plot name."""
+    from config import Config
+    config = Config()
+
+    return {
+        plot: PlotSeries.from_model_vars(model_vars, details['column_names'], config.simulation_variables)
+        for plot, details in available_plots(config.simulation_plots, model_vars).items()
+    }
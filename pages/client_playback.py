@@ -0,0 +1,55 @@
+"""
+Client-side playback of the Simulation page time series (config_params['playback_mode'] = 'client').
+
+The full series of every plot is sent to the browser once, in a custom component
+(components/client_playback/index.html), which reveals the timesteps itself. The server only receives
+the play, pause, seek and end events, rather than running the playback loop and streaming add_rows
+deltas to each chart on every timestep.
+
+Component arguments are sent again on every rerun, so the specs are only passed until they have been
+sent for the current data; after that the component only gets the data_key. If it does not have that
+data (e.g. after the page was left and the component reloaded) it asks for it with a 'load' event.
+"""
+import os
+import streamlit as st
+import streamlit.components.v1 as components
+
+_client_playback = None
+
+
+def get_component():
+    # Declared on first use: declare_component looks up the calling module among all of the loaded
+    # modules, which takes tens of milliseconds, and the component is only needed in client mode.
+    global _client_playback
+    if _client_playback is None:
+        _client_playback = components.declare_component(
+            'client_playback', path=os.path.join(os.path.dirname(__file__), 'components', 'client_playback')
+        )
+    return _client_playback
+
+
+def client_playback(get_plots, timestep, speed, data_key, max_time=99, key=None):
+    """
+    get_plots: returns a list of {'title', 'info', 'spec'}, where spec is a Vega-Lite spec with the complete
+    series, filtered on the timestep signal 't' (e.g. transform_filter('datum.time <= t')). It is only
+    called when the plots have to be sent.
+    data_key: identifies the data; the charts are only rebuilt (at timestep) when it changes.
+
+    Returns the latest playback event as {'event': 'play'|'pause'|'seek'|'end', 'timestep', 'id'},
+    or None before the first one.
+    """
+    sent = st.session_state.get('client_playback_sent') == data_key
+    event = get_component()(
+        plots=None if sent else get_plots(), timestep=timestep, speed=speed, data_key=data_key,
+        max_time=max_time, key=key, default=None
+    )
+    st.session_state.client_playback_sent = data_key
+
+    if event is not None and event['event'] == 'load':
+        if event['id'] != st.session_state.get('client_playback_load_id'):
+            # Rerun, this time with the plots.
+            st.session_state.client_playback_load_id = event['id']
+            st.session_state.pop('client_playback_sent', None)
+            st.experimental_rerun()
+        return None
+    return event
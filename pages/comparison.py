@@ -3,8 +3,117 @@ import streamlit as st
 import numpy as np
 import altair as alt
 
-from .utilities import load_models, moving_average
-from .simulation import set_default_parameters
+from .utilities import load_models
+from .transforms import rolling_mean
+from .session import set_default_parameters
+from .aggregates import get_aggregates, TERMINAL_WINDOW
+from .results_cube import cell_labels, get_results_cube
+from .data_paths import ALLOCATOR_DIRS, get_sub_dir
+from .chart_data import long_format, time_series_data, cached_chart_data
+
+# The model variables shown on this page (only these are loaded for the replicates it reads itself).
+COMPARISON_VARIABLES = [
+    'Roi', 'AverageWorkerOvr', 'AverageTeamOvr', 'AverageSuccessProbability',
+    'ProjectLoad', 'Slack', 'TrainingLoad', 'DeptLoad'
+]
+
+
+def precomputed_aggregates(max_rep, preset_e, parameters):
+    """
+    Returns (aggregates, sub_dir, allocator) if the precomputed replicate statistics (see aggregates.py)
+    cover this parameter combination with at most max_rep replicates, otherwise None.
+    """
+    aggregates = get_aggregates()
+    if aggregates is None:
+        return None
+
+    sub_dir = get_sub_dir(
+        parameters['project_count'], parameters['dept_workload'], parameters['budget_func'],
+        parameters['skill_decay'], parameters['train_load'], preset_e
+    )
+    allocator = ALLOCATOR_DIRS[parameters['team_allocation']]
+    g = aggregates.group(sub_dir, allocator)
+
+    if g is None or aggregates.groups[g]['replicates'] > max_rep:
+        return None
+    return aggregates, sub_dir, allocator
+
+
+def cube_replicates(max_rep, preset_e, parameters, columns=None):
+    """
+    The first max_rep replicates of a parameter combination in the results cube (see results_cube.py), as
+    a (rep, timestep, variable) CubeView, or None if the cube has not been built or has no data for them.
+    """
+    cube = get_results_cube()
+    if cube is None:
+        return None
+
+    labels = cell_labels(
+        parameters['project_count'], parameters['dept_workload'], parameters['budget_func'],
+        parameters['skill_decay'], parameters['train_load'], parameters['team_allocation'], preset_e
+    )
+    labels['rep'] = [rep for rep in cube.coords['rep'] if rep < max_rep]
+    if columns is not None:
+        labels['variable'] = [c for c in cube.coords['variable'] if c in columns]
+    try:
+        replicates = cube.sel(**labels)
+    except KeyError:
+        return None
+    return replicates if replicates.mask.any() else None
+
+
+def load_replicate_mean(max_rep, preset_e=False, columns=None, **parameters):
+    """
+    Mean over the replicate simulations of a parameter combination, for each timestep (of all variables,
+    or of columns).
+    """
+    replicates = cube_replicates(max_rep, preset_e, parameters, columns)
+    if replicates is not None:
+        return replicates.mean('rep').frame()
+
+    precomputed = precomputed_aggregates(max_rep, preset_e, parameters)
+    if precomputed is not None:
+        aggregates, sub_dir, allocator = precomputed
+        return aggregates.frame(sub_dir, allocator)
+
+    df_list = [
+        load_models(
+            project_count=parameters['project_count'],
+            dept_workload=parameters['dept_workload'],
+            budget_func=parameters['budget_func'],
+            train_load=parameters['train_load'],
+            skill_decay=parameters['skill_decay'],
+            rep=rep,
+            team_allocation=parameters['team_allocation'],
+            load_networks=False,
+            preset_e=preset_e,
+            use_preloaded_data=False,
+            columns=columns
+        )['model_vars']
+        for rep in range(max_rep)
+    ]
+    df_concat = pd.concat(df_list)
+    return df_concat.groupby(df_concat.index).mean()
+
+
+def terminal_mean(data, column):
+    """Mean of column over the final TERMINAL_WINDOW timesteps."""
+    return np.mean(data[column].iloc[-TERMINAL_WINDOW:])
+
+
+def load_terminal_mean(column, max_rep, preset_e=False, **parameters):
+    """Terminal mean of column, for the replicate mean of a parameter combination."""
+    replicates = cube_replicates(max_rep, preset_e, parameters, columns=[column])
+    if replicates is not None:
+        # (As terminal_mean, without making a DataFrame of the mean.)
+        return np.nanmean(replicates.sel(variable=column).mean('rep').values[-TERMINAL_WINDOW:])
+
+    precomputed = precomputed_aggregates(max_rep, preset_e, parameters)
+    if precomputed is not None:
+        aggregates, sub_dir, allocator = precomputed
+        return aggregates.terminal(sub_dir, allocator, variables=[column])[column]
+
+    return terminal_mean(load_replicate_mean(max_rep, preset_e=preset_e, columns=[column], **parameters), column)
 
 
 def time_series_plot(chart_data, domain, colours, title, ylabel, element=None):
@@ -113,7 +222,17 @@ def load_method_comparison_data(max_rep):
     }
 
     for allocator, method_dict in allocation_methods.items():
+        # The replicates that are in the results cube are taken from it, without loading them.
+        replicates = cube_replicates(
+            max_rep, parameter_dict['preset_e_flag'],
+            dict(parameter_dict, budget_func=method_dict['budget_flag'], team_allocation=method_dict['method']),
+            columns=['Roi']
+        )
         for rep in range(max_rep):
+            replicate = replicates.sel(rep=rep) if replicates is not None and rep in replicates.coords['rep'] else None
+            if replicate is not None and replicate.mask:
+                method_comparison_data[allocator][rep] = {'model_vars': replicate.frame(), 'networks': None}
+                continue
 
             method_comparison_data[allocator][rep] = load_models(
                 project_count=parameter_dict['project_count'],
@@ -123,8 +242,10 @@ def load_method_comparison_data(max_rep):
                 skill_decay=parameter_dict['skill_decay'],
                 rep=rep,
                 team_allocation=method_dict['method'],
+                load_networks=False,
                 preset_e=parameter_dict['preset_e_flag'],
-                use_preloaded_data=False
+                use_preloaded_data=False,
+                columns=['Roi']
             )
 
     return allocation_methods, method_comparison_data
@@ -147,6 +268,12 @@ def page_code():
 
     allocation_methods, method_comparison_data = load_method_comparison_data(max_rep_method_comparison)
 
+    # Identify the data behind the charts, for caching the chart data (see chart_data.py).
+    source_key = (max_rep, st.session_state.replicate if max_rep == 1 else None)
+    method_source_key = (
+        max_rep_method_comparison, st.session_state.replicate if max_rep_method_comparison == 1 else None
+    )
+
     if max_rep == 1:
         source_data = {
             preset: st.session_state.comparison_data[preset][st.session_state.replicate]['model_vars']
@@ -154,14 +281,10 @@ def page_code():
         }
 
     else:
-        source_data = {}
-        for preset in st.session_state.config.simulation_presets.keys():
-            df_list = [
-                st.session_state.comparison_data[preset][rep]['model_vars']
-                for rep in range(max_rep)
-            ]
-            df_concat = pd.concat(df_list)
-            source_data[preset] = df_concat.groupby(df_concat.index).mean()
+        source_data = {
+            preset: load_replicate_mean(max_rep, preset_e=(preset == 'E'), columns=COMPARISON_VARIABLES, **parameters)
+            for preset, parameters in st.session_state.config.simulation_presets.items()
+        }
 
     if max_rep_method_comparison == 1:
         aggregated_pure_comparison_data = {
@@ -200,7 +323,7 @@ def page_code():
     bar_data = pd.DataFrame({
         'team allocator': allocation_methods.keys(),
         'terminal ROI': [
-            np.mean(aggregated_pure_comparison_data[allocator].loc[-25:]['Roi'])
+            terminal_mean(aggregated_pure_comparison_data[allocator], 'Roi')
             for allocator in allocation_methods.keys()
         ]
     })
@@ -219,24 +342,10 @@ def page_code():
     ).properties(padding={"left": 5, "top": 30, "right": 5, "bottom": 5})
     col0b.altair_chart(bar_chart, use_container_width=True)
 
-    chart_data = None
-    for allocator in allocation_methods.keys():
-
-        if chart_data is None:
-            chart_data = (
-                aggregated_pure_comparison_data[allocator][['time', 'Roi']]
-                .copy().rename(columns={'Roi': 'value'})
-            )
-            chart_data['variable'] = [allocator for i in range(len(chart_data))]
-
-        else:
-            temp_data = (
-                aggregated_pure_comparison_data[allocator][['time', 'Roi']]
-                .copy().rename(columns={'Roi': 'value'})
-            )
-            temp_data['variable'] = [allocator for i in range(len(temp_data))]
-            chart_data = chart_data.append(temp_data)
-
+    chart_data = cached_chart_data(
+        ('allocation methods', 'Roi') + method_source_key,
+        lambda: time_series_data(aggregated_pure_comparison_data, 'Roi')
+    )
     time_series_plot(
         chart_data, list(allocation_methods.keys()),
         method_colours, "",
@@ -261,7 +370,7 @@ def page_code():
     bar_data = pd.DataFrame({
         'preset': domain,
         'terminal ROI': [
-            np.mean(source_data[preset].loc[-25:]['Roi'])
+            terminal_mean(source_data[preset], 'Roi')
             for preset in domain
         ]
     })
@@ -282,12 +391,10 @@ def page_code():
     bar_data['Load Type'] = [s for s in load_types] * len(domain)
 
     load_column = []
-    for preset, parameters in st.session_state.config.simulation_presets.items():
-        parameter_dict = parameters
-
+    for preset in st.session_state.config.simulation_presets:
         for lt in load_types:
             load_column.append(
-                np.mean(source_data[preset].loc[-25:][lt])
+                terminal_mean(source_data[preset], lt)
             )
 
     bar_data['Load'] = load_column
@@ -308,7 +415,7 @@ def page_code():
     bar_data = pd.DataFrame({
         'preset': domain,
         'AverageWorkerOvr': [
-            np.mean(source_data[preset].loc[-25:]['AverageWorkerOvr'])
+            terminal_mean(source_data[preset], 'AverageWorkerOvr')
             for preset in domain
         ]
     })
@@ -325,7 +432,7 @@ def page_code():
     bar_data = pd.DataFrame({
         'preset': domain,
         'AverageSuccessProbability': [
-            np.mean(source_data[preset].loc[-25:]['AverageSuccessProbability'])
+            terminal_mean(source_data[preset], 'AverageSuccessProbability')
             for preset in domain
         ]
     })
@@ -344,7 +451,6 @@ def page_code():
     col5.subheader("")
 
     all_skill_decays = [0.95, 0.99, 0.995]
-    all_skill_decay_data = {}
 
     bar_data = pd.DataFrame()
     bar_data['preset'] = [p for p in domain for s in all_skill_decays]
@@ -354,35 +460,13 @@ def page_code():
     for preset, parameters in st.session_state.config.simulation_presets.items():
 
         preset_e_flag = True if preset == 'E' else False
-        parameter_dict = parameters
 
         for skill_decay in all_skill_decays:
-
-            df_list = []
-            for rep in range(st.session_state.config.config_params['max_replicates']):
-
-                df_list.append(
-                    load_models(
-                        project_count=parameter_dict['project_count'],
-                        dept_workload=parameter_dict['dept_workload'],
-                        budget_func=parameter_dict['budget_func'],
-                        train_load=parameter_dict['train_load'],
-                        skill_decay=skill_decay,
-                        rep=rep,
-                        team_allocation=parameter_dict['team_allocation'],
-                        load_networks=False,
-                        preset_e=preset_e_flag,
-                        use_preloaded_data=False
-                    )['model_vars']
-                )
-
-            df_concat = pd.concat(df_list)
-            all_skill_decay_data[(preset, skill_decay)] = df_concat.groupby(df_concat.index).mean()
-
             terminal_roi_column.append(
-                np.mean(all_skill_decay_data[(preset, skill_decay)].loc[-25:]['Roi'])
-                if all_skill_decay_data[(preset, skill_decay)] is not None
-                else None
+                load_terminal_mean(
+                    'Roi', max_rep, preset_e=preset_e_flag,
+                    **dict(parameters, skill_decay=skill_decay)
+                )
             )
     bar_data['terminal ROI'] = terminal_roi_column
 
@@ -399,44 +483,22 @@ def page_code():
     col6.subheader("")
 
     all_train_loads = [0.0, 0.1, 0.3, 2.0]
-    all_train_load_data = {}
 
     bar_data = pd.DataFrame()
     bar_data['preset'] = [p for p in domain for s in all_train_loads]
-    bar_data['train_load'] = [s if s != 2.0 else 'boost' for s in all_train_loads] * len(domain)
+    bar_data['train_load'] = [str(s) if s != 2.0 else 'boost' for s in all_train_loads] * len(domain)
 
     terminal_roi_column = []
     for preset, parameters in st.session_state.config.simulation_presets.items():
 
         preset_e_flag = True if preset == 'E' else False
-        parameter_dict = parameters
 
         for train_load in all_train_loads:
-
-            df_list = []
-            for rep in range(st.session_state.config.config_params['max_replicates']):
-                df_list.append(
-                    load_models(
-                        project_count=parameter_dict['project_count'],
-                        dept_workload=parameter_dict['dept_workload'],
-                        budget_func=parameter_dict['budget_func'],
-                        train_load=train_load,
-                        skill_decay=parameter_dict['skill_decay'],
-                        rep=rep,
-                        team_allocation=parameter_dict['team_allocation'],
-                        load_networks=False,
-                        preset_e=preset_e_flag,
-                        use_preloaded_data=False
-                    )['model_vars']
-                )
-
-            df_concat = pd.concat(df_list)
-            all_train_load_data[(preset, train_load)] = df_concat.groupby(df_concat.index).mean()
-
             terminal_roi_column.append(
-                np.mean(all_train_load_data[(preset, train_load)].loc[-25:]['Roi'])
-                if all_train_load_data[(preset, train_load)] is not None
-                else None
+                load_terminal_mean(
+                    'Roi', max_rep, preset_e=preset_e_flag,
+                    **dict(parameters, train_load=train_load)
+                )
             )
     bar_data['terminal ROI'] = terminal_roi_column
 
@@ -450,23 +512,10 @@ def page_code():
 #########################################################################################
 
     st.write("This scatter plot shows how ROI varies with worker OVR across the presets A-E.")
-    chart_data = None
-    for preset in st.session_state.config.simulation_presets:
-
-        if chart_data is None:
-            chart_data = (
-                source_data[preset][['AverageWorkerOvr', 'Roi']]
-                .copy().rename(columns={'Roi': 'ROI'})
-            )
-            chart_data['preset'] = [preset for i in range(len(chart_data))]
-
-        else:
-            temp_data = (
-                source_data[preset][['AverageWorkerOvr', 'Roi']]
-                .copy().rename(columns={'Roi': 'ROI'})
-            )
-            temp_data['preset'] = [preset for i in range(len(temp_data))]
-            chart_data = chart_data.append(temp_data)
+    chart_data = cached_chart_data(
+        ('presets', 'AverageWorkerOvr', 'Roi') + source_key,
+        lambda: long_format(source_data, ['AverageWorkerOvr', 'Roi'], label='preset', rename={'Roi': 'ROI'})
+    )
 
     chart = alt.Chart(chart_data).mark_circle(size=60).encode(
         x=alt.X('AverageWorkerOvr', axis=alt.Axis(title='AverageWorkerOvr'), scale=alt.Scale(domain=[30, 80])),
@@ -489,60 +538,23 @@ def page_code():
     st.subheader("Timeseries plots")
     st.write("The following timeseries plots show how the key metrics (ROI, worker OVR, team OVR) change over the "
              "course of a simulation, and compares this across the presets A-E.")
-    chart_data = None
-    for preset in st.session_state.config.simulation_presets:
-
-        if chart_data is None:
-            chart_data = (
-                source_data[preset][['time', 'Roi']]
-                .copy().rename(columns={'Roi': 'value'})
-            )
-            chart_data['variable'] = [preset for i in range(len(chart_data))]
-
-        else:
-            temp_data = (
-                source_data[preset][['time', 'Roi']]
-                .copy().rename(columns={'Roi': 'value'})
-            )
-            temp_data['variable'] = [preset for i in range(len(temp_data))]
-            chart_data = chart_data.append(temp_data)
-
+    chart_data = cached_chart_data(
+        ('presets', 'Roi') + source_key,
+        lambda: time_series_data(source_data, 'Roi')
+    )
     time_series_plot(chart_data, domain, colours, "ROI Comparison", ylabel="ROI")
 
-    chart_data = None
-    for preset in st.session_state.config.simulation_presets:
-
-        if chart_data is None:
-            chart_data = (
-                source_data[preset][['time', 'AverageWorkerOvr']]
-                .copy().rename(columns={'AverageWorkerOvr': 'value'})
-            )
-            chart_data['variable'] = [preset for i in range(len(chart_data))]
-
-        else:
-            temp_data = (
-                source_data[preset][['time', 'AverageWorkerOvr']]
-                .copy().rename(columns={'AverageWorkerOvr': 'value'})
-            )
-            temp_data['variable'] = [preset for i in range(len(temp_data))]
-            chart_data = chart_data.append(temp_data)
-
+    chart_data = cached_chart_data(
+        ('presets', 'AverageWorkerOvr') + source_key,
+        lambda: time_series_data(source_data, 'AverageWorkerOvr')
+    )
     time_series_plot(chart_data, domain, colours, "Worker OVR Comparison", ylabel="OVR")
 
-    chart_data = None
-    for preset in st.session_state.config.simulation_presets:
-
-        temp_data = (
-            source_data[preset][['time', 'AverageTeamOvr']]
-            .copy().rename(columns={'AverageTeamOvr': 'value'})
+    chart_data = cached_chart_data(
+        ('presets', 'AverageTeamOvr', 'moving average') + source_key,
+        lambda: time_series_data(
+            source_data, 'AverageTeamOvr', transform=lambda values: rolling_mean(values, 10)
         )
-        temp_data['variable'] = [preset for i in range(len(temp_data))]
-        temp_data['value'] = moving_average(temp_data['value'], window_size=10)
-
-        if chart_data is None:
-            chart_data = temp_data
-        else:
-            chart_data = chart_data.append(temp_data)
-
+    )
     time_series_plot(chart_data, domain, colours, "Team OVR Comparison", ylabel="OVR")
 
@@ -0,0 +1,22 @@
+!function(e,t){"object"==typeof exports&&"undefined"!=typeof module?module.exports=t(require("vega"),require("vega-lite")):"function"==typeof define&&define.amd?define(["vega","vega-lite"],t):(e="undefined"!=typeof globalThis?globalThis:e||self).vegaEmbed=t(e.vega,e.vegaLite)}(this,(function(e,t){"use strict";function r(e){if(e&&e.__esModule)return e;var t=Object.create(null);return e&&Object.keys(e).forEach((function(r){if("default"!==r){var n=Object.getOwnPropertyDescriptor(e,r);Object.defineProperty(t,r,n.get?n:{enumerable:!0,get:function(){return e[r]}})}})),t.default=e,Object.freeze(t)}var n,i=r(e),o=r(t),a=(n=function(e,t){return n=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(e,t){e.__proto__=t}||function(e,t){for(var r in t)t.hasOwnProperty(r)&&(e[r]=t[r])},n(e,t)},function(e,t){function r(){this.constructor=e}n(e,t),e.prototype=null===t?Object.create(t):(r.prototype=t.prototype,new r)}),s=Object.prototype.hasOwnProperty;function l(e,t){return s.call(e,t)}function c(e){if(Array.isArray(e)){for(var t=new Array(e.length),r=0;r<t.length;r++)t[r]=""+r;return t}if(Object.keys)return Object.keys(e);t=[];for(var n in e)l(e,n)&&t.push(n);return t}function h(e){switch(typeof e){case"object":return JSON.parse(JSON.stringify(e));case"undefined":return null;default:return e}}function p(e){for(var t,r=0,n=e.length;r<n;){if(!((t=e.charCodeAt(r))>=48&&t<=57))return!1;r++}return!0}function u(e){return-1===e.indexOf("/")&&-1===e.indexOf("~")?e:e.replace(/~/g,"~0").replace(/\//g,"~1")}function f(e){return e.replace(/~1/g,"/").replace(/~0/g,"~")}function d(e){if(void 0===e)return!0;if(e)if(Array.isArray(e)){for(var t=0,r=e.length;t<r;t++)if(d(e[t]))return!0}else if("object"==typeof e){var n=c(e),i=n.length;for(t=0;t<i;t++)if(d(e[n[t]]))return!0}return!1}function m(e,t){var r=[e];for(var n in t){var i="object"==typeof t[n]?JSON.stringify(t[n],null,2):t[n];void 0!==i&&r.push(n+": "+i)}return r.join("\n")}var v=function(e){function t(t,r,n,i,o){var a=this.constructor,s=e.call(this,m(t,{name:r,index:n,operation:i,tree:o}))||this;return s.name=r,s.index=n,s.operation=i,s.tree=o,Object.setPrototypeOf(s,a.prototype),s.message=m(t,{name:r,index:n,operation:i,tree:o}),s}return a(t,e),t}(Error),g=v,E=h,b={add:function(e,t,r){return e[t]=this.value,{newDocument:r}},remove:function(e,t,r){var n=e[t];return delete e[t],{newDocument:r,removed:n}},replace:function(e,t,r){var n=e[t];return e[t]=this.value,{newDocument:r,removed:n}},move:function(e,t,r){var n=w(r,this.path);n&&(n=h(n));var i=O(r,{op:"remove",path:this.from}).removed;return O(r,{op:"add",path:this.path,value:i}),{newDocument:r,removed:n}},copy:function(e,t,r){var n=w(r,this.from);return O(r,{op:"add",path:this.path,value:h(n)}),{newDocument:r}},test:function(e,t,r){return{newDocument:r,test:N(e[t],this.value)}},_get:function(e,t,r){return this.value=e[t],{newDocument:r}}},y={add:function(e,t,r){return p(t)?e.splice(t,0,this.value):e[t]=this.value,{newDocument:r,index:t}},remove:function(e,t,r){return{newDocument:r,removed:e.splice(t,1)[0]}},replace:function(e,t,r){var n=e[t];return e[t]=this.value,{newDocument:r,removed:n}},move:b.move,copy:b.copy,test:b.test,_get:b._get};function w(e,t){if(""==t)return e;var r={op:"_get",path:t};return O(e,r),r.value}function O(e,t,r,n,i,o){if(void 0===r&&(r=!1),void 0===n&&(n=!0),void 0===i&&(i=!0),void 0===o&&(o=0),r&&("function"==typeof r?r(t,0,e,t.path):x(t,0)),""===t.path){var a={newDocument:e};if("add"===t.op)return a.newDocument=t.value,a;if("replace"===t.op)return a.newDocument=t.value,a.removed=e,a;if("move"===t.op||"copy"===t.op)return a.newDocument=w(e,t.from),"move"===t.op&&(a.removed=e),a;if("test"===t.op){if(a.test=N(e,t.value),!1===a.test)throw new g("Test operation failed","TEST_OPERATION_FAILED",o,t,e);return a.newDocument=e,a}if("remove"===t.op)return a.removed=e,a.newDocument=null,a;if("_get"===t.op)return t.value=e,a;if(r)throw new g("Operation `op` property is not one of operations defined in RFC-6902","OPERATION_OP_INVALID",o,t,e);return a}n||(e=h(e));var s=(t.path||"").split("/"),l=e,c=1,u=s.length,d=void 0,m=void 0,v=void 0;for(v="function"==typeof r?r:x;;){if((m=s[c])&&-1!=m.indexOf("~")&&(m=f(m)),i&&"__proto__"==m)throw new TypeError("JSON-Patch: modifying `__proto__` prop is banned for security reasons, if this was on purpose, please set `banPrototypeModifications` flag false and pass it to this function. More info in fast-json-patch README");if(r&&void 0===d&&(void 0===l[m]?d=s.slice(0,c).join("/"):c==u-1&&(d=t.path),void 0!==d&&v(t,0,e,d)),c++,Array.isArray(l)){if("-"===m)m=l.length;else{if(r&&!p(m))throw new g("Expected an unsigned base-10 integer value, making the new referenced value the array element with the zero-based index","OPERATION_PATH_ILLEGAL_ARRAY_INDEX",o,t,e);p(m)&&(m=~~m)}if(c>=u){if(r&&"add"===t.op&&m>l.length)throw new g("The specified index MUST NOT be greater than the number of elements in the array","OPERATION_VALUE_OUT_OF_BOUNDS",o,t,e);if(!1===(a=y[t.op].call(t,l,m,e)).test)throw new g("Test operation failed","TEST_OPERATION_FAILED",o,t,e);return a}}else if(c>=u){if(!1===(a=b[t.op].call(t,l,m,e)).test)throw new g("Test operation failed","TEST_OPERATION_FAILED",o,t,e);return a}if(l=l[m],r&&c<u&&(!l||"object"!=typeof l))throw new g("Cannot perform operation at the desired path","OPERATION_PATH_UNRESOLVABLE",o,t,e)}}function A(e,t,r,n,i){if(void 0===n&&(n=!0),void 0===i&&(i=!0),r&&!Array.isArray(t))throw new g("Patch sequence must be an array","SEQUENCE_NOT_AN_ARRAY");n||(e=h(e));for(var o=new Array(t.length),a=0,s=t.length;a<s;a++)o[a]=O(e,t[a],r,!0,i,a),e=o[a].newDocument;return o.newDocument=e,o}function x(e,t,r,n){if("object"!=typeof e||null===e||Array.isArray(e))throw new g("Operation is not an object","OPERATION_NOT_AN_OBJECT",t,e,r);if(!b[e.op])throw new g("Operation `op` property is not one of operations defined in RFC-6902","OPERATION_OP_INVALID",t,e,r);if("string"!=typeof e.path)throw new g("Operation `path` property is not a string","OPERATION_PATH_INVALID",t,e,r);if(0!==e.path.indexOf("/")&&e.path.length>0)throw new g('Operation `path` property must start with "/"',"OPERATION_PATH_INVALID",t,e,r);if(("move"===e.op||"copy"===e.op)&&"string"!=typeof e.from)throw new g("Operation `from` property is not present (applicable in `move` and `copy` operations)","OPERATION_FROM_REQUIRED",t,e,r);if(("add"===e.op||"replace"===e.op||"test"===e.op)&&void 0===e.value)throw new g("Operation `value` property is not present (applicable in `add`, `replace` and `test` operations)","OPERATION_VALUE_REQUIRED",t,e,r);if(("add"===e.op||"replace"===e.op||"test"===e.op)&&d(e.value))throw new g("Operation `value` property is not present (applicable in `add`, `replace` and `test` operations)","OPERATION_VALUE_CANNOT_CONTAIN_UNDEFINED",t,e,r);if(r)if("add"==e.op){var i=e.path.split("/").length,o=n.split("/").length;if(i!==o+1&&i!==o)throw new g("Cannot perform an `add` operation at the desired path","OPERATION_PATH_CANNOT_ADD",t,e,r)}else if("replace"===e.op||"remove"===e.op||"_get"===e.op){if(e.path!==n)throw new g("Cannot perform the operation at a path that does not exist","OPERATION_PATH_UNRESOLVABLE",t,e,r)}else if("move"===e.op||"copy"===e.op){var a=I([{op:"_get",path:e.from,value:void 0}],r);if(a&&"OPERATION_PATH_UNRESOLVABLE"===a.name)throw new g("Cannot perform the operation from a path that does not exist","OPERATION_FROM_UNRESOLVABLE",t,e,r)}}function I(e,t,r){try{if(!Array.isArray(e))throw new g("Patch sequence must be an array","SEQUENCE_NOT_AN_ARRAY");if(t)A(h(t),h(e),r||!0);else{r=r||x;for(var n=0;n<e.length;n++)r(e[n],n,t,void 0)}}catch(e){if(e instanceof g)return e;throw e}}function N(e,t){if(e===t)return!0;if(e&&t&&"object"==typeof e&&"object"==typeof t){var r,n,i,o=Array.isArray(e),a=Array.isArray(t);if(o&&a){if((n=e.length)!=t.length)return!1;for(r=n;0!=r--;)if(!N(e[r],t[r]))return!1;return!0}if(o!=a)return!1;var s=Object.keys(e);if((n=s.length)!==Object.keys(t).length)return!1;for(r=n;0!=r--;)if(!t.hasOwnProperty(s[r]))return!1;for(r=n;0!=r--;)if(!N(e[i=s[r]],t[i]))return!1;return!0}return e!=e&&t!=t}var R=Object.freeze({__proto__:null,JsonPatchError:g,deepClone:E,getValueByPointer:w,applyOperation:O,applyPatch:A,applyReducer:function(e,t,r){var n=O(e,t);if(!1===n.test)throw new g("Test operation failed","TEST_OPERATION_FAILED",r,t,e);return n.newDocument},validator:x,validate:I,_areEquals:N}),$=new WeakMap,T=function(e){this.observers=new Map,this.obj=e},L=function(e,t){this.callback=e,this.observer=t};
+/*!
+     * https://github.com/Starcounter-Jack/JSON-Patch
+     * (c) 2017 Joachim Wester
+     * MIT license
+     */function S(e,t){void 0===t&&(t=!1);var r=$.get(e.object);C(r.value,e.object,e.patches,"",t),e.patches.length&&A(r.value,e.patches);var n=e.patches;return n.length>0&&(e.patches=[],e.callback&&e.callback(n)),n}function C(e,t,r,n,i){if(t!==e){"function"==typeof t.toJSON&&(t=t.toJSON());for(var o=c(t),a=c(e),s=!1,p=a.length-1;p>=0;p--){var f=e[m=a[p]];if(!l(t,m)||void 0===t[m]&&void 0!==f&&!1===Array.isArray(t))Array.isArray(e)===Array.isArray(t)?(i&&r.push({op:"test",path:n+"/"+u(m),value:h(f)}),r.push({op:"remove",path:n+"/"+u(m)}),s=!0):(i&&r.push({op:"test",path:n,value:e}),r.push({op:"replace",path:n,value:t}));else{var d=t[m];"object"==typeof f&&null!=f&&"object"==typeof d&&null!=d&&Array.isArray(f)===Array.isArray(d)?C(f,d,r,n+"/"+u(m),i):f!==d&&(i&&r.push({op:"test",path:n+"/"+u(m),value:h(f)}),r.push({op:"replace",path:n+"/"+u(m),value:h(d)}))}}if(s||o.length!=a.length)for(p=0;p<o.length;p++){var m;l(e,m=o[p])||void 0===t[m]||r.push({op:"add",path:n+"/"+u(m),value:h(t[m])})}}}var D=Object.freeze({__proto__:null,unobserve:function(e,t){t.unobserve()},observe:function(e,t){var r,n=function(e){return $.get(e)}(e);if(n){var i=function(e,t){return e.observers.get(t)}(n,t);r=i&&i.observer}else n=new T(e),$.set(e,n);if(r)return r;if(r={},n.value=h(e),t){r.callback=t,r.next=null;var o=function(){S(r)},a=function(){clearTimeout(r.next),r.next=setTimeout(o)};"undefined"!=typeof window&&(window.addEventListener("mouseup",a),window.addEventListener("keyup",a),window.addEventListener("mousedown",a),window.addEventListener("keydown",a),window.addEventListener("change",a))}return r.patches=[],r.object=e,r.unobserve=function(){S(r),clearTimeout(r.next),function(e,t){e.observers.delete(t.callback)}(n,r),"undefined"!=typeof window&&(window.removeEventListener("mouseup",a),window.removeEventListener("keyup",a),window.removeEventListener("mousedown",a),window.removeEventListener("keydown",a),window.removeEventListener("change",a))},n.observers.set(t,new L(t,r)),r},generate:S,compare:function(e,t,r){void 0===r&&(r=!1);var n=[];return C(e,t,n,"",r),n}});Object.assign({},R,D,{JsonPatchError:v,deepClone:h,escapePathComponent:u,unescapePathComponent:f});var F=/("(?:[^\\"]|\\.)*")|[:,]/g,k=function(e,t){var r,n,i;return t=t||{},r=JSON.stringify([1],void 0,void 0===t.indent?2:t.indent).slice(2,-3),n=""===r?1/0:void 0===t.maxLength?80:t.maxLength,i=t.replacer,function e(t,o,a){var s,l,c,h,p,u,f,d,m,v,g,E;if(t&&"function"==typeof t.toJSON&&(t=t.toJSON()),void 0===(g=JSON.stringify(t,i)))return g;if(f=n-o.length-a,g.length<=f&&(m=g.replace(F,(function(e,t){return t||e+" "}))).length<=f)return m;if(null!=i&&(t=JSON.parse(g),i=void 0),"object"==typeof t&&null!==t){if(d=o+r,c=[],l=0,Array.isArray(t))for(v="[",s="]",f=t.length;l<f;l++)c.push(e(t[l],d,l===f-1?0:1)||"null");else for(v="{",s="}",f=(u=Object.keys(t)).length;l<f;l++)h=u[l],p=JSON.stringify(h)+": ",void 0!==(E=e(t[h],d,p.length+(l===f-1?0:1)))&&c.push(p+E);if(c.length>0)return[v,r+c.join(",\n"+d),s].join("\n"+o)}return g}(e,"",0)},P={exports:{}};var _={SEMVER_SPEC_VERSION:"2.0.0",MAX_LENGTH:256,MAX_SAFE_INTEGER:Number.MAX_SAFE_INTEGER||9007199254740991,MAX_SAFE_COMPONENT_LENGTH:16};var M="object"==typeof process&&process.env&&process.env.NODE_DEBUG&&/\bsemver\b/i.test(process.env.NODE_DEBUG)?(...e)=>console.error("SEMVER",...e):()=>{};!function(e,t){const{MAX_SAFE_COMPONENT_LENGTH:r}=_,n=M,i=(t=e.exports={}).re=[],o=t.src=[],a=t.t={};let s=0;const l=(e,t,r)=>{const l=s++;n(l,t),a[e]=l,o[l]=t,i[l]=new RegExp(t,r?"g":void 0)};l("NUMERICIDENTIFIER","0|[1-9]\\d*"),l("NUMERICIDENTIFIERLOOSE","[0-9]+"),l("NONNUMERICIDENTIFIER","\\d*[a-zA-Z-][a-zA-Z0-9-]*"),l("MAINVERSION",`(${o[a.NUMERICIDENTIFIER]})\\.(${o[a.NUMERICIDENTIFIER]})\\.(${o[a.NUMERICIDENTIFIER]})`),l("MAINVERSIONLOOSE",`(${o[a.NUMERICIDENTIFIERLOOSE]})\\.(${o[a.NUMERICIDENTIFIERLOOSE]})\\.(${o[a.NUMERICIDENTIFIERLOOSE]})`),l("PRERELEASEIDENTIFIER",`(?:${o[a.NUMERICIDENTIFIER]}|${o[a.NONNUMERICIDENTIFIER]})`),l("PRERELEASEIDENTIFIERLOOSE",`(?:${o[a.NUMERICIDENTIFIERLOOSE]}|${o[a.NONNUMERICIDENTIFIER]})`),l("PRERELEASE",`(?:-(${o[a.PRERELEASEIDENTIFIER]}(?:\\.${o[a.PRERELEASEIDENTIFIER]})*))`),l("PRERELEASELOOSE",`(?:-?(${o[a.PRERELEASEIDENTIFIERLOOSE]}(?:\\.${o[a.PRERELEASEIDENTIFIERLOOSE]})*))`),l("BUILDIDENTIFIER","[0-9A-Za-z-]+"),l("BUILD",`(?:\\+(${o[a.BUILDIDENTIFIER]}(?:\\.${o[a.BUILDIDENTIFIER]})*))`),l("FULLPLAIN",`v?${o[a.MAINVERSION]}${o[a.PRERELEASE]}?${o[a.BUILD]}?`),l("FULL",`^${o[a.FULLPLAIN]}$`),l("LOOSEPLAIN",`[v=\\s]*${o[a.MAINVERSIONLOOSE]}${o[a.PRERELEASELOOSE]}?${o[a.BUILD]}?`),l("LOOSE",`^${o[a.LOOSEPLAIN]}$`),l("GTLT","((?:<|>)?=?)"),l("XRANGEIDENTIFIERLOOSE",`${o[a.NUMERICIDENTIFIERLOOSE]}|x|X|\\*`),l("XRANGEIDENTIFIER",`${o[a.NUMERICIDENTIFIER]}|x|X|\\*`),l("XRANGEPLAIN",`[v=\\s]*(${o[a.XRANGEIDENTIFIER]})(?:\\.(${o[a.XRANGEIDENTIFIER]})(?:\\.(${o[a.XRANGEIDENTIFIER]})(?:${o[a.PRERELEASE]})?${o[a.BUILD]}?)?)?`),l("XRANGEPLAINLOOSE",`[v=\\s]*(${o[a.XRANGEIDENTIFIERLOOSE]})(?:\\.(${o[a.XRANGEIDENTIFIERLOOSE]})(?:\\.(${o[a.XRANGEIDENTIFIERLOOSE]})(?:${o[a.PRERELEASELOOSE]})?${o[a.BUILD]}?)?)?`),l("XRANGE",`^${o[a.GTLT]}\\s*${o[a.XRANGEPLAIN]}$`),l("XRANGELOOSE",`^${o[a.GTLT]}\\s*${o[a.XRANGEPLAINLOOSE]}$`),l("COERCE",`(^|[^\\d])(\\d{1,${r}})(?:\\.(\\d{1,${r}}))?(?:\\.(\\d{1,${r}}))?(?:$|[^\\d])`),l("COERCERTL",o[a.COERCE],!0),l("LONETILDE","(?:~>?)"),l("TILDETRIM",`(\\s*)${o[a.LONETILDE]}\\s+`,!0),t.tildeTrimReplace="$1~",l("TILDE",`^${o[a.LONETILDE]}${o[a.XRANGEPLAIN]}$`),l("TILDELOOSE",`^${o[a.LONETILDE]}${o[a.XRANGEPLAINLOOSE]}$`),l("LONECARET","(?:\\^)"),l("CARETTRIM",`(\\s*)${o[a.LONECARET]}\\s+`,!0),t.caretTrimReplace="$1^",l("CARET",`^${o[a.LONECARET]}${o[a.XRANGEPLAIN]}$`),l("CARETLOOSE",`^${o[a.LONECARET]}${o[a.XRANGEPLAINLOOSE]}$`),l("COMPARATORLOOSE",`^${o[a.GTLT]}\\s*(${o[a.LOOSEPLAIN]})$|^$`),l("COMPARATOR",`^${o[a.GTLT]}\\s*(${o[a.FULLPLAIN]})$|^$`),l("COMPARATORTRIM",`(\\s*)${o[a.GTLT]}\\s*(${o[a.LOOSEPLAIN]}|${o[a.XRANGEPLAIN]})`,!0),t.comparatorTrimReplace="$1$2$3",l("HYPHENRANGE",`^\\s*(${o[a.XRANGEPLAIN]})\\s+-\\s+(${o[a.XRANGEPLAIN]})\\s*$`),l("HYPHENRANGELOOSE",`^\\s*(${o[a.XRANGEPLAINLOOSE]})\\s+-\\s+(${o[a.XRANGEPLAINLOOSE]})\\s*$`),l("STAR","(<|>)?=?\\s*\\*"),l("GTE0","^\\s*>=\\s*0.0.0\\s*$"),l("GTE0PRE","^\\s*>=\\s*0.0.0-0\\s*$")}(P,P.exports);const j=["includePrerelease","loose","rtl"];var z=e=>e?"object"!=typeof e?{loose:!0}:j.filter((t=>e[t])).reduce(((e,t)=>(e[t]=!0,e)),{}):{};const U=/^[0-9]+$/,B=(e,t)=>{const r=U.test(e),n=U.test(t);return r&&n&&(e=+e,t=+t),e===t?0:r&&!n?-1:n&&!r?1:e<t?-1:1};var G={compareIdentifiers:B,rcompareIdentifiers:(e,t)=>B(t,e)};const X=M,{MAX_LENGTH:V,MAX_SAFE_INTEGER:W}=_,{re:H,t:q}=P.exports,Y=z,{compareIdentifiers:J}=G;class Q{constructor(e,t){if(t=Y(t),e instanceof Q){if(e.loose===!!t.loose&&e.includePrerelease===!!t.includePrerelease)return e;e=e.version}else if("string"!=typeof e)throw new TypeError(`Invalid Version: ${e}`);if(e.length>V)throw new TypeError(`version is longer than ${V} characters`);X("SemVer",e,t),this.options=t,this.loose=!!t.loose,this.includePrerelease=!!t.includePrerelease;const r=e.trim().match(t.loose?H[q.LOOSE]:H[q.FULL]);if(!r)throw new TypeError(`Invalid Version: ${e}`);if(this.raw=e,this.major=+r[1],this.minor=+r[2],this.patch=+r[3],this.major>W||this.major<0)throw new TypeError("Invalid major version");if(this.minor>W||this.minor<0)throw new TypeError("Invalid minor version");if(this.patch>W||this.patch<0)throw new TypeError("Invalid patch version");r[4]?this.prerelease=r[4].split(".").map((e=>{if(/^[0-9]+$/.test(e)){const t=+e;if(t>=0&&t<W)return t}return e})):this.prerelease=[],this.build=r[5]?r[5].split("."):[],this.format()}format(){return this.version=`${this.major}.${this.minor}.${this.patch}`,this.prerelease.length&&(this.version+=`-${this.prerelease.join(".")}`),this.version}toString(){return this.version}compare(e){if(X("SemVer.compare",this.version,this.options,e),!(e instanceof Q)){if("string"==typeof e&&e===this.version)return 0;e=new Q(e,this.options)}return e.version===this.version?0:this.compareMain(e)||this.comparePre(e)}compareMain(e){return e instanceof Q||(e=new Q(e,this.options)),J(this.major,e.major)||J(this.minor,e.minor)||J(this.patch,e.patch)}comparePre(e){if(e instanceof Q||(e=new Q(e,this.options)),this.prerelease.length&&!e.prerelease.length)return-1;if(!this.prerelease.length&&e.prerelease.length)return 1;if(!this.prerelease.length&&!e.prerelease.length)return 0;let t=0;do{const r=this.prerelease[t],n=e.prerelease[t];if(X("prerelease compare",t,r,n),void 0===r&&void 0===n)return 0;if(void 0===n)return 1;if(void 0===r)return-1;if(r!==n)return J(r,n)}while(++t)}compareBuild(e){e instanceof Q||(e=new Q(e,this.options));let t=0;do{const r=this.build[t],n=e.build[t];if(X("prerelease compare",t,r,n),void 0===r&&void 0===n)return 0;if(void 0===n)return 1;if(void 0===r)return-1;if(r!==n)return J(r,n)}while(++t)}inc(e,t){switch(e){case"premajor":this.prerelease.length=0,this.patch=0,this.minor=0,this.major++,this.inc("pre",t);break;case"preminor":this.prerelease.length=0,this.patch=0,this.minor++,this.inc("pre",t);break;case"prepatch":this.prerelease.length=0,this.inc("patch",t),this.inc("pre",t);break;case"prerelease":0===this.prerelease.length&&this.inc("patch",t),this.inc("pre",t);break;case"major":0===this.minor&&0===this.patch&&0!==this.prerelease.length||this.major++,this.minor=0,this.patch=0,this.prerelease=[];break;case"minor":0===this.patch&&0!==this.prerelease.length||this.minor++,this.patch=0,this.prerelease=[];break;case"patch":0===this.prerelease.length&&this.patch++,this.prerelease=[];break;case"pre":if(0===this.prerelease.length)this.prerelease=[0];else{let e=this.prerelease.length;for(;--e>=0;)"number"==typeof this.prerelease[e]&&(this.prerelease[e]++,e=-2);-1===e&&this.prerelease.push(0)}t&&(this.prerelease[0]===t?isNaN(this.prerelease[1])&&(this.prerelease=[t,0]):this.prerelease=[t,0]);break;default:throw new Error(`invalid increment argument: ${e}`)}return this.format(),this.raw=this.version,this}}var Z=Q;const{MAX_LENGTH:K}=_,{re:ee,t:te}=P.exports,re=Z,ne=z;var ie=(e,t)=>{if(t=ne(t),e instanceof re)return e;if("string"!=typeof e)return null;if(e.length>K)return null;if(!(t.loose?ee[te.LOOSE]:ee[te.FULL]).test(e))return null;try{return new re(e,t)}catch(e){return null}};const oe=ie;var ae=(e,t)=>{const r=oe(e,t);return r?r.version:null};const se=ie;var le=(e,t)=>{const r=se(e.trim().replace(/^[=v]+/,""),t);return r?r.version:null};const ce=Z;var he=(e,t,r,n)=>{"string"==typeof r&&(n=r,r=void 0);try{return new ce(e,r).inc(t,n).version}catch(e){return null}};const pe=Z;var ue=(e,t,r)=>new pe(e,r).compare(new pe(t,r));const fe=ue;var de=(e,t,r)=>0===fe(e,t,r);const me=ie,ve=de;var ge=(e,t)=>{if(ve(e,t))return null;{const r=me(e),n=me(t),i=r.prerelease.length||n.prerelease.length,o=i?"pre":"",a=i?"prerelease":"";for(const e in r)if(("major"===e||"minor"===e||"patch"===e)&&r[e]!==n[e])return o+e;return a}};const Ee=Z;var be=(e,t)=>new Ee(e,t).major;const ye=Z;var we=(e,t)=>new ye(e,t).minor;const Oe=Z;var Ae=(e,t)=>new Oe(e,t).patch;const xe=ie;var Ie=(e,t)=>{const r=xe(e,t);return r&&r.prerelease.length?r.prerelease:null};const Ne=ue;var Re=(e,t,r)=>Ne(t,e,r);const $e=ue;var Te=(e,t)=>$e(e,t,!0);const Le=Z;var Se=(e,t,r)=>{const n=new Le(e,r),i=new Le(t,r);return n.compare(i)||n.compareBuild(i)};const Ce=Se;var De=(e,t)=>e.sort(((e,r)=>Ce(e,r,t)));const Fe=Se;var ke=(e,t)=>e.sort(((e,r)=>Fe(r,e,t)));const Pe=ue;var _e=(e,t,r)=>Pe(e,t,r)>0;const Me=ue;var je=(e,t,r)=>Me(e,t,r)<0;const ze=ue;var Ue=(e,t,r)=>0!==ze(e,t,r);const Be=ue;var Ge=(e,t,r)=>Be(e,t,r)>=0;const Xe=ue;var Ve=(e,t,r)=>Xe(e,t,r)<=0;const We=de,He=Ue,qe=_e,Ye=Ge,Je=je,Qe=Ve;var Ze=(e,t,r,n)=>{switch(t){case"===":return"object"==typeof e&&(e=e.version),"object"==typeof r&&(r=r.version),e===r;case"!==":return"object"==typeof e&&(e=e.version),"object"==typeof r&&(r=r.version),e!==r;case"":case"=":case"==":return We(e,r,n);case"!=":return He(e,r,n);case">":return qe(e,r,n);case">=":return Ye(e,r,n);case"<":return Je(e,r,n);case"<=":return Qe(e,r,n);default:throw new TypeError(`Invalid operator: ${t}`)}};const Ke=Z,et=ie,{re:tt,t:rt}=P.exports;var nt=(e,t)=>{if(e instanceof Ke)return e;if("number"==typeof e&&(e=String(e)),"string"!=typeof e)return null;let r=null;if((t=t||{}).rtl){let t;for(;(t=tt[rt.COERCERTL].exec(e))&&(!r||r.index+r[0].length!==e.length);)r&&t.index+t[0].length===r.index+r[0].length||(r=t),tt[rt.COERCERTL].lastIndex=t.index+t[1].length+t[2].length;tt[rt.COERCERTL].lastIndex=-1}else r=e.match(tt[rt.COERCE]);return null===r?null:et(`${r[2]}.${r[3]||"0"}.${r[4]||"0"}`,t)},it=ot;function ot(e){var t=this;if(t instanceof ot||(t=new ot),t.tail=null,t.head=null,t.length=0,e&&"function"==typeof e.forEach)e.forEach((function(e){t.push(e)}));else if(arguments.length>0)for(var r=0,n=arguments.length;r<n;r++)t.push(arguments[r]);return t}function at(e,t,r){var n=t===e.head?new ct(r,null,t,e):new ct(r,t,t.next,e);return null===n.next&&(e.tail=n),null===n.prev&&(e.head=n),e.length++,n}function st(e,t){e.tail=new ct(t,e.tail,null,e),e.head||(e.head=e.tail),e.length++}function lt(e,t){e.head=new ct(t,null,e.head,e),e.tail||(e.tail=e.head),e.length++}function ct(e,t,r,n){if(!(this instanceof ct))return new ct(e,t,r,n);this.list=n,this.value=e,t?(t.next=this,this.prev=t):this.prev=null,r?(r.prev=this,this.next=r):this.next=null}ot.Node=ct,ot.create=ot,ot.prototype.removeNode=function(e){if(e.list!==this)throw new Error("removing node which does not belong to this list");var t=e.next,r=e.prev;return t&&(t.prev=r),r&&(r.next=t),e===this.head&&(this.head=t),e===this.tail&&(this.tail=r),e.list.length--,e.next=null,e.prev=null,e.list=null,t},ot.prototype.unshiftNode=function(e){if(e!==this.head){e.list&&e.list.removeNode(e);var t=this.head;e.list=this,e.next=t,t&&(t.prev=e),this.head=e,this.tail||(this.tail=e),this.length++}},ot.prototype.pushNode=function(e){if(e!==this.tail){e.list&&e.list.removeNode(e);var t=this.tail;e.list=this,e.prev=t,t&&(t.next=e),this.tail=e,this.head||(this.head=e),this.length++}},ot.prototype.push=function(){for(var e=0,t=arguments.length;e<t;e++)st(this,arguments[e]);return this.length},ot.prototype.unshift=function(){for(var e=0,t=arguments.length;e<t;e++)lt(this,arguments[e]);return this.length},ot.prototype.pop=function(){if(this.tail){var e=this.tail.value;return this.tail=this.tail.prev,this.tail?this.tail.next=null:this.head=null,this.length--,e}},ot.prototype.shift=function(){if(this.head){var e=this.head.value;return this.head=this.head.next,this.head?this.head.prev=null:this.tail=null,this.length--,e}},ot.prototype.forEach=function(e,t){t=t||this;for(var r=this.head,n=0;null!==r;n++)e.call(t,r.value,n,this),r=r.next},ot.prototype.forEachReverse=function(e,t){t=t||this;for(var r=this.tail,n=this.length-1;null!==r;n--)e.call(t,r.value,n,this),r=r.prev},ot.prototype.get=function(e){for(var t=0,r=this.head;null!==r&&t<e;t++)r=r.next;if(t===e&&null!==r)return r.value},ot.prototype.getReverse=function(e){for(var t=0,r=this.tail;null!==r&&t<e;t++)r=r.prev;if(t===e&&null!==r)return r.value},ot.prototype.map=function(e,t){t=t||this;for(var r=new ot,n=this.head;null!==n;)r.push(e.call(t,n.value,this)),n=n.next;return r},ot.prototype.mapReverse=function(e,t){t=t||this;for(var r=new ot,n=this.tail;null!==n;)r.push(e.call(t,n.value,this)),n=n.prev;return r},ot.prototype.reduce=function(e,t){var r,n=this.head;if(arguments.length>1)r=t;else{if(!this.head)throw new TypeError("Reduce of empty list with no initial value");n=this.head.next,r=this.head.value}for(var i=0;null!==n;i++)r=e(r,n.value,i),n=n.next;return r},ot.prototype.reduceReverse=function(e,t){var r,n=this.tail;if(arguments.length>1)r=t;else{if(!this.tail)throw new TypeError("Reduce of empty list with no initial value");n=this.tail.prev,r=this.tail.value}for(var i=this.length-1;null!==n;i--)r=e(r,n.value,i),n=n.prev;return r},ot.prototype.toArray=function(){for(var e=new Array(this.length),t=0,r=this.head;null!==r;t++)e[t]=r.value,r=r.next;return e},ot.prototype.toArrayReverse=function(){for(var e=new Array(this.length),t=0,r=this.tail;null!==r;t++)e[t]=r.value,r=r.prev;return e},ot.prototype.slice=function(e,t){(t=t||this.length)<0&&(t+=this.length),(e=e||0)<0&&(e+=this.length);var r=new ot;if(t<e||t<0)return r;e<0&&(e=0),t>this.length&&(t=this.length);for(var n=0,i=this.head;null!==i&&n<e;n++)i=i.next;for(;null!==i&&n<t;n++,i=i.next)r.push(i.value);return r},ot.prototype.sliceReverse=function(e,t){(t=t||this.length)<0&&(t+=this.length),(e=e||0)<0&&(e+=this.length);var r=new ot;if(t<e||t<0)return r;e<0&&(e=0),t>this.length&&(t=this.length);for(var n=this.length,i=this.tail;null!==i&&n>t;n--)i=i.prev;for(;null!==i&&n>e;n--,i=i.prev)r.push(i.value);return r},ot.prototype.splice=function(e,t,...r){e>this.length&&(e=this.length-1),e<0&&(e=this.length+e);for(var n=0,i=this.head;null!==i&&n<e;n++)i=i.next;var o=[];for(n=0;i&&n<t;n++)o.push(i.value),i=this.removeNode(i);null===i&&(i=this.tail),i!==this.head&&i!==this.tail&&(i=i.prev);for(n=0;n<r.length;n++)i=at(this,i,r[n]);return o},ot.prototype.reverse=function(){for(var e=this.head,t=this.tail,r=e;null!==r;r=r.prev){var n=r.prev;r.prev=r.next,r.next=n}return this.head=t,this.tail=e,this};try{require("./iterator.js")(ot)}catch(e){}const ht=it,pt=Symbol("max"),ut=Symbol("length"),ft=Symbol("lengthCalculator"),dt=Symbol("allowStale"),mt=Symbol("maxAge"),vt=Symbol("dispose"),gt=Symbol("noDisposeOnSet"),Et=Symbol("lruList"),bt=Symbol("cache"),yt=Symbol("updateAgeOnGet"),wt=()=>1;const Ot=(e,t,r)=>{const n=e[bt].get(t);if(n){const t=n.value;if(At(e,t)){if(It(e,n),!e[dt])return}else r&&(e[yt]&&(n.value.now=Date.now()),e[Et].unshiftNode(n));return t.value}},At=(e,t)=>{if(!t||!t.maxAge&&!e[mt])return!1;const r=Date.now()-t.now;return t.maxAge?r>t.maxAge:e[mt]&&r>e[mt]},xt=e=>{if(e[ut]>e[pt])for(let t=e[Et].tail;e[ut]>e[pt]&&null!==t;){const r=t.prev;It(e,t),t=r}},It=(e,t)=>{if(t){const r=t.value;e[vt]&&e[vt](r.key,r.value),e[ut]-=r.length,e[bt].delete(r.key),e[Et].removeNode(t)}};class Nt{constructor(e,t,r,n,i){this.key=e,this.value=t,this.length=r,this.now=n,this.maxAge=i||0}}const Rt=(e,t,r,n)=>{let i=r.value;At(e,i)&&(It(e,r),e[dt]||(i=void 0)),i&&t.call(n,i.value,i.key,e)};var $t=class{constructor(e){if("number"==typeof e&&(e={max:e}),e||(e={}),e.max&&("number"!=typeof e.max||e.max<0))throw new TypeError("max must be a non-negative number");this[pt]=e.max||1/0;const t=e.length||wt;if(this[ft]="function"!=typeof t?wt:t,this[dt]=e.stale||!1,e.maxAge&&"number"!=typeof e.maxAge)throw new TypeError("maxAge must be a number");this[mt]=e.maxAge||0,this[vt]=e.dispose,this[gt]=e.noDisposeOnSet||!1,this[yt]=e.updateAgeOnGet||!1,this.reset()}set max(e){if("number"!=typeof e||e<0)throw new TypeError("max must be a non-negative number");this[pt]=e||1/0,xt(this)}get max(){return this[pt]}set allowStale(e){this[dt]=!!e}get allowStale(){return this[dt]}set maxAge(e){if("number"!=typeof e)throw new TypeError("maxAge must be a non-negative number");this[mt]=e,xt(this)}get maxAge(){return this[mt]}set lengthCalculator(e){"function"!=typeof e&&(e=wt),e!==this[ft]&&(this[ft]=e,this[ut]=0,this[Et].forEach((e=>{e.length=this[ft](e.value,e.key),this[ut]+=e.length}))),xt(this)}get lengthCalculator(){return this[ft]}get length(){return this[ut]}get itemCount(){return this[Et].length}rforEach(e,t){t=t||this;for(let r=this[Et].tail;null!==r;){const n=r.prev;Rt(this,e,r,t),r=n}}forEach(e,t){t=t||this;for(let r=this[Et].head;null!==r;){const n=r.next;Rt(this,e,r,t),r=n}}keys(){return this[Et].toArray().map((e=>e.key))}values(){return this[Et].toArray().map((e=>e.value))}reset(){this[vt]&&this[Et]&&this[Et].length&&this[Et].forEach((e=>this[vt](e.key,e.value))),this[bt]=new Map,this[Et]=new ht,this[ut]=0}dump(){return this[Et].map((e=>!At(this,e)&&{k:e.key,v:e.value,e:e.now+(e.maxAge||0)})).toArray().filter((e=>e))}dumpLru(){return this[Et]}set(e,t,r){if((r=r||this[mt])&&"number"!=typeof r)throw new TypeError("maxAge must be a number");const n=r?Date.now():0,i=this[ft](t,e);if(this[bt].has(e)){if(i>this[pt])return It(this,this[bt].get(e)),!1;const o=this[bt].get(e).value;return this[vt]&&(this[gt]||this[vt](e,o.value)),o.now=n,o.maxAge=r,o.value=t,this[ut]+=i-o.length,o.length=i,this.get(e),xt(this),!0}const o=new Nt(e,t,i,n,r);return o.length>this[pt]?(this[vt]&&this[vt](e,t),!1):(this[ut]+=o.length,this[Et].unshift(o),this[bt].set(e,this[Et].head),xt(this),!0)}has(e){if(!this[bt].has(e))return!1;const t=this[bt].get(e).value;return!At(this,t)}get(e){return Ot(this,e,!0)}peek(e){return Ot(this,e,!1)}pop(){const e=this[Et].tail;return e?(It(this,e),e.value):null}del(e){It(this,this[bt].get(e))}load(e){this.reset();const t=Date.now();for(let r=e.length-1;r>=0;r--){const n=e[r],i=n.e||0;if(0===i)this.set(n.k,n.v);else{const e=i-t;e>0&&this.set(n.k,n.v,e)}}}prune(){this[bt].forEach(((e,t)=>Ot(this,t,!1)))}};class Tt{constructor(e,t){if(t=Ct(t),e instanceof Tt)return e.loose===!!t.loose&&e.includePrerelease===!!t.includePrerelease?e:new Tt(e.raw,t);if(e instanceof Dt)return this.raw=e.value,this.set=[[e]],this.format(),this;if(this.options=t,this.loose=!!t.loose,this.includePrerelease=!!t.includePrerelease,this.raw=e,this.set=e.split(/\s*\|\|\s*/).map((e=>this.parseRange(e.trim()))).filter((e=>e.length)),!this.set.length)throw new TypeError(`Invalid SemVer Range: ${e}`);if(this.set.length>1){const e=this.set[0];if(this.set=this.set.filter((e=>!Ut(e[0]))),0===this.set.length)this.set=[e];else if(this.set.length>1)for(const e of this.set)if(1===e.length&&Bt(e[0])){this.set=[e];break}}this.format()}format(){return this.range=this.set.map((e=>e.join(" ").trim())).join("||").trim(),this.range}toString(){return this.range}parseRange(e){e=e.trim();const t=`parseRange:${Object.keys(this.options).join(",")}:${e}`,r=St.get(t);if(r)return r;const n=this.options.loose,i=n?Pt[_t.HYPHENRANGELOOSE]:Pt[_t.HYPHENRANGE];e=e.replace(i,er(this.options.includePrerelease)),Ft("hyphen replace",e),e=e.replace(Pt[_t.COMPARATORTRIM],Mt),Ft("comparator trim",e,Pt[_t.COMPARATORTRIM]),e=(e=(e=e.replace(Pt[_t.TILDETRIM],jt)).replace(Pt[_t.CARETTRIM],zt)).split(/\s+/).join(" ");const o=n?Pt[_t.COMPARATORLOOSE]:Pt[_t.COMPARATOR],a=e.split(" ").map((e=>Xt(e,this.options))).join(" ").split(/\s+/).map((e=>Kt(e,this.options))).filter(this.options.loose?e=>!!e.match(o):()=>!0).map((e=>new Dt(e,this.options)));a.length;const s=new Map;for(const e of a){if(Ut(e))return[e];s.set(e.value,e)}s.size>1&&s.has("")&&s.delete("");const l=[...s.values()];return St.set(t,l),l}intersects(e,t){if(!(e instanceof Tt))throw new TypeError("a Range is required");return this.set.some((r=>Gt(r,t)&&e.set.some((e=>Gt(e,t)&&r.every((r=>e.every((e=>r.intersects(e,t)))))))))}test(e){if(!e)return!1;if("string"==typeof e)try{e=new kt(e,this.options)}catch(e){return!1}for(let t=0;t<this.set.length;t++)if(tr(this.set[t],e,this.options))return!0;return!1}}var Lt=Tt;const St=new $t({max:1e3}),Ct=z,Dt=ir,Ft=M,kt=Z,{re:Pt,t:_t,comparatorTrimReplace:Mt,tildeTrimReplace:jt,caretTrimReplace:zt}=P.exports,Ut=e=>"<0.0.0-0"===e.value,Bt=e=>""===e.value,Gt=(e,t)=>{let r=!0;const n=e.slice();let i=n.pop();for(;r&&n.length;)r=n.every((e=>i.intersects(e,t))),i=n.pop();return r},Xt=(e,t)=>(Ft("comp",e,t),e=qt(e,t),Ft("caret",e),e=Wt(e,t),Ft("tildes",e),e=Jt(e,t),Ft("xrange",e),e=Zt(e,t),Ft("stars",e),e),Vt=e=>!e||"x"===e.toLowerCase()||"*"===e,Wt=(e,t)=>e.trim().split(/\s+/).map((e=>Ht(e,t))).join(" "),Ht=(e,t)=>{const r=t.loose?Pt[_t.TILDELOOSE]:Pt[_t.TILDE];return e.replace(r,((t,r,n,i,o)=>{let a;return Ft("tilde",e,t,r,n,i,o),Vt(r)?a="":Vt(n)?a=`>=${r}.0.0 <${+r+1}.0.0-0`:Vt(i)?a=`>=${r}.${n}.0 <${r}.${+n+1}.0-0`:o?(Ft("replaceTilde pr",o),a=`>=${r}.${n}.${i}-${o} <${r}.${+n+1}.0-0`):a=`>=${r}.${n}.${i} <${r}.${+n+1}.0-0`,Ft("tilde return",a),a}))},qt=(e,t)=>e.trim().split(/\s+/).map((e=>Yt(e,t))).join(" "),Yt=(e,t)=>{Ft("caret",e,t);const r=t.loose?Pt[_t.CARETLOOSE]:Pt[_t.CARET],n=t.includePrerelease?"-0":"";return e.replace(r,((t,r,i,o,a)=>{let s;return Ft("caret",e,t,r,i,o,a),Vt(r)?s="":Vt(i)?s=`>=${r}.0.0${n} <${+r+1}.0.0-0`:Vt(o)?s="0"===r?`>=${r}.${i}.0${n} <${r}.${+i+1}.0-0`:`>=${r}.${i}.0${n} <${+r+1}.0.0-0`:a?(Ft("replaceCaret pr",a),s="0"===r?"0"===i?`>=${r}.${i}.${o}-${a} <${r}.${i}.${+o+1}-0`:`>=${r}.${i}.${o}-${a} <${r}.${+i+1}.0-0`:`>=${r}.${i}.${o}-${a} <${+r+1}.0.0-0`):(Ft("no pr"),s="0"===r?"0"===i?`>=${r}.${i}.${o}${n} <${r}.${i}.${+o+1}-0`:`>=${r}.${i}.${o}${n} <${r}.${+i+1}.0-0`:`>=${r}.${i}.${o} <${+r+1}.0.0-0`),Ft("caret return",s),s}))},Jt=(e,t)=>(Ft("replaceXRanges",e,t),e.split(/\s+/).map((e=>Qt(e,t))).join(" ")),Qt=(e,t)=>{e=e.trim();const r=t.loose?Pt[_t.XRANGELOOSE]:Pt[_t.XRANGE];return e.replace(r,((r,n,i,o,a,s)=>{Ft("xRange",e,r,n,i,o,a,s);const l=Vt(i),c=l||Vt(o),h=c||Vt(a),p=h;return"="===n&&p&&(n=""),s=t.includePrerelease?"-0":"",l?r=">"===n||"<"===n?"<0.0.0-0":"*":n&&p?(c&&(o=0),a=0,">"===n?(n=">=",c?(i=+i+1,o=0,a=0):(o=+o+1,a=0)):"<="===n&&(n="<",c?i=+i+1:o=+o+1),"<"===n&&(s="-0"),r=`${n+i}.${o}.${a}${s}`):c?r=`>=${i}.0.0${s} <${+i+1}.0.0-0`:h&&(r=`>=${i}.${o}.0${s} <${i}.${+o+1}.0-0`),Ft("xRange return",r),r}))},Zt=(e,t)=>(Ft("replaceStars",e,t),e.trim().replace(Pt[_t.STAR],"")),Kt=(e,t)=>(Ft("replaceGTE0",e,t),e.trim().replace(Pt[t.includePrerelease?_t.GTE0PRE:_t.GTE0],"")),er=e=>(t,r,n,i,o,a,s,l,c,h,p,u,f)=>`${r=Vt(n)?"":Vt(i)?`>=${n}.0.0${e?"-0":""}`:Vt(o)?`>=${n}.${i}.0${e?"-0":""}`:a?`>=${r}`:`>=${r}${e?"-0":""}`} ${l=Vt(c)?"":Vt(h)?`<${+c+1}.0.0-0`:Vt(p)?`<${c}.${+h+1}.0-0`:u?`<=${c}.${h}.${p}-${u}`:e?`<${c}.${h}.${+p+1}-0`:`<=${l}`}`.trim(),tr=(e,t,r)=>{for(let r=0;r<e.length;r++)if(!e[r].test(t))return!1;if(t.prerelease.length&&!r.includePrerelease){for(let r=0;r<e.length;r++)if(Ft(e[r].semver),e[r].semver!==Dt.ANY&&e[r].semver.prerelease.length>0){const n=e[r].semver;if(n.major===t.major&&n.minor===t.minor&&n.patch===t.patch)return!0}return!1}return!0},rr=Symbol("SemVer ANY");class nr{static get ANY(){return rr}constructor(e,t){if(t=or(t),e instanceof nr){if(e.loose===!!t.loose)return e;e=e.value}cr("comparator",e,t),this.options=t,this.loose=!!t.loose,this.parse(e),this.semver===rr?this.value="":this.value=this.operator+this.semver.version,cr("comp",this)}parse(e){const t=this.options.loose?ar[sr.COMPARATORLOOSE]:ar[sr.COMPARATOR],r=e.match(t);if(!r)throw new TypeError(`Invalid comparator: ${e}`);this.operator=void 0!==r[1]?r[1]:"","="===this.operator&&(this.operator=""),r[2]?this.semver=new hr(r[2],this.options.loose):this.semver=rr}toString(){return this.value}test(e){if(cr("Comparator.test",e,this.options.loose),this.semver===rr||e===rr)return!0;if("string"==typeof e)try{e=new hr(e,this.options)}catch(e){return!1}return lr(e,this.operator,this.semver,this.options)}intersects(e,t){if(!(e instanceof nr))throw new TypeError("a Comparator is required");if(t&&"object"==typeof t||(t={loose:!!t,includePrerelease:!1}),""===this.operator)return""===this.value||new pr(e.value,t).test(this.value);if(""===e.operator)return""===e.value||new pr(this.value,t).test(e.semver);const r=!(">="!==this.operator&&">"!==this.operator||">="!==e.operator&&">"!==e.operator),n=!("<="!==this.operator&&"<"!==this.operator||"<="!==e.operator&&"<"!==e.operator),i=this.semver.version===e.semver.version,o=!(">="!==this.operator&&"<="!==this.operator||">="!==e.operator&&"<="!==e.operator),a=lr(this.semver,"<",e.semver,t)&&(">="===this.operator||">"===this.operator)&&("<="===e.operator||"<"===e.operator),s=lr(this.semver,">",e.semver,t)&&("<="===this.operator||"<"===this.operator)&&(">="===e.operator||">"===e.operator);return r||n||i&&o||a||s}}var ir=nr;const or=z,{re:ar,t:sr}=P.exports,lr=Ze,cr=M,hr=Z,pr=Lt,ur=Lt;var fr=(e,t,r)=>{try{t=new ur(t,r)}catch(e){return!1}return t.test(e)};const dr=Lt;var mr=(e,t)=>new dr(e,t).set.map((e=>e.map((e=>e.value)).join(" ").trim().split(" ")));const vr=Z,gr=Lt;var Er=(e,t,r)=>{let n=null,i=null,o=null;try{o=new gr(t,r)}catch(e){return null}return e.forEach((e=>{o.test(e)&&(n&&-1!==i.compare(e)||(n=e,i=new vr(n,r)))})),n};const br=Z,yr=Lt;var wr=(e,t,r)=>{let n=null,i=null,o=null;try{o=new yr(t,r)}catch(e){return null}return e.forEach((e=>{o.test(e)&&(n&&1!==i.compare(e)||(n=e,i=new br(n,r)))})),n};const Or=Z,Ar=Lt,xr=_e;var Ir=(e,t)=>{e=new Ar(e,t);let r=new Or("0.0.0");if(e.test(r))return r;if(r=new Or("0.0.0-0"),e.test(r))return r;r=null;for(let t=0;t<e.set.length;++t){const n=e.set[t];let i=null;n.forEach((e=>{const t=new Or(e.semver.version);switch(e.operator){case">":0===t.prerelease.length?t.patch++:t.prerelease.push(0),t.raw=t.format();case"":case">=":i&&!xr(t,i)||(i=t);break;case"<":case"<=":break;default:throw new Error(`Unexpected operation: ${e.operator}`)}})),!i||r&&!xr(r,i)||(r=i)}return r&&e.test(r)?r:null};const Nr=Lt;var Rr=(e,t)=>{try{return new Nr(e,t).range||"*"}catch(e){return null}};const $r=Z,Tr=ir,{ANY:Lr}=Tr,Sr=Lt,Cr=fr,Dr=_e,Fr=je,kr=Ve,Pr=Ge;var _r=(e,t,r,n)=>{let i,o,a,s,l;switch(e=new $r(e,n),t=new Sr(t,n),r){case">":i=Dr,o=kr,a=Fr,s=">",l=">=";break;case"<":i=Fr,o=Pr,a=Dr,s="<",l="<=";break;default:throw new TypeError('Must provide a hilo val of "<" or ">"')}if(Cr(e,t,n))return!1;for(let r=0;r<t.set.length;++r){const c=t.set[r];let h=null,p=null;if(c.forEach((e=>{e.semver===Lr&&(e=new Tr(">=0.0.0")),h=h||e,p=p||e,i(e.semver,h.semver,n)?h=e:a(e.semver,p.semver,n)&&(p=e)})),h.operator===s||h.operator===l)return!1;if((!p.operator||p.operator===s)&&o(e,p.semver))return!1;if(p.operator===l&&a(e,p.semver))return!1}return!0};const Mr=_r;var jr=(e,t,r)=>Mr(e,t,">",r);const zr=_r;var Ur=(e,t,r)=>zr(e,t,"<",r);const Br=Lt;var Gr=(e,t,r)=>(e=new Br(e,r),t=new Br(t,r),e.intersects(t));const Xr=fr,Vr=ue;const Wr=Lt,Hr=ir,{ANY:qr}=Hr,Yr=fr,Jr=ue,Qr=(e,t,r)=>{if(e===t)return!0;if(1===e.length&&e[0].semver===qr){if(1===t.length&&t[0].semver===qr)return!0;e=r.includePrerelease?[new Hr(">=0.0.0-0")]:[new Hr(">=0.0.0")]}if(1===t.length&&t[0].semver===qr){if(r.includePrerelease)return!0;t=[new Hr(">=0.0.0")]}const n=new Set;let i,o,a,s,l,c,h;for(const t of e)">"===t.operator||">="===t.operator?i=Zr(i,t,r):"<"===t.operator||"<="===t.operator?o=Kr(o,t,r):n.add(t.semver);if(n.size>1)return null;if(i&&o){if(a=Jr(i.semver,o.semver,r),a>0)return null;if(0===a&&(">="!==i.operator||"<="!==o.operator))return null}for(const e of n){if(i&&!Yr(e,String(i),r))return null;if(o&&!Yr(e,String(o),r))return null;for(const n of t)if(!Yr(e,String(n),r))return!1;return!0}let p=!(!o||r.includePrerelease||!o.semver.prerelease.length)&&o.semver,u=!(!i||r.includePrerelease||!i.semver.prerelease.length)&&i.semver;p&&1===p.prerelease.length&&"<"===o.operator&&0===p.prerelease[0]&&(p=!1);for(const e of t){if(h=h||">"===e.operator||">="===e.operator,c=c||"<"===e.operator||"<="===e.operator,i)if(u&&e.semver.prerelease&&e.semver.prerelease.length&&e.semver.major===u.major&&e.semver.minor===u.minor&&e.semver.patch===u.patch&&(u=!1),">"===e.operator||">="===e.operator){if(s=Zr(i,e,r),s===e&&s!==i)return!1}else if(">="===i.operator&&!Yr(i.semver,String(e),r))return!1;if(o)if(p&&e.semver.prerelease&&e.semver.prerelease.length&&e.semver.major===p.major&&e.semver.minor===p.minor&&e.semver.patch===p.patch&&(p=!1),"<"===e.operator||"<="===e.operator){if(l=Kr(o,e,r),l===e&&l!==o)return!1}else if("<="===o.operator&&!Yr(o.semver,String(e),r))return!1;if(!e.operator&&(o||i)&&0!==a)return!1}return!(i&&c&&!o&&0!==a)&&(!(o&&h&&!i&&0!==a)&&(!u&&!p))},Zr=(e,t,r)=>{if(!e)return t;const n=Jr(e.semver,t.semver,r);return n>0?e:n<0||">"===t.operator&&">="===e.operator?t:e},Kr=(e,t,r)=>{if(!e)return t;const n=Jr(e.semver,t.semver,r);return n<0?e:n>0||"<"===t.operator&&"<="===e.operator?t:e};var en=(e,t,r={})=>{if(e===t)return!0;e=new Wr(e,r),t=new Wr(t,r);let n=!1;e:for(const i of e.set){for(const e of t.set){const t=Qr(i,e,r);if(n=n||null!==t,t)continue e}if(n)return!1}return!0};const tn=P.exports;var rn={re:tn.re,src:tn.src,tokens:tn.t,SEMVER_SPEC_VERSION:_.SEMVER_SPEC_VERSION,SemVer:Z,compareIdentifiers:G.compareIdentifiers,rcompareIdentifiers:G.rcompareIdentifiers,parse:ie,valid:ae,clean:le,inc:he,diff:ge,major:be,minor:we,patch:Ae,prerelease:Ie,compare:ue,rcompare:Re,compareLoose:Te,compareBuild:Se,sort:De,rsort:ke,gt:_e,lt:je,eq:de,neq:Ue,gte:Ge,lte:Ve,cmp:Ze,coerce:nt,Comparator:ir,Range:Lt,satisfies:fr,toComparators:mr,maxSatisfying:Er,minSatisfying:wr,minVersion:Ir,validRange:Rr,outside:_r,gtr:jr,ltr:Ur,intersects:Gr,simplifyRange:(e,t,r)=>{const n=[];let i=null,o=null;const a=e.sort(((e,t)=>Vr(e,t,r)));for(const e of a){Xr(e,t,r)?(o=e,i||(i=e)):(o&&n.push([i,o]),o=null,i=null)}i&&n.push([i,null]);const s=[];for(const[e,t]of n)e===t?s.push(e):t||e!==a[0]?t?e===a[0]?s.push(`<=${t}`):s.push(`${e} - ${t}`):s.push(`>=${e}`):s.push("*");const l=s.join(" || "),c="string"==typeof t.raw?t.raw:String(t);return l.length<c.length?l:t},subset:en};var nn={NaN:NaN,E:Math.E,LN2:Math.LN2,LN10:Math.LN10,LOG2E:Math.LOG2E,LOG10E:Math.LOG10E,PI:Math.PI,SQRT1_2:Math.SQRT1_2,SQRT2:Math.SQRT2,MIN_VALUE:Number.MIN_VALUE,MAX_VALUE:Number.MAX_VALUE},on={"*":(e,t)=>e*t,"+":(e,t)=>e+t,"-":(e,t)=>e-t,"/":(e,t)=>e/t,"%":(e,t)=>e%t,">":(e,t)=>e>t,"<":(e,t)=>e<t,"<=":(e,t)=>e<=t,">=":(e,t)=>e>=t,"==":(e,t)=>e==t,"!=":(e,t)=>e!=t,"===":(e,t)=>e===t,"!==":(e,t)=>e!==t,"&":(e,t)=>e&t,"|":(e,t)=>e|t,"^":(e,t)=>e^t,"<<":(e,t)=>e<<t,">>":(e,t)=>e>>t,">>>":(e,t)=>e>>>t},an={"+":e=>+e,"-":e=>-e,"~":e=>~e,"!":e=>!e};const sn=Array.prototype.slice,ln=(e,t,r)=>{const n=r?r(t[0]):t[0];return n[e].apply(n,sn.call(t,1))};var cn={isNaN:Number.isNaN,isFinite:Number.isFinite,abs:Math.abs,acos:Math.acos,asin:Math.asin,atan:Math.atan,atan2:Math.atan2,ceil:Math.ceil,cos:Math.cos,exp:Math.exp,floor:Math.floor,log:Math.log,max:Math.max,min:Math.min,pow:Math.pow,random:Math.random,round:Math.round,sin:Math.sin,sqrt:Math.sqrt,tan:Math.tan,clamp:(e,t,r)=>Math.max(t,Math.min(r,e)),now:Date.now,utc:Date.UTC,datetime:(e,t,r,n,i,o,a)=>new Date(e,t||0,null!=r?r:1,n||0,i||0,o||0,a||0),date:e=>new Date(e).getDate(),day:e=>new Date(e).getDay(),year:e=>new Date(e).getFullYear(),month:e=>new Date(e).getMonth(),hours:e=>new Date(e).getHours(),minutes:e=>new Date(e).getMinutes(),seconds:e=>new Date(e).getSeconds(),milliseconds:e=>new Date(e).getMilliseconds(),time:e=>new Date(e).getTime(),timezoneoffset:e=>new Date(e).getTimezoneOffset(),utcdate:e=>new Date(e).getUTCDate(),utcday:e=>new Date(e).getUTCDay(),utcyear:e=>new Date(e).getUTCFullYear(),utcmonth:e=>new Date(e).getUTCMonth(),utchours:e=>new Date(e).getUTCHours(),utcminutes:e=>new Date(e).getUTCMinutes(),utcseconds:e=>new Date(e).getUTCSeconds(),utcmilliseconds:e=>new Date(e).getUTCMilliseconds(),length:e=>e.length,join:function(){return ln("join",arguments)},indexof:function(){return ln("indexOf",arguments)},lastindexof:function(){return ln("lastIndexOf",arguments)},slice:function(){return ln("slice",arguments)},reverse:e=>e.slice().reverse(),parseFloat:parseFloat,parseInt:parseInt,upper:e=>String(e).toUpperCase(),lower:e=>String(e).toLowerCase(),substring:function(){return ln("substring",arguments,String)},split:function(){return ln("split",arguments,String)},replace:function(){return ln("replace",arguments,String)},trim:e=>String(e).trim(),regexp:RegExp,test:(e,t)=>RegExp(e).test(t)};const hn=["view","item","group","xy","x","y"],pn={Literal:(e,t)=>t.value,Identifier:(e,t)=>{const r=t.name;return e.memberDepth>0?r:"datum"===r?e.datum:"event"===r?e.event:"item"===r?e.item:nn[r]||e.params["$"+r]},MemberExpression:(e,t)=>{const r=!t.computed,n=e(t.object);r&&(e.memberDepth+=1);const i=e(t.property);return r&&(e.memberDepth-=1),n[i]},CallExpression:(e,t)=>{const r=t.arguments;let n=t.callee.name;return n.startsWith("_")&&(n=n.slice(1)),"if"===n?e(r[0])?e(r[1]):e(r[2]):(e.fn[n]||cn[n]).apply(e.fn,r.map(e))},ArrayExpression:(e,t)=>t.elements.map(e),BinaryExpression:(e,t)=>on[t.operator](e(t.left),e(t.right)),UnaryExpression:(e,t)=>an[t.operator](e(t.argument)),ConditionalExpression:(e,t)=>e(t.test)?e(t.consequent):e(t.alternate),LogicalExpression:(e,t)=>"&&"===t.operator?e(t.left)&&e(t.right):e(t.left)||e(t.right),ObjectExpression:(e,t)=>t.properties.reduce(((t,r)=>{e.memberDepth+=1;const n=e(r.key);return e.memberDepth-=1,t[n]=e(r.value),t}),{})};function un(e,t,r,n,i,o){const a=e=>pn[e.type](a,e);return a.memberDepth=0,a.fn=Object.create(t),a.params=r,a.datum=n,a.event=i,a.item=o,hn.forEach((e=>a.fn[e]=(...t)=>i.vega[e](...t))),a(e)}var fn={operator(e,t){const r=t.ast,n=e.functions;return e=>un(r,n,e)},parameter(e,t){const r=t.ast,n=e.functions;return(e,t)=>un(r,n,t,e)},event(e,t){const r=t.ast,n=e.functions;return e=>un(r,n,void 0,void 0,e)},handler(e,t){const r=t.ast,n=e.functions;return(e,t)=>{const i=t.item&&t.item.datum;return un(r,n,e,i,t)}},encode(e,t){const{marktype:r,channels:n}=t,i=e.functions,o="group"===r||"image"===r||"rect"===r;return(e,t)=>{const a=e.datum;let s,l=0;for(const r in n)s=un(n[r].ast,i,t,a,void 0,e),e[r]!==s&&(e[r]=s,l=1);return"rule"!==r&&function(e,t,r){let n;t.x2&&(t.x?(r&&e.x>e.x2&&(n=e.x,e.x=e.x2,e.x2=n),e.width=e.x2-e.x):e.x=e.x2-(e.width||0)),t.xc&&(e.x=e.xc-(e.width||0)/2),t.y2&&(t.y?(r&&e.y>e.y2&&(n=e.y,e.y=e.y2,e.y2=n),e.height=e.y2-e.y):e.y=e.y2-(e.height||0)),t.yc&&(e.y=e.yc-(e.height||0)/2)}(e,n,o),l}}};function dn(e){const[t,r]=/schema\/([\w-]+)\/([\w\.\-]+)\.json$/g.exec(e).slice(1,3);return{library:t,version:r}}const mn="#fff",vn={background:"#333",title:{color:mn,subtitleColor:mn},style:{"guide-label":{fill:mn},"guide-title":{fill:mn}},axis:{domainColor:mn,gridColor:"#888",tickColor:mn}},gn="#4572a7",En={background:"#fff",arc:{fill:gn},area:{fill:gn},line:{stroke:gn,strokeWidth:2},path:{stroke:gn},rect:{fill:gn},shape:{stroke:gn},symbol:{fill:gn,strokeWidth:1.5,size:50},axis:{bandPosition:.5,grid:!0,gridColor:"#000000",gridOpacity:1,gridWidth:.5,labelPadding:10,tickSize:5,tickWidth:.5},axisBand:{grid:!1,tickExtra:!0},legend:{labelBaseline:"middle",labelFontSize:11,symbolSize:50,symbolType:"square"},range:{category:["#4572a7","#aa4643","#8aa453","#71598e","#4598ae","#d98445","#94aace","#d09393","#b9cc98","#a99cbc"]}},bn="#30a2da",yn="#cbcbcb",wn="#f0f0f0",On="#333",An={arc:{fill:bn},area:{fill:bn},axis:{domainColor:yn,grid:!0,gridColor:yn,gridWidth:1,labelColor:"#999",labelFontSize:10,titleColor:"#333",tickColor:yn,tickSize:10,titleFontSize:14,titlePadding:10,labelPadding:4},axisBand:{grid:!1},background:wn,group:{fill:wn},legend:{labelColor:On,labelFontSize:11,padding:1,symbolSize:30,symbolType:"square",titleColor:On,titleFontSize:14,titlePadding:10},line:{stroke:bn,strokeWidth:2},path:{stroke:bn,strokeWidth:.5},rect:{fill:bn},range:{category:["#30a2da","#fc4f30","#e5ae38","#6d904f","#8b8b8b","#b96db8","#ff9e27","#56cc60","#52d2ca","#52689e","#545454","#9fe4f8"],diverging:["#cc0020","#e77866","#f6e7e1","#d6e8ed","#91bfd9","#1d78b5"],heatmap:["#d6e8ed","#cee0e5","#91bfd9","#549cc6","#1d78b5"]},point:{filled:!0,shape:"circle"},shape:{stroke:bn},bar:{binSpacing:2,fill:bn,stroke:null},title:{anchor:"start",fontSize:24,fontWeight:600,offset:20}},xn="#000",In={group:{fill:"#e5e5e5"},arc:{fill:xn},area:{fill:xn},line:{stroke:xn},path:{stroke:xn},rect:{fill:xn},shape:{stroke:xn},symbol:{fill:xn,size:40},axis:{domain:!1,grid:!0,gridColor:"#FFFFFF",gridOpacity:1,labelColor:"#7F7F7F",labelPadding:4,tickColor:"#7F7F7F",tickSize:5.67,titleFontSize:16,titleFontWeight:"normal"},legend:{labelBaseline:"middle",labelFontSize:11,symbolSize:40},range:{category:["#000000","#7F7F7F","#1A1A1A","#999999","#333333","#B0B0B0","#4D4D4D","#C9C9C9","#666666","#DCDCDC"]}},Nn="Benton Gothic, sans-serif",Rn="#82c6df",$n="Benton Gothic Bold, sans-serif",Tn="normal",Ln={"category-6":["#ec8431","#829eb1","#c89d29","#3580b1","#adc839","#ab7fb4"],"fire-7":["#fbf2c7","#f9e39c","#f8d36e","#f4bb6a","#e68a4f","#d15a40","#ab4232"],"fireandice-6":["#e68a4f","#f4bb6a","#f9e39c","#dadfe2","#a6b7c6","#849eae"],"ice-7":["#edefee","#dadfe2","#c4ccd2","#a6b7c6","#849eae","#607785","#47525d"]},Sn={background:"#ffffff",title:{anchor:"start",color:"#000000",font:$n,fontSize:22,fontWeight:"normal"},arc:{fill:Rn},area:{fill:Rn},line:{stroke:Rn,strokeWidth:2},path:{stroke:Rn},rect:{fill:Rn},shape:{stroke:Rn},symbol:{fill:Rn,size:30},axis:{labelFont:Nn,labelFontSize:11.5,labelFontWeight:"normal",titleFont:$n,titleFontSize:13,titleFontWeight:Tn},axisX:{labelAngle:0,labelPadding:4,tickSize:3},axisY:{labelBaseline:"middle",maxExtent:45,minExtent:45,tickSize:2,titleAlign:"left",titleAngle:0,titleX:-45,titleY:-11},legend:{labelFont:Nn,labelFontSize:11.5,symbolType:"square",titleFont:$n,titleFontSize:13,titleFontWeight:Tn},range:{category:Ln["category-6"],diverging:Ln["fireandice-6"],heatmap:Ln["fire-7"],ordinal:Ln["fire-7"],ramp:Ln["fire-7"]}},Cn="#ab5787",Dn="#979797",Fn={background:"#f9f9f9",arc:{fill:Cn},area:{fill:Cn},line:{stroke:Cn},path:{stroke:Cn},rect:{fill:Cn},shape:{stroke:Cn},symbol:{fill:Cn,size:30},axis:{domainColor:Dn,domainWidth:.5,gridWidth:.2,labelColor:Dn,tickColor:Dn,tickWidth:.2,titleColor:Dn},axisBand:{grid:!1},axisX:{grid:!0,tickSize:10},axisY:{domain:!1,grid:!0,tickSize:0},legend:{labelFontSize:11,padding:1,symbolSize:30,symbolType:"square"},range:{category:["#ab5787","#51b2e5","#703c5c","#168dd9","#d190b6","#00609f","#d365ba","#154866","#666666","#c4c4c4"]}},kn="#3e5c69",Pn={background:"#fff",arc:{fill:kn},area:{fill:kn},line:{stroke:kn},path:{stroke:kn},rect:{fill:kn},shape:{stroke:kn},symbol:{fill:kn},axis:{domainWidth:.5,grid:!0,labelPadding:2,tickSize:5,tickWidth:.5,titleFontWeight:"normal"},axisBand:{grid:!1},axisX:{gridWidth:.2},axisY:{gridDash:[3],gridWidth:.4},legend:{labelFontSize:11,padding:1,symbolType:"square"},range:{category:["#3e5c69","#6793a6","#182429","#0570b0","#3690c0","#74a9cf","#a6bddb","#e2ddf2"]}},_n="#1696d2",Mn="#000000",jn="Lato",zn="Lato",Un={"main-colors":["#1696d2","#d2d2d2","#000000","#fdbf11","#ec008b","#55b748","#5c5859","#db2b27"],"shades-blue":["#CFE8F3","#A2D4EC","#73BFE2","#46ABDB","#1696D2","#12719E","#0A4C6A","#062635"],"shades-gray":["#F5F5F5","#ECECEC","#E3E3E3","#DCDBDB","#D2D2D2","#9D9D9D","#696969","#353535"],"shades-yellow":["#FFF2CF","#FCE39E","#FDD870","#FCCB41","#FDBF11","#E88E2D","#CA5800","#843215"],"shades-magenta":["#F5CBDF","#EB99C2","#E46AA7","#E54096","#EC008B","#AF1F6B","#761548","#351123"],"shades-green":["#DCEDD9","#BCDEB4","#98CF90","#78C26D","#55B748","#408941","#2C5C2D","#1A2E19"],"shades-black":["#D5D5D4","#ADABAC","#848081","#5C5859","#332D2F","#262223","#1A1717","#0E0C0D"],"shades-red":["#F8D5D4","#F1AAA9","#E9807D","#E25552","#DB2B27","#A4201D","#6E1614","#370B0A"],"one-group":["#1696d2","#000000"],"two-groups-cat-1":["#1696d2","#000000"],"two-groups-cat-2":["#1696d2","#fdbf11"],"two-groups-cat-3":["#1696d2","#db2b27"],"two-groups-seq":["#a2d4ec","#1696d2"],"three-groups-cat":["#1696d2","#fdbf11","#000000"],"three-groups-seq":["#a2d4ec","#1696d2","#0a4c6a"],"four-groups-cat-1":["#000000","#d2d2d2","#fdbf11","#1696d2"],"four-groups-cat-2":["#1696d2","#ec0008b","#fdbf11","#5c5859"],"four-groups-seq":["#cfe8f3","#73bf42","#1696d2","#0a4c6a"],"five-groups-cat-1":["#1696d2","#fdbf11","#d2d2d2","#ec008b","#000000"],"five-groups-cat-2":["#1696d2","#0a4c6a","#d2d2d2","#fdbf11","#332d2f"],"five-groups-seq":["#cfe8f3","#73bf42","#1696d2","#0a4c6a","#000000"],"six-groups-cat-1":["#1696d2","#ec008b","#fdbf11","#000000","#d2d2d2","#55b748"],"six-groups-cat-2":["#1696d2","#d2d2d2","#ec008b","#fdbf11","#332d2f","#0a4c6a"],"six-groups-seq":["#cfe8f3","#a2d4ec","#73bfe2","#46abdb","#1696d2","#12719e"],"diverging-colors":["#ca5800","#fdbf11","#fdd870","#fff2cf","#cfe8f3","#73bfe2","#1696d2","#0a4c6a"]},Bn={background:"#FFFFFF",title:{anchor:"start",fontSize:18,font:jn},axisX:{domain:!0,domainColor:Mn,domainWidth:1,grid:!1,labelFontSize:12,labelFont:zn,labelAngle:0,tickColor:Mn,tickSize:5,titleFontSize:12,titlePadding:10,titleFont:jn},axisY:{domain:!1,domainWidth:1,grid:!0,gridColor:"#DEDDDD",gridWidth:1,labelFontSize:12,labelFont:zn,labelPadding:8,ticks:!1,titleFontSize:12,titlePadding:10,titleFont:jn,titleAngle:0,titleY:-10,titleX:18},legend:{labelFontSize:12,labelFont:zn,symbolSize:100,titleFontSize:12,titlePadding:10,titleFont:jn,orient:"right",offset:10},view:{stroke:"transparent"},range:{category:Un["six-groups-cat-1"],diverging:Un["diverging-colors"],heatmap:Un["diverging-colors"],ordinal:Un["six-groups-seq"],ramp:Un["shades-blue"]},area:{fill:_n},rect:{fill:_n},line:{color:_n,stroke:_n,strokeWidth:5},trail:{color:_n,stroke:_n,strokeWidth:0,size:1},path:{stroke:_n,strokeWidth:.5},point:{filled:!0},text:{font:"Lato",color:_n,fontSize:11,align:"center",fontWeight:400,size:11},style:{bar:{fill:_n,stroke:null}},arc:{fill:_n},shape:{stroke:_n},symbol:{fill:_n,size:30}},Gn="#3366CC",Xn="#ccc",Vn="Arial, sans-serif",Wn={arc:{fill:Gn},area:{fill:Gn},path:{stroke:Gn},rect:{fill:Gn},shape:{stroke:Gn},symbol:{stroke:Gn},circle:{fill:Gn},background:"#fff",padding:{top:10,right:10,bottom:10,left:10},style:{"guide-label":{font:Vn,fontSize:12},"guide-title":{font:Vn,fontSize:12},"group-title":{font:Vn,fontSize:12}},title:{font:Vn,fontSize:14,fontWeight:"bold",dy:-3,anchor:"start"},axis:{gridColor:Xn,tickColor:Xn,domain:!1,grid:!0},range:{category:["#4285F4","#DB4437","#F4B400","#0F9D58","#AB47BC","#00ACC1","#FF7043","#9E9D24","#5C6BC0","#F06292","#00796B","#C2185B"],heatmap:["#c6dafc","#5e97f6","#2a56c6"]}},Hn="2.10.0";var qn=Object.freeze({__proto__:null,dark:vn,excel:En,fivethirtyeight:An,ggplot2:In,googlecharts:Wn,latimes:Sn,quartz:Fn,urbaninstitute:Bn,version:Hn,vox:Pn});function Yn(e,t,r){return e.fields=t||[],e.fname=r,e}function Jn(e){return 1===e.length?Qn(e[0]):Zn(e)}const Qn=e=>function(t){return t[e]},Zn=e=>{const t=e.length;return function(r){for(let n=0;n<t;++n)r=r[e[n]];return r}};function Kn(e){throw Error(e)}!function(e,t,r){const n=function(e){const t=[],r=e.length;let n,i,o,a=null,s=0,l="";function c(){t.push(l+e.substring(n,i)),l="",n=i+1}for(e+="",n=i=0;i<r;++i)if(o=e[i],"\\"===o)l+=e.substring(n,i),l+=e.substring(++i,++i),n=i;else if(o===a)c(),a=null,s=-1;else{if(a)continue;n===s&&'"'===o||n===s&&"'"===o?(n=i+1,a=o):"."!==o||s?"["===o?(i>n&&c(),s=n=i+1):"]"===o&&(s||Kn("Access path missing open bracket: "+e),s>0&&c(),s=0,n=i+1):i>n?c():n=i+1}return s&&Kn("Access path missing closing bracket: "+e),a&&Kn("Access path missing closing quote: "+e),i>n&&(i++,c()),t}(e);e=1===n.length?n[0]:e,Yn((r&&r.get||Jn)(n),[e],t||e)}("id"),Yn((e=>e),[],"identity"),Yn((()=>0),[],"zero"),Yn((()=>1),[],"one"),Yn((()=>!0),[],"true"),Yn((()=>!1),[],"false");var ei=Array.isArray;function ti(e){return e===Object(e)}function ri(e,t){return JSON.stringify(e,function(e){const t=[];return function(r,n){if("object"!=typeof n||null===n)return n;const i=t.indexOf(this)+1;return t.length=i,t.length>e?"[Object]":t.indexOf(n)>=0?"[Circular]":(t.push(n),n)}}(t))}var ni="#vg-tooltip-element {\n  visibility: hidden;\n  padding: 8px;\n  position: fixed;\n  z-index: 1000;\n  font-family: sans-serif;\n  font-size: 11px;\n  border-radius: 3px;\n  box-shadow: 2px 2px 4px rgba(0, 0, 0, 0.1);\n  /* The default theme is the light theme. */\n  background-color: rgba(255, 255, 255, 0.95);\n  border: 1px solid #d9d9d9;\n  color: black; }\n  #vg-tooltip-element.visible {\n    visibility: visible; }\n  #vg-tooltip-element h2 {\n    margin-top: 0;\n    margin-bottom: 10px;\n    font-size: 13px; }\n  #vg-tooltip-element img {\n    max-width: 200px;\n    max-height: 200px; }\n  #vg-tooltip-element table {\n    border-spacing: 0; }\n    #vg-tooltip-element table tr {\n      border: none; }\n      #vg-tooltip-element table tr td {\n        overflow: hidden;\n        text-overflow: ellipsis;\n        padding-top: 2px;\n        padding-bottom: 2px; }\n        #vg-tooltip-element table tr td.key {\n          color: #808080;\n          max-width: 150px;\n          text-align: right;\n          padding-right: 4px; }\n        #vg-tooltip-element table tr td.value {\n          display: block;\n          max-width: 300px;\n          max-height: 7em;\n          text-align: left; }\n  #vg-tooltip-element.dark-theme {\n    background-color: rgba(32, 32, 32, 0.9);\n    border: 1px solid #f5f5f5;\n    color: white; }\n    #vg-tooltip-element.dark-theme td.key {\n      color: #bfbfbf; }\n";const ii="vg-tooltip-element",oi={offsetX:10,offsetY:10,id:ii,styleId:"vega-tooltip-style",theme:"light",disableDefaultStyle:!1,sanitize:function(e){return String(e).replace(/&/g,"&amp;").replace(/</g,"&lt;")},maxDepth:2,formatTooltip:function(e,t,r){if(ei(e))return`[${e.map((e=>t("string"==typeof e?e:ri(e,r)))).join(", ")}]`;if(ti(e)){let n="";const i=e,{title:o,image:a}=i,s=
+/*! *****************************************************************************
+    Copyright (c) Microsoft Corporation.
+
+    Permission to use, copy, modify, and/or distribute this software for any
+    purpose with or without fee is hereby granted.
+
+    THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+    REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+    AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+    INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+    LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+    OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+    PERFORMANCE OF THIS SOFTWARE.
+    ***************************************************************************** */
+function(e,t){var r={};for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&t.indexOf(n)<0&&(r[n]=e[n]);if(null!=e&&"function"==typeof Object.getOwnPropertySymbols){var i=0;for(n=Object.getOwnPropertySymbols(e);i<n.length;i++)t.indexOf(n[i])<0&&Object.prototype.propertyIsEnumerable.call(e,n[i])&&(r[n[i]]=e[n[i]])}return r}(i,["title","image"]);o&&(n+=`<h2>${t(o)}</h2>`),a&&(n+=`<img src="${t(a)}">`);const l=Object.keys(s);if(l.length>0){n+="<table>";for(const e of l){let i=s[e];void 0!==i&&(ti(i)&&(i=ri(i,r)),n+=`<tr><td class="key">${t(e)}:</td><td class="value">${t(i)}</td></tr>`)}n+="</table>"}return n||"{}"}return t(e)}};class ai{constructor(e){this.options=Object.assign(Object.assign({},oi),e);const t=this.options.id;if(this.el=null,this.call=this.tooltipHandler.bind(this),!this.options.disableDefaultStyle&&!document.getElementById(this.options.styleId)){const e=document.createElement("style");e.setAttribute("id",this.options.styleId),e.innerHTML=function(e){if(!/^[A-Za-z]+[-:.\w]*$/.test(e))throw new Error("Invalid HTML ID");return ni.toString().replace(ii,e)}(t);const r=document.head;r.childNodes.length>0?r.insertBefore(e,r.childNodes[0]):r.appendChild(e)}}tooltipHandler(e,t,r,n){var i;this.el=document.getElementById(this.options.id),this.el||(this.el=document.createElement("div"),this.el.setAttribute("id",this.options.id),this.el.classList.add("vg-tooltip"),document.body.appendChild(this.el));if((null!==(i=document.fullscreenElement)&&void 0!==i?i:document.body).appendChild(this.el),null==n||""===n)return void this.el.classList.remove("visible",`${this.options.theme}-theme`);this.el.innerHTML=this.options.formatTooltip(n,this.options.sanitize,this.options.maxDepth),this.el.classList.add("visible",`${this.options.theme}-theme`);const{x:o,y:a}=function(e,t,r,n){let i=e.clientX+r;i+t.width>window.innerWidth&&(i=+e.clientX-r-t.width);let o=e.clientY+n;return o+t.height>window.innerHeight&&(o=+e.clientY-n-t.height),{x:i,y:o}}(t,this.el.getBoundingClientRect(),this.options.offsetX,this.options.offsetY);this.el.setAttribute("style",`top: ${a}px; left: ${o}px`)}}var si='.vega-embed {\n  position: relative;\n  display: inline-block;\n  box-sizing: border-box; }\n  .vega-embed.has-actions {\n    padding-right: 38px; }\n  .vega-embed details:not([open]) > :not(summary) {\n    display: none !important; }\n  .vega-embed summary {\n    list-style: none;\n    position: absolute;\n    top: 0;\n    right: 0;\n    padding: 6px;\n    z-index: 1000;\n    background: white;\n    box-shadow: 1px 1px 3px rgba(0, 0, 0, 0.1);\n    color: #1b1e23;\n    border: 1px solid #aaa;\n    border-radius: 999px;\n    opacity: 0.2;\n    transition: opacity 0.4s ease-in;\n    outline: none;\n    cursor: pointer;\n    line-height: 0px; }\n    .vega-embed summary::-webkit-details-marker {\n      display: none; }\n    .vega-embed summary:active {\n      box-shadow: #aaa 0px 0px 0px 1px inset; }\n    .vega-embed summary svg {\n      width: 14px;\n      height: 14px; }\n  .vega-embed details[open] summary {\n    opacity: 0.7; }\n  .vega-embed:hover summary,\n  .vega-embed:focus summary {\n    opacity: 1 !important;\n    transition: opacity 0.2s ease; }\n  .vega-embed .vega-actions {\n    position: absolute;\n    z-index: 1001;\n    top: 35px;\n    right: -9px;\n    display: flex;\n    flex-direction: column;\n    padding-bottom: 8px;\n    padding-top: 8px;\n    border-radius: 4px;\n    box-shadow: 0 2px 8px 0 rgba(0, 0, 0, 0.2);\n    border: 1px solid #d9d9d9;\n    background: white;\n    animation-duration: 0.15s;\n    animation-name: scale-in;\n    animation-timing-function: cubic-bezier(0.2, 0, 0.13, 1.5);\n    text-align: left; }\n    .vega-embed .vega-actions a {\n      padding: 8px 16px;\n      font-family: sans-serif;\n      font-size: 14px;\n      font-weight: 600;\n      white-space: nowrap;\n      color: #434a56;\n      text-decoration: none; }\n      .vega-embed .vega-actions a:hover {\n        background-color: #f7f7f9;\n        color: black; }\n    .vega-embed .vega-actions::before, .vega-embed .vega-actions::after {\n      content: "";\n      display: inline-block;\n      position: absolute; }\n    .vega-embed .vega-actions::before {\n      left: auto;\n      right: 14px;\n      top: -16px;\n      border: 8px solid #0000;\n      border-bottom-color: #d9d9d9; }\n    .vega-embed .vega-actions::after {\n      left: auto;\n      right: 15px;\n      top: -14px;\n      border: 7px solid #0000;\n      border-bottom-color: #fff; }\n  .vega-embed .chart-wrapper.fit-x {\n    width: 100%; }\n  .vega-embed .chart-wrapper.fit-y {\n    height: 100%; }\n\n.vega-embed-wrapper {\n  max-width: 100%;\n  overflow: auto;\n  padding-right: 14px; }\n\n@keyframes scale-in {\n  from {\n    opacity: 0;\n    transform: scale(0.6); }\n  to {\n    opacity: 1;\n    transform: scale(1); } }\n';function li(e,...t){for(const r of t)ci(e,r);return e}function ci(t,r){for(const n of Object.keys(r))e.writeConfig(t,n,r[n],!0)}String.prototype.startsWith||(String.prototype.startsWith=function(e,t){return this.substr(!t||t<0?0:+t,e.length)===e});var hi;const pi="6.20.0",ui=i;let fi=o;const di="undefined"!=typeof window?window:void 0;void 0===fi&&null!=di&&null!==(hi=di.vl)&&void 0!==hi&&hi.compile&&(fi=di.vl);const mi={export:{svg:!0,png:!0},source:!0,compiled:!0,editor:!0},vi={CLICK_TO_VIEW_ACTIONS:"Click to view actions",COMPILED_ACTION:"View Compiled Vega",EDITOR_ACTION:"Open in Vega Editor",PNG_ACTION:"Save as PNG",SOURCE_ACTION:"View Source",SVG_ACTION:"Save as SVG"},gi={vega:"Vega","vega-lite":"Vega-Lite"},Ei={vega:ui.version,"vega-lite":fi?fi.version:"not available"},bi={vega:e=>e,"vega-lite":(e,t)=>fi.compile(e,{config:t}).spec},yi='\n<svg viewBox="0 0 16 16" fill="currentColor" stroke="none" stroke-width="1" stroke-linecap="round" stroke-linejoin="round">\n  <circle r="2" cy="8" cx="2"></circle>\n  <circle r="2" cy="8" cx="8"></circle>\n  <circle r="2" cy="8" cx="14"></circle>\n</svg>',wi="chart-wrapper";function Oi(e,t,r,n){const i=`<html><head>${t}</head><body><pre><code class="json">`,o=`</code></pre>${r}</body></html>`,a=window.open("");a.document.write(i+e+o),a.document.title=`${gi[n]} JSON Source`}function Ai(e){return(t=e)&&"load"in t?e:ui.loader(e);var t}function xi(e){var t;return null!==(t=e.usermeta&&e.usermeta.embedOptions)&&void 0!==t?t:{}}async function Ii(t,r,n={}){var i,o;let a,s;e.isString(r)?(s=Ai(n.loader),a=JSON.parse(await s.load(r))):a=r;const l=xi(a).loader;var c;s&&!l||(s=Ai(null!==(c=n.loader)&&void 0!==c?c:l));const h=await Ni(xi(a),s),p=await Ni(n,s),u={...li(p,h),config:e.mergeConfig(null!==(i=p.config)&&void 0!==i?i:{},null!==(o=h.config)&&void 0!==o?o:{})};return await async function(t,r,n={},i){var o,a,s,l,c,h,p;const u=n.theme?e.mergeConfig(qn[n.theme],null!==(o=n.config)&&void 0!==o?o:{}):n.config,f=e.isBoolean(n.actions)?n.actions:li({},mi,null!==(a=n.actions)&&void 0!==a?a:{}),d={...vi,...n.i18n},m=null!==(s=n.renderer)&&void 0!==s?s:"canvas",v=null!==(l=n.logLevel)&&void 0!==l?l:ui.Warn,g=null!==(c=n.downloadFileName)&&void 0!==c?c:"visualization",E="string"==typeof t?document.querySelector(t):t;if(!E)throw new Error(`${t} does not exist`);if(!1!==n.defaultStyle){const e="vega-embed-style",{root:t,rootContainer:r}=function(e){const t=e.getRootNode?e.getRootNode():document;var r;return t instanceof ShadowRoot?{root:t,rootContainer:t}:{root:document,rootContainer:null!==(r=document.head)&&void 0!==r?r:document.body}}(E);if(!t.getElementById(e)){const t=document.createElement("style");t.id=e,t.innerText=void 0===n.defaultStyle||!0===n.defaultStyle?si.toString():n.defaultStyle,r.appendChild(t)}}const b=function(e,t){if(e.$schema){const n=dn(e.$schema);var r;t&&t!==n.library&&console.warn(`The given visualization spec is written in ${gi[n.library]}, but mode argument sets ${null!==(r=gi[t])&&void 0!==r?r:t}.`);const i=n.library;return rn.satisfies(Ei[i],`^${n.version.slice(1)}`)||console.warn(`The input spec uses ${gi[i]} ${n.version}, but the current version of ${gi[i]} is v${Ei[i]}.`),i}return"mark"in e||"encoding"in e||"layer"in e||"hconcat"in e||"vconcat"in e||"facet"in e||"repeat"in e?"vega-lite":"marks"in e||"signals"in e||"scales"in e||"axes"in e?"vega":null!=t?t:"vega"}(r,n.mode);let y=bi[b](r,u);if("vega-lite"===b&&y.$schema){const e=dn(y.$schema);rn.satisfies(Ei.vega,`^${e.version.slice(1)}`)||console.warn(`The compiled spec uses Vega ${e.version}, but current version is v${Ei.vega}.`)}E.classList.add("vega-embed"),f&&E.classList.add("has-actions");E.innerHTML="";let w=E;if(f){const e=document.createElement("div");e.classList.add(wi),E.appendChild(e),w=e}const O=n.patch;O&&(y=O instanceof Function?O(y):A(y,O,!0,!1).newDocument);n.formatLocale&&ui.formatLocale(n.formatLocale);n.timeFormatLocale&&ui.timeFormatLocale(n.timeFormatLocale);const{ast:x}=n,I=ui.parse(y,"vega-lite"===b?{}:u,{ast:x}),N=new(n.viewClass||ui.View)(I,{loader:i,logLevel:v,renderer:m,...x?{expr:null!==(h=null!==(p=ui.expressionInterpreter)&&void 0!==p?p:n.expr)&&void 0!==h?h:fn}:{}});if(N.addSignalListener("autosize",((e,t)=>{const{type:r}=t;"fit-x"==r?(w.classList.add("fit-x"),w.classList.remove("fit-y")):"fit-y"==r?(w.classList.remove("fit-x"),w.classList.add("fit-y")):"fit"==r?w.classList.add("fit-x","fit-y"):w.classList.remove("fit-x","fit-y")})),!1!==n.tooltip){let e;e="function"==typeof n.tooltip?n.tooltip:new ai(!0===n.tooltip?{}:n.tooltip).call,N.tooltip(e)}let R,{hover:$}=n;void 0===$&&($="vega"===b);if($){const{hoverSet:e,updateSet:t}="boolean"==typeof $?{}:$;N.hover(e,t)}n&&(null!=n.width&&N.width(n.width),null!=n.height&&N.height(n.height),null!=n.padding&&N.padding(n.padding));if(await N.initialize(w,n.bind).runAsync(),!1!==f){let e=E;if(!1!==n.defaultStyle){const t=document.createElement("details");t.title=d.CLICK_TO_VIEW_ACTIONS,E.append(t),e=t;const r=document.createElement("summary");r.innerHTML=yi,t.append(r),R=e=>{t.contains(e.target)||t.removeAttribute("open")},document.addEventListener("click",R)}const t=document.createElement("div");if(e.append(t),t.classList.add("vega-actions"),!0===f||!1!==f.export)for(const e of["svg","png"])if(!0===f||!0===f.export||f.export[e]){const r=d[`${e.toUpperCase()}_ACTION`],i=document.createElement("a");i.text=r,i.href="#",i.target="_blank",i.download=`${g}.${e}`,i.addEventListener("mousedown",(async function(t){t.preventDefault();const r=await N.toImageURL(e,n.scaleFactor);this.href=r})),t.append(i)}if(!0===f||!1!==f.source){const e=document.createElement("a");e.text=d.SOURCE_ACTION,e.href="#",e.addEventListener("click",(function(e){var t,i;Oi(k(r),null!==(t=n.sourceHeader)&&void 0!==t?t:"",null!==(i=n.sourceFooter)&&void 0!==i?i:"",b),e.preventDefault()})),t.append(e)}if("vega-lite"===b&&(!0===f||!1!==f.compiled)){const e=document.createElement("a");e.text=d.COMPILED_ACTION,e.href="#",e.addEventListener("click",(function(e){var t,r;Oi(k(y),null!==(t=n.sourceHeader)&&void 0!==t?t:"",null!==(r=n.sourceFooter)&&void 0!==r?r:"","vega"),e.preventDefault()})),t.append(e)}if(!0===f||!1!==f.editor){var T;const e=null!==(T=n.editorUrl)&&void 0!==T?T:"https://vega.github.io/editor/",i=document.createElement("a");i.text=d.EDITOR_ACTION,i.href="#",i.addEventListener("click",(function(t){!function(e,t,r){const n=e.open(t),{origin:i}=new URL(t);let o=40;e.addEventListener("message",(function t(r){r.source===n&&(o=0,e.removeEventListener("message",t,!1))}),!1),setTimeout((function e(){o<=0||(n.postMessage(r,i),setTimeout(e,250),o-=1)}),250)}(window,e,{config:u,mode:b,renderer:m,spec:k(r)}),t.preventDefault()})),t.append(i)}}function L(){R&&document.removeEventListener("click",R),N.finalize()}return{view:N,spec:r,vgSpec:y,finalize:L}}(t,a,u,s)}async function Ni(t,r){var n;const i=e.isString(t.config)?JSON.parse(await r.load(t.config)):null!==(n=t.config)&&void 0!==n?n:{},o=e.isString(t.patch)?JSON.parse(await r.load(t.patch)):t.patch;return{...t,...o?{patch:o}:{},...i?{config:i}:{}}}async function Ri(e,t={}){var r;const n=document.createElement("div");n.classList.add("vega-embed-wrapper");const i=document.createElement("div");n.appendChild(i);const o=!0===t.actions||!1===t.actions?t.actions:{export:!0,source:!1,compiled:!0,editor:!0,...null!==(r=t.actions)&&void 0!==r?r:{}},a=await Ii(i,e,{actions:o,...null!=t?t:{}});return n.value=a.view,n}const $i=(...t)=>{return t.length>1&&(e.isString(t[0])&&!((r=t[0]).startsWith("http://")||r.startsWith("https://")||r.startsWith("//"))||t[0]instanceof HTMLElement||3===t.length)?Ii(t[0],t[1],t[2]):Ri(t[0],t[1]);var r};return $i.vegaLite=fi,$i.vl=fi,$i.container=Ri,$i.embed=Ii,$i.vega=ui,$i.default=Ii,$i.version=pi,$i}));
+//# sourceMappingURL=vega-embed.min.js.map
@@ -0,0 +1,159 @@
+"""
+Process-wide, read-only cache of the simulation data (and of the chart tables built from it, see
+chart_data.cached_chart_data).
+
+All sessions share the same loaded replicates (model_vars DataFrames, network graphs and diffs) instead
+of each keeping its own copy. Entries are evicted least recently used first once their estimated size
+exceeds the memory budget (config_params['data_cache_mb']). Evicting an entry only drops the cache's
+reference: sessions that still use it keep it alive until they move on.
+
+Cached data is shared, so callers must treat it as read-only (copy before modifying).
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+import pandas as pd
+
+from .network_diff import NetworkDiff
+
+# Rough per-object costs used to estimate the memory held by networkx graphs and json diffs.
+GRAPH_BYTES_PER_NODE = 500
+GRAPH_BYTES_PER_EDGE = 150
+JSON_BYTES_PER_VALUE = 150
+
+
+def estimate_size(data):
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=True, deep=True).sum())
+
+    size = 0
+    if data.get('model_vars') is not None:
+        size += int(data['model_vars'].memory_usage(index=True, deep=True).sum())
+
+    for series in data.get('plot_series', {}).values():
+        size += int(series.data.memory_usage(index=True, deep=True).sum())
+
+    networks = data.get('networks')
+    if networks:
+        init = networks.get('init')
+        if init is not None:
+            size += GRAPH_BYTES_PER_NODE * init.number_of_nodes() + GRAPH_BYTES_PER_EDGE * init.number_of_edges()
+
+        diff = networks.get('diff')
+        if isinstance(diff, NetworkDiff):
+            size += 8 * len(diff.offsets)
+        elif diff is not None:
+            size += JSON_BYTES_PER_VALUE * sum(
+                len(values) for d in diff.values() for values in d.values()
+            )
+
+    return size
+
+
+class SharedDataCache:
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def size(self, key):
+        """Estimated size of the entry for key, or None if it is not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry is not None else None
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key, value):
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_load(self, key, loader):
+        """
+        Returns the cached value for key, calling loader() to produce it on a miss. Concurrent requests
+        for the same key (e.g. from several sessions) wait for a single load.
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+
+            future = self._loading.get(key)
+            loading = future is None
+            if loading:
+                self.misses += 1
+                future = self._loading[key] = Future()
+            else:
+                self.hits += 1
+
+        if not loading:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+
+        self.put(key, value)
+        with self._lock:
+            del self._loading[key]
+        future.set_result(value)
+        return value
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / requests if requests else 0.0
+        }
+
+
+_data_cache = None
+_data_cache_lock = threading.Lock()
+
+
+def get_data_cache():
+    global _data_cache
+    with _data_cache_lock:
+        if _data_cache is None:
+            from config import Config
+            _data_cache = SharedDataCache(Config().config_params['data_cache_mb'] * 2 ** 20)
+    return _data_cache
@@ -0,0 +1,117 @@
+"""
+Naming of the simulation data files under ./data (as produced by data_transfer_complete.py).
+
+Each parameter combination is stored in its own sub-directory, containing one directory per team
+allocation method, which in turn contains the files for each replicate simulation.
+"""
+import os
+import re
+
+DATA_DIR = 'data'
+
+ALLOCATOR_DIRS = dict(zip(
+    ['Random', 'Optimised', 'Flexible start time'],
+    ['Random', 'Basin', 'Basin_w_flex']
+))
+
+PPS_PATTERN = re.compile(
+    r'pps_(\d+)_sd_([\d.]+)_dw_([\d.]+)_tl_([\d.]+)_tf_(\d)_tb_(\d)_bf_(\d)_010921_v1.1$'
+)
+PRESET_E_PATTERN = re.compile(
+    r'preset_E_sd_([\d.]+)_tl_([\d.]+)_tf_(\d)_tb_(\d)_251021_v1.1$'
+)
+REP_PATTERN = re.compile(r'_rep_(\d+)')
+
+# The files of a replicate, by kind of data (formatted with the replicate number).
+REPLICATE_FILES = {
+    'model_vars': 'model_vars_rep_%d.pickle',
+    'roi': 'roi_rep_%d.pickle',
+    'network': 'network_rep_%d_timestep_1.adjlist',
+    'network_diff_json': 'network_dfference_rep_%d.json',
+    'network_diff': 'network_diff_rep_%d.npy',
+    'network_frames': 'network_frames_rep_%d.zip',
+    'network_metrics': 'network_metrics_rep_%d.pickle',
+    'network_components': 'network_components_rep_%d.npy'
+}
+
+PRESET_E_PARAMETERS = {
+    'project_count': 3,
+    'dept_workload': 0.1,
+    'budget_func': True
+}
+
+
+def get_sub_dir(project_count, dept_workload, budget_func, skill_decay, train_load, preset_e=False):
+    """
+    Returns the name of the data sub-directory for a parameter combination.
+
+    Note: train_load = 2.0 encodes the 'training boost' scenario.
+    """
+    training_load = 0.1 if train_load == 2.0 else train_load
+    training_boost = True if train_load == 2.0 else False
+    training_flag = False if train_load == 0.0 else True
+
+    if preset_e:
+        return (
+            'preset_E_sd_%.3f_tl_%.1f_tf_%d_tb_%d_251021_v1.1'
+            % (skill_decay, training_load, training_flag, training_boost)
+        )
+    else:
+        return (
+            'pps_%d_sd_%.3f_dw_%.1f_tl_%.1f_tf_%d_tb_%d_bf_%d_010921_v1.1'
+            % (
+                project_count, skill_decay, dept_workload,
+                training_load, training_flag, training_boost, budget_func
+            )
+        )
+
+
+def parse_sub_dir(sub_dir):
+    """
+    Inverse of get_sub_dir: returns the parameter dictionary for a data sub-directory name, or None
+    if the name is not recognised.
+    """
+    match = PPS_PATTERN.match(sub_dir)
+    if match is not None:
+        pps, sd, dw, tl, tf, tb, bf = match.groups()
+        parameters = {
+            'project_count': int(pps),
+            'dept_workload': float(dw),
+            'budget_func': bool(int(bf)),
+            'preset_e': False
+        }
+    else:
+        match = PRESET_E_PATTERN.match(sub_dir)
+        if match is None:
+            return None
+        sd, tl, tf, tb = match.groups()
+        parameters = dict(PRESET_E_PARAMETERS, preset_e=True)
+
+    parameters['skill_decay'] = float(sd)
+    parameters['train_load'] = 2.0 if int(tb) else float(tl)
+    return parameters
+
+
+def replicate_path(sub_dir, allocator_dir, file_name, data_dir=DATA_DIR):
+    return os.path.join(data_dir, sub_dir, allocator_dir, file_name)
+
+
+def list_replicates(data_dir=DATA_DIR):
+    """
+    Walks the data directory and returns a sorted list of (sub_dir, allocator_dir, rep) for every
+    replicate that has a model_vars file.
+    """
+    replicates = []
+    for sub_dir in sorted(os.listdir(data_dir)):
+        if parse_sub_dir(sub_dir) is None:
+            continue
+        for allocator_dir in sorted(ALLOCATOR_DIRS.values()):
+            path = os.path.join(data_dir, sub_dir, allocator_dir)
+            if not os.path.isdir(path):
+                continue
+            for file_name in os.listdir(path):
+                if file_name.startswith('model_vars_rep_'):
+                    rep = int(REP_PATTERN.search(file_name).group(1))
+                    replicates.append((sub_dir, allocator_dir, rep))
+
+    return sorted(replicates)
@@ -0,0 +1,165 @@
+"""
+Prometheus metrics. No-ops (and prometheus_client is not imported) unless config_params['metrics_port'] is set.
+"""
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager, nullcontext
+
+LATENCY_BUCKETS = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30, 60, 120)
+FPS_BUCKETS = (1, 2, 5, 10, 15, 20, 30, 45, 60)
+
+_metrics = []
+
+
+class _NoOp:
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def observe(self, value):
+        pass
+
+    def inc(self, amount=1):
+        pass
+
+    def time(self):
+        return nullcontext()
+
+
+_NO_OP = _NoOp()
+
+
+class _Metric:
+    """A prometheus_client metric, created when the endpoint is started."""
+
+    def __init__(self, metric_type, name, documentation, labelnames=(), **kwargs):
+        self.spec = (metric_type, name, documentation, labelnames, kwargs)
+        self.metric = None
+        _metrics.append(self)
+
+    def create(self, registry):
+        import prometheus_client
+
+        metric_type, name, documentation, labelnames, kwargs = self.spec
+        self.metric = getattr(prometheus_client, metric_type)(
+            name, documentation, labelnames, registry=registry, **kwargs
+        )
+
+    @property
+    def enabled(self):
+        return self.metric is not None
+
+    def __getattr__(self, name):
+        # labels, observe, inc and time
+        return getattr(_NO_OP if self.metric is None else self.metric, name)
+
+
+LOAD_MODELS_SECONDS = _Metric(
+    'Histogram', 'superscript_load_models_seconds', 'Time taken by load_models (including cache hits).',
+    ['networks'], buckets=LATENCY_BUCKETS
+)
+READ_SECONDS = _Metric(
+    'Histogram', 'superscript_read_seconds', 'Time taken to read and parse a data file, by kind of data.',
+    ['kind'], buckets=LATENCY_BUCKETS
+)
+READ_BYTES = _Metric(
+    'Counter', 'superscript_read_bytes', 'Size of the data files read, by kind of data.', ['kind']
+)
+PRELOAD_SECONDS = _Metric(
+    'Histogram', 'superscript_preload_seconds', 'Time taken to load one replicate of a preset in the background.',
+    ['preset'], buckets=LATENCY_BUCKETS
+)
+PRELOAD_WAIT_SECONDS = _Metric(
+    'Histogram', 'superscript_preload_wait_seconds',
+    'Time from the start of a session until all of the presets have been loaded.', buckets=LATENCY_BUCKETS
+)
+PAGE_SECONDS = _Metric(
+    'Histogram', 'superscript_page_seconds', 'Time taken to run the code of a page (including playback).',
+    ['page'], buckets=LATENCY_BUCKETS
+)
+PLAYBACK_FRAME_SECONDS = _Metric(
+    'Histogram', 'superscript_playback_frame_seconds', 'Time taken to update the plots for a playback frame.',
+    buckets=LATENCY_BUCKETS
+)
+PLAYBACK_SKIPPED_TIMESTEPS = _Metric(
+    'Counter', 'superscript_playback_skipped_timesteps', 'Timesteps not drawn to keep playback on time.'
+)
+PLAYBACK_FPS = _Metric(
+    'Histogram', 'superscript_playback_fps', 'Frames per second achieved by a playback run.', buckets=FPS_BUCKETS
+)
+PREFETCH_LOADS = _Metric(
+    'Counter', 'superscript_prefetch_loads', 'Speculative loads of neighbouring combinations, by outcome.',
+    ['outcome']
+)
+DRAW_GRAPH_SECONDS = _Metric(
+    'Histogram', 'superscript_draw_graph_seconds', 'Time taken to draw the social network.',
+    ['source'], buckets=LATENCY_BUCKETS
+)
+
+
+@contextmanager
+def measure_read(kind, path=None):
+    """Times reading and parsing of data of the given kind, and counts the size of the file at path."""
+    start = time.perf_counter()
+    yield
+    READ_SECONDS.labels(kind).observe(time.perf_counter() - start)
+    if path is not None and READ_BYTES.enabled and os.path.isfile(path):
+        READ_BYTES.labels(kind).inc(os.path.getsize(path))
+
+
+class DataCacheCollector:
+    """Reports the statistics of the shared data cache when the metrics are scraped."""
+
+    def collect(self):
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+        from . import data_cache
+
+        cache = data_cache._data_cache
+        stats = cache.stats() if cache is not None else {
+            'entries': 0, 'bytes': 0, 'max_bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0, 'hit_rate': 0.0
+        }
+
+        for key in ('hits', 'misses', 'evictions'):
+            yield CounterMetricFamily(
+                'superscript_data_cache_%s' % key, 'Shared data cache %s.' % key, value=stats[key]
+            )
+        for key, documentation in (
+                ('entries', 'Replicates held in the shared data cache.'),
+                ('bytes', 'Estimated size of the shared data cache.'),
+                ('max_bytes', 'Size budget of the shared data cache.'),
+                ('hit_rate', 'Fraction of shared data cache requests served from the cache.')
+        ):
+            yield GaugeMetricFamily('superscript_data_cache_%s' % key, documentation, value=stats[key])
+
+
+_server_started = False
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port, address='127.0.0.1'):
+    """Starts the metrics endpoint on address:port, once per process. port=None disables it."""
+    global _server_started
+    with _server_lock:
+        if _server_started or port is None:
+            return
+        _server_started = True
+
+        from prometheus_client import (
+            CollectorRegistry, GCCollector, PlatformCollector, ProcessCollector, start_http_server
+        )
+        registry = CollectorRegistry()
+        ProcessCollector(registry=registry)
+        PlatformCollector(registry=registry)
+        GCCollector(registry=registry)
+        registry.register(DataCacheCollector())
+        for metric in _metrics:
+            metric.create(registry)
+
+        try:
+            start_http_server(port, addr=address, registry=registry)
+        except OSError as e:
+            logging.getLogger(__name__).warning(
+                "Could not start the metrics endpoint on %s:%d: %s", address, port, e
+            )
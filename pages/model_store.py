@@ -0,0 +1,169 @@
+"""
+Columnar store for the model_vars and ROI data (ROI already smoothed): one memory-mapped
+(row, timestep, variable) array per dtype in store/<dtype>.npy, with one row per replicate. The rows are
+listed in store/index.json.
+
+Build with:  python data_pipeline.py store
+"""
+import os
+import json
+import pickle
+import numpy as np
+import pandas as pd
+
+from .data_paths import DATA_DIR, REPLICATE_FILES, list_replicates, parse_sub_dir, replicate_path
+from .network_metrics import merge_network_metrics, read_network_metrics
+from .transforms import rolling_mean
+
+STORE_DIR = os.path.join(DATA_DIR, 'store')
+INDEX_FILE = 'index.json'
+ROI_WINDOW = 10
+
+
+def build_model_store(data_dir=DATA_DIR, store_dir=STORE_DIR, verbose=True):
+    replicates = list_replicates(data_dir)
+    rows = []
+    columns = {}
+    roi = {}
+
+    for sub_dir, allocator, rep in replicates:
+        with open(replicate_path(sub_dir, allocator, 'model_vars_rep_%d.pickle' % rep, data_dir), 'rb') as ifile:
+            model_vars = pickle.load(ifile)
+
+        # Network statistics, if they have been computed (see network_metrics.py):
+        metrics_path = replicate_path(sub_dir, allocator, REPLICATE_FILES['network_metrics'] % rep, data_dir)
+        if os.path.isfile(metrics_path):
+            model_vars = merge_network_metrics(model_vars, read_network_metrics(metrics_path))
+
+        for variable in model_vars.columns:
+            columns.setdefault(variable, {})[len(rows)] = model_vars[variable].values
+
+        roi_path = replicate_path(sub_dir, allocator, 'roi_rep_%d.pickle' % rep, data_dir)
+        if os.path.isfile(roi_path):
+            with open(roi_path, 'rb') as ifile:
+                roi[len(rows)] = np.asarray(pickle.load(ifile), dtype=np.float64)
+
+        row = dict(sub_dir=sub_dir, allocator=allocator, rep=rep, length=len(model_vars))
+        row.update(parse_sub_dir(sub_dir))
+        rows.append(row)
+
+    # (One batch per series length.)
+    columns['Roi'] = {i: np.zeros(row['length']) for i, row in enumerate(rows)}
+    for length in set(len(values) for values in roi.values()):
+        batch = [i for i, values in roi.items() if len(values) == length]
+        smoothed = rolling_mean(np.stack([roi[i] for i in batch]), ROI_WINDOW, axis=1)
+        for i, values in zip(batch, smoothed):
+            columns['Roi'][i] = values
+
+    timesteps = max(row['length'] for row in rows)
+    os.makedirs(store_dir, exist_ok=True)
+
+    blocks = {}
+    for variable, values in columns.items():
+        blocks.setdefault(np.result_type(*values.values()).name, []).append(variable)
+
+    for dtype, variables in blocks.items():
+        dtype = np.dtype(dtype)
+        array = np.full(
+            (len(rows), timesteps, len(variables)), np.nan if dtype.kind == 'f' else 0, dtype=dtype
+        )
+        for position, variable in enumerate(variables):
+            for i, v in columns[variable].items():
+                array[i, :len(v), position] = v
+        np.save(os.path.join(store_dir, dtype.name + '.npy'), array)
+
+    # (Written last, so that the app never sees a partial store.)
+    with open(os.path.join(store_dir, INDEX_FILE), 'w') as ofile:
+        json.dump(
+            {'timesteps': timesteps, 'variables': list(columns), 'blocks': blocks, 'rows': rows},
+            ofile
+        )
+
+    if verbose:
+        print("Wrote %d variables for %d replicates to %s" % (len(columns), len(rows), store_dir))
+
+
+class ModelStore:
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = store_dir
+
+        with open(os.path.join(store_dir, INDEX_FILE), 'r') as ifile:
+            index = json.load(ifile)
+
+        self.timesteps = index['timesteps']
+        self.variables = index['variables']
+        self.blocks = index['blocks']
+        self.rows = index['rows']
+        # variable -> (dtype, position in that block)
+        self._positions = {
+            variable: (dtype, position)
+            for dtype, variables in self.blocks.items()
+            for position, variable in enumerate(variables)
+        }
+        self._row_lookup = {
+            (row['sub_dir'], row['allocator'], row['rep']): i
+            for i, row in enumerate(self.rows)
+        }
+        self._arrays = {}
+
+    def block(self, dtype):
+        """Memory-mapped (n_rows, timesteps, n_variables) array of the variables of dtype."""
+        if dtype not in self._arrays:
+            self._arrays[dtype] = np.load(
+                os.path.join(self.store_dir, dtype + '.npy'), mmap_mode='r'
+            )
+        return self._arrays[dtype]
+
+    def array(self, variable):
+        """Memory-mapped (n_rows, timesteps) view of variable."""
+        dtype, position = self._positions[variable]
+        return self.block(dtype)[:, :, position]
+
+    def row(self, sub_dir, allocator, rep):
+        return self._row_lookup.get((sub_dir, allocator, rep))
+
+    def select(self, **parameters):
+        """
+        Returns the row numbers whose keys (project_count, skill_decay, dept_workload, train_load,
+        budget_func, preset_e, allocator, rep) match all of the given values.
+        """
+        return [
+            i for i, row in enumerate(self.rows)
+            if all(row.get(key) == value for key, value in parameters.items())
+        ]
+
+    def model_vars(self, row, columns=None):
+        """A replicate's model_vars (with 'time'), on one read-only array per dtype."""
+        if columns is None:
+            columns = self.variables
+        length = self.rows[row]['length']
+        index = pd.RangeIndex(length)
+
+        frames = []
+        for dtype, variables in self.blocks.items():
+            names = [variable for variable in variables if variable in columns]
+            values = self.block(dtype)[row][:length, [self._positions[variable][1] for variable in names]]
+            if dtype == 'int64':
+                names.append('time')
+                values = np.column_stack((values, np.arange(length)))
+            if names:
+                values.flags.writeable = False
+                frames.append(pd.DataFrame(values, index=index, columns=names, copy=False))
+        if 'int64' not in self.blocks:
+            time = np.arange(length)[:, None]
+            time.flags.writeable = False
+            frames.append(pd.DataFrame(time, index=index, columns=['time'], copy=False))
+
+        return pd.concat(frames, axis=1, copy=False)
+
+
+_model_store = None
+
+
+def get_model_store(store_dir=STORE_DIR):
+    """Process-wide ModelStore, or None if the store has not been built."""
+    global _model_store
+    if _model_store is None and os.path.isfile(os.path.join(store_dir, INDEX_FILE)):
+        _model_store = ModelStore(store_dir)
+    return _model_store
@@ -0,0 +1,183 @@
+"""
+Compact binary encoding of the 'network difference' files.
+
+Each network_dfference_rep_N.json is converted to network_diff_rep_N.npy: a single flat int32 array
+that can be memory-mapped, so that the diff for one timestep is read without parsing the whole file.
+
+Layout of the array:
+    [0]            format version
+    [1]            n, the number of timesteps in the file
+    [2]            largest node label in any 'nodes_to_add' (0 if there are none)
+    [3 : 3 + 6n]   offset table, one row of six values per timestep:
+                       timestep, nodes_to_remove, nodes_to_add, edges_to_add, edges_to_increment, end
+                   where each value after the timestep is the position in the array at which that
+                   section starts (and 'end' is where the timestep's data ends).
+    [3 + 6n : ]    the sections themselves: one value per node, two per edge (u, v) and three per edge
+                   increment (u, v, increment).
+
+Convert the existing data tree with:  python data_pipeline.py networks
+"""
+import os
+import json
+import numpy as np
+
+from .data_paths import DATA_DIR, list_replicates, replicate_path
+
+FORMAT_VERSION = 1
+HEADER_LENGTH = 3
+SECTIONS = ['nodes_to_remove', 'nodes_to_add', 'edges_to_add', 'edges_to_increment']
+SECTION_WIDTHS = [1, 1, 2, 3]
+
+
+def encode_network_diff(diff):
+    """Encodes a diff dictionary (as loaded from the json file) into the flat int32 array."""
+    timesteps = sorted(diff, key=int)
+    n = len(timesteps)
+
+    index = np.zeros((n, 6), dtype=np.int64)
+    payload = []
+    position = HEADER_LENGTH + 6 * n
+    max_node = 0
+
+    for i, t in enumerate(timesteps):
+        d = diff[t]
+        index[i, 0] = int(t)
+
+        sections = [
+            d['nodes_to_remove'],
+            d['nodes_to_add'],
+            [node for e in d['edges_to_add'] for node in e],
+            [v for e in d['edges_to_increment'] for v in (e[0][0], e[0][1], e[1])]
+        ]
+        for s, values in enumerate(sections):
+            index[i, s + 1] = position
+            payload.extend(values)
+            position += len(values)
+        index[i, 5] = position
+
+        if d['nodes_to_add']:
+            max_node = max(max_node, max(d['nodes_to_add']))
+
+    header = np.array([FORMAT_VERSION, n, max_node], dtype=np.int64)
+    return np.concatenate([header, index.ravel(), np.asarray(payload, dtype=np.int64)]).astype(np.int32)
+
+
+def binary_diff_path(sub_dir, allocator, rep, data_dir=DATA_DIR):
+    return replicate_path(sub_dir, allocator, 'network_diff_rep_%d.npy' % rep, data_dir)
+
+
+def convert_network_diffs(data_dir=DATA_DIR, verbose=True):
+    """One-off conversion of every network_dfference_rep_N.json under data_dir."""
+    converted = 0
+    for sub_dir, allocator, rep in list_replicates(data_dir):
+        json_path = replicate_path(sub_dir, allocator, 'network_dfference_rep_%d.json' % rep, data_dir)
+        if not os.path.isfile(json_path):
+            continue
+
+        with open(json_path, 'r') as in_file:
+            diff = json.load(in_file)
+        np.save(binary_diff_path(sub_dir, allocator, rep, data_dir), encode_network_diff(diff))
+        converted += 1
+
+    if verbose:
+        print("Converted %d network difference files." % converted)
+
+
+class NetworkDiff:
+    """
+    Read-only view of a binary network diff file. Indexing with a timestep (int or str, as for the
+    json dictionary) returns that timestep's diff in the json layout; arrays() returns it as NumPy
+    arrays instead.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = np.load(path, mmap_mode='r')
+
+        version, n, self.max_node = (int(v) for v in self.data[:HEADER_LENGTH])
+        if version != FORMAT_VERSION:
+            raise ValueError("Unsupported network diff format version %d in %s" % (version, path))
+
+        index = np.array(self.data[HEADER_LENGTH:HEADER_LENGTH + 6 * n]).reshape(n, 6)
+        self.offsets = {int(row[0]): row[1:] for row in index}
+
+    def __reduce__(self):
+        return self.__class__, (self.path,)
+
+    def __deepcopy__(self, memo):
+        # The view is read-only, so copies can share it.
+        return self
+
+    def __contains__(self, timestep):
+        return int(timestep) in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def keys(self):
+        return [str(t) for t in sorted(self.offsets)]
+
+    def arrays(self, timestep):
+        offsets = self.offsets[int(timestep)]
+        return {
+            name: np.array(self.data[offsets[s]:offsets[s + 1]]).reshape(-1, width) if width > 1
+            else np.array(self.data[offsets[s]:offsets[s + 1]])
+            for s, (name, width) in enumerate(zip(SECTIONS, SECTION_WIDTHS))
+        }
+
+    def __getitem__(self, timestep):
+        d = self.arrays(timestep)
+        return {
+            'nodes_to_remove': d['nodes_to_remove'].tolist(),
+            'nodes_to_add': d['nodes_to_add'].tolist(),
+            'edges_to_add': d['edges_to_add'].tolist(),
+            'edges_to_increment': [[[u, v], inc] for u, v, inc in d['edges_to_increment'].tolist()]
+        }
+
+    def get(self, timestep, default=None):
+        return self[timestep] if timestep in self else default
+
+
+def diff_arrays(diff, timestep):
+    """The diff for one timestep as NumPy arrays (as NetworkDiff.arrays), for either form of diff."""
+    if isinstance(diff, NetworkDiff):
+        return diff.arrays(timestep)
+
+    d = diff[str(timestep)]
+    return {
+        'nodes_to_remove': np.array(d['nodes_to_remove'], dtype=np.int64),
+        'nodes_to_add': np.array(d['nodes_to_add'], dtype=np.int64),
+        'edges_to_add': np.array(d['edges_to_add'], dtype=np.int64).reshape(-1, 2),
+        'edges_to_increment': np.array(
+            [(e[0][0], e[0][1], e[1]) for e in d['edges_to_increment']], dtype=np.int64
+        ).reshape(-1, 3)
+    }
+
+
+def max_node_label(diff):
+    """Largest node label added over the whole diff (for either the json dictionary or a NetworkDiff)."""
+    if isinstance(diff, NetworkDiff):
+        return diff.max_node
+    return max(
+        max(value["nodes_to_add"])
+        if value["nodes_to_add"]
+        else 0
+        for value in diff.values()
+    )
+
+
+def open_network_diff(path):
+    """A NetworkDiff for a binary diff file, or the dictionary parsed from a json file."""
+    if path.endswith('.npy'):
+        return NetworkDiff(path)
+
+    with open(path, 'r') as in_file:
+        return json.load(in_file)
+
+
+def load_network_diff(sub_dir, allocator, rep, data_dir=DATA_DIR):
+    """Loads the binary diff if it has been converted, otherwise falls back to parsing the json file."""
+    path = binary_diff_path(sub_dir, allocator, rep, data_dir)
+    if not os.path.isfile(path):
+        path = replicate_path(sub_dir, allocator, 'network_dfference_rep_%d.json' % rep, data_dir)
+    return open_network_diff(path)
@@ -0,0 +1,169 @@
+"""
+Pre-rendered social network frames.
+
+The frames for every timestep of a replicate are rendered once, offline, with the same NetworkRenderer
+that the Simulation page uses for live rendering. They are saved as palette-compressed PNGs in
+network_frames_rep_N.zip next to the model data, and the Simulation page serves them from there when the
+file exists and was rendered at the configured DPI by the current renderer: the archive's meta.json
+records both (see network_render.RENDERER_VERSION).
+
+Build with:  python data_pipeline.py frames
+(By default only the replicates used by the parameter presets are rendered: the frames of one replicate
+take up to about 25 MB at the default DPI, depending on how dense its network becomes.)
+"""
+import os
+import json
+import zipfile
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+
+from .data_paths import DATA_DIR, ALLOCATOR_DIRS, get_sub_dir, list_replicates, replicate_path
+from .network_diff import load_network_diff
+
+PALETTE_COLOURS = 32
+META_FILE = 'meta.json'
+
+
+def frames_path(sub_dir, allocator, rep, data_dir=DATA_DIR):
+    return replicate_path(sub_dir, allocator, 'network_frames_rep_%d.zip' % rep, data_dir)
+
+
+def frame_name(timestep):
+    return 'frame_%03d.png' % timestep
+
+
+def compress_frame(png):
+    from PIL import Image
+
+    buf = BytesIO()
+    Image.open(BytesIO(png)).convert('RGB').quantize(PALETTE_COLOURS).save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+
+def render_replicate_frames(sub_dir, allocator, rep, data_dir=DATA_DIR, dpi=100):
+    # (Imported here, as the app itself only reads the frames.)
+    import networkx as nx
+    from .network_replay import NetworkReplay
+    from .network_render import RENDERER_VERSION, NetworkRenderer
+
+    init = nx.read_multiline_adjlist(
+        replicate_path(sub_dir, allocator, 'network_rep_%d_timestep_1.adjlist' % rep, data_dir)
+    )
+    diff = load_network_diff(sub_dir, allocator, rep, data_dir)
+    replay = NetworkReplay(init, diff)
+    renderer = NetworkRenderer(replay.G.capacity - 1, dpi=dpi)
+
+    path = frames_path(sub_dir, allocator, rep, data_dir)
+    with zipfile.ZipFile(path + '.tmp', 'w', compression=zipfile.ZIP_STORED) as ofile:
+        ofile.writestr(META_FILE, json.dumps({'dpi': dpi, 'renderer_version': RENDERER_VERSION}))
+        for timestep in range(len(diff) + 1):
+            replay.seek(timestep)
+            ofile.writestr(frame_name(timestep), compress_frame(renderer.render(replay.G, replay.turnover_count)))
+    os.replace(path + '.tmp', path)
+
+    return path
+
+
+def preset_replicates(data_dir=DATA_DIR):
+    from config import Config
+    config = Config()
+
+    selected = set()
+    for preset, parameters in config.simulation_presets.items():
+        selected.add((
+            get_sub_dir(
+                parameters['project_count'], parameters['dept_workload'], parameters['budget_func'],
+                parameters['skill_decay'], parameters['train_load'], preset_e=(preset == 'E')
+            ),
+            ALLOCATOR_DIRS[parameters['team_allocation']]
+        ))
+
+    return [
+        (sub_dir, allocator, rep) for sub_dir, allocator, rep in list_replicates(data_dir)
+        if (sub_dir, allocator) in selected
+    ]
+
+
+def frames_match(path, dpi, renderer_version):
+    with NetworkFrames(path) as frames:
+        return frames.matches(dpi, renderer_version)
+
+
+def build_network_frames(data_dir=DATA_DIR, replicates=None, dpi=None, processes=None, verbose=True):
+    """
+    Renders the frame cache for each replicate (default: those used by the presets). Replicates whose
+    cache is newer than their network data, and was rendered at dpi by the current renderer, are skipped,
+    so an interrupted build can be resumed.
+    """
+    from .network_render import RENDERER_VERSION
+
+    if dpi is None:
+        from config import Config
+        dpi = Config().config_params['network_plot_dpi']
+
+    if replicates is None:
+        replicates = preset_replicates(data_dir)
+
+    outstanding = []
+    for sub_dir, allocator, rep in replicates:
+        path = frames_path(sub_dir, allocator, rep, data_dir)
+        source = replicate_path(sub_dir, allocator, 'network_dfference_rep_%d.json' % rep, data_dir)
+        if os.path.isfile(source) and (
+                not os.path.isfile(path) or os.path.getmtime(path) < os.path.getmtime(source)
+                or not frames_match(path, dpi, RENDERER_VERSION)
+        ):
+            outstanding.append((sub_dir, allocator, rep))
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(render_replicate_frames, sub_dir, allocator, rep, data_dir, dpi)
+            for sub_dir, allocator, rep in outstanding
+        ]
+        for future in futures:
+            path = future.result()
+            if verbose:
+                print("Rendered %s" % path)
+
+    if verbose:
+        print("Rendered frames for %d of %d replicates." % (len(outstanding), len(replicates)))
+
+
+class NetworkFrames:
+    """Read-only access to the cached PNG frames of one replicate, indexed by timestep."""
+
+    def __init__(self, path):
+        self.path = path
+        self.archive = zipfile.ZipFile(path, 'r')
+        self.names = set(self.archive.namelist())
+        # (Caches built before the meta data was recorded have none, and match nothing.)
+        self.meta = json.loads(self.archive.read(META_FILE)) if META_FILE in self.names else {}
+
+    def matches(self, dpi, renderer_version):
+        """Whether the frames were rendered at dpi by that version of NetworkRenderer."""
+        return self.meta.get('dpi') == dpi and self.meta.get('renderer_version') == renderer_version
+
+    def close(self):
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __reduce__(self):
+        return self.__class__, (self.path,)
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __contains__(self, timestep):
+        return frame_name(timestep) in self.names
+
+    def __getitem__(self, timestep):
+        return self.archive.read(frame_name(timestep))
+
+
+def load_network_frames(sub_dir, allocator, rep, data_dir=DATA_DIR):
+    path = frames_path(sub_dir, allocator, rep, data_dir)
+    return NetworkFrames(path) if os.path.isfile(path) else None
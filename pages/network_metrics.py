@@ -0,0 +1,81 @@
+"""
+Per-timestep network statistics (largest component size, isolates, turnover, edges drawn) in
+network_metrics_rep_N.pickle, merged into model_vars as ordinary columns, and the largest component
+membership as a (timesteps, node labels) boolean array in network_components_rep_N.npy.
+
+Build with:  python data_pipeline.py network_metrics
+(Before the store stage, so that the store includes the metrics.)
+"""
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+from .data_paths import DATA_DIR, REPLICATE_FILES, list_replicates, replicate_path
+from .network_diff import load_network_diff
+from .network_replay import NetworkReplay
+
+NETWORK_METRICS = ['NetworkSize', 'NetworkIsolates', 'NetworkTurnover', 'NetworkEdges']
+# (As in the network plot label, the isolates are the workers outside the largest component.)
+WORKFORCE_SIZE = 100
+
+
+def replicate_network_metrics(init, diff):
+    """Returns (metrics DataFrame, largest component mask) for every timestep of a replicate's network."""
+    replay = NetworkReplay(init, diff)
+    timesteps = len(diff) + 1
+
+    metrics = np.zeros((timesteps, len(NETWORK_METRICS)), dtype=np.int64)
+    components = np.zeros((timesteps, replay.G.capacity), dtype=bool)
+    for timestep in range(timesteps):
+        replay.seek(timestep)
+        component = replay.G.largest_component()
+        size = int(component.sum())
+
+        components[timestep] = component
+        metrics[timestep] = size, WORKFORCE_SIZE - size, replay.turnover_count, component[replay.G.edges()[0]].sum()
+
+    return pd.DataFrame(metrics, columns=NETWORK_METRICS), components
+
+
+def build_replicate_network_metrics(sub_dir, allocator, rep, data_dir=DATA_DIR):
+    import networkx as nx
+
+    init = nx.read_multiline_adjlist(
+        replicate_path(sub_dir, allocator, REPLICATE_FILES['network'] % rep, data_dir)
+    )
+    metrics, components = replicate_network_metrics(init, load_network_diff(sub_dir, allocator, rep, data_dir))
+
+    with open(replicate_path(sub_dir, allocator, REPLICATE_FILES['network_metrics'] % rep, data_dir), 'wb') as ofile:
+        pickle.dump(metrics, ofile)
+    np.save(replicate_path(sub_dir, allocator, REPLICATE_FILES['network_components'] % rep, data_dir), components)
+
+
+def build_network_metrics(data_dir=DATA_DIR, processes=None, verbose=True):
+    replicates = [
+        (sub_dir, allocator, rep) for sub_dir, allocator, rep in list_replicates(data_dir)
+        if os.path.isfile(replicate_path(sub_dir, allocator, REPLICATE_FILES['network'] % rep, data_dir))
+    ]
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(build_replicate_network_metrics, sub_dir, allocator, rep, data_dir)
+            for sub_dir, allocator, rep in replicates
+        ]
+        for future in futures:
+            future.result()
+
+    if verbose:
+        print("Computed network metrics for %d replicates." % len(replicates))
+
+
+def read_network_metrics(path):
+    with open(path, 'rb') as ifile:
+        return pickle.load(ifile)
+
+
+def merge_network_metrics(model_vars, metrics):
+    """model_vars with the metrics added as columns (aligned by timestep)."""
+    metrics = metrics.iloc[:len(model_vars)].set_axis(model_vars.index[:len(metrics)])
+    return model_vars.join(metrics)
@@ -0,0 +1,94 @@
+"""
+Rendering of the social network frames shown on the Simulation page.
+
+NetworkRenderer keeps one matplotlib figure with persistent artists (a LineCollection for the edges and a
+PathCollection for the nodes). Each frame only replaces the artists' data, taken from NumPy arrays of the
+node positions, before the figure is rasterised to PNG.
+"""
+import numpy as np
+from io import BytesIO
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+
+# Identifies the images that NetworkRenderer produces, so that frame caches rendered by an earlier version
+# are rebuilt rather than served (see network_frames.py). Increment it with any change to the output.
+RENDERER_VERSION = 1
+
+NODE_COLOUR = '#1f78b4'
+FONT = {
+    'family': 'serif',
+    'color': 'black',
+    'weight': 'normal',
+    'size': 13,
+}
+
+
+def circle_x_y(n, grow_circle=0.2):
+    theta = n * np.pi / 50
+    multiplier = 1 + (np.floor(n / 100) * grow_circle)
+    return multiplier * np.cos(theta), multiplier * np.sin(theta)
+
+
+class NetworkRenderer:
+
+    def __init__(
+            self, max_node_count,
+            edge_scale=20, circle_scale=0.2,
+            node_scale=2, figsize=(10, 10), dpi=100
+    ):
+        self.edge_scale = edge_scale
+        self.node_scale = node_scale
+        self.dpi = dpi
+
+        self.positions = np.column_stack(circle_x_y(np.arange(max_node_count + 1), circle_scale))
+        circle_size = 1 + circle_scale * (max_node_count / 100) + 0.1
+
+        self.fig = Figure(figsize=figsize)
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        self.ax.set_xlim([-circle_size, circle_size])
+        self.ax.set_ylim([-circle_size, circle_size])
+        self.ax.tick_params(
+            axis="both", which="both",
+            bottom=False, left=False, labelbottom=False, labelleft=False
+        )
+
+        self.edges = LineCollection([], colors='k', zorder=1)
+        self.ax.add_collection(self.edges)
+        self.nodes = self.ax.scatter([], [], s=[], c=NODE_COLOUR, zorder=2)
+        self.label = self.ax.text(
+            0.62 * circle_size, .85 * circle_size, "",
+            fontdict=FONT,
+            bbox=dict(facecolor='blue', alpha=0.2, boxstyle='round')
+        )
+        self.fig.tight_layout()
+
+    def render(self, G, turnover_count, component=None):
+        """
+        Draws the largest connected component of G (a WorkforceGraph) as PNG bytes. component is its
+        precomputed node mask, if any (see network_metrics.py).
+        """
+        if component is None:
+            component = G.largest_component()
+
+        u, v, widths = G.edges()
+        drawn = component[u]
+        u, v, widths = u[drawn], v[drawn], widths[drawn]
+        nodes = np.flatnonzero(component)
+        degrees = np.bincount(np.concatenate([u, v]), minlength=len(component))[nodes]
+
+        self.nodes.set_offsets(self.positions[nodes])
+        self.nodes.set_sizes(10 + self.node_scale * degrees)
+        self.edges.set_segments(self.positions[np.column_stack([u, v])])
+        self.edges.set_linewidths(widths / self.edge_scale)
+
+        net_size = len(nodes)
+        isolates = 100 - net_size
+        self.label.set_text(
+            "Isolates: %d \nTurnover: %d\nNetwork size: %d" % (isolates, turnover_count, net_size)
+        )
+
+        buf = BytesIO()
+        self.fig.savefig(buf, format="png", dpi=self.dpi)
+        return buf.getvalue()
@@ -0,0 +1,58 @@
+"""
+Replay of the social network through the simulation timesteps.
+
+The network at timestep t is the initial network (timestep 1) with the diffs for timesteps 2, ..., t + 1
+applied in turn. NetworkReplay applies the diffs in place to a WorkforceGraph (see workforce_graph.py)
+and keeps a copy of the network (a keyframe) every keyframe_interval timesteps, so that seeking to any
+timestep costs at most keyframe_interval diff applications once the keyframes have been recorded.
+"""
+from .network_diff import diff_arrays, max_node_label
+from .workforce_graph import WorkforceGraph
+
+KEYFRAME_INTERVAL = 10
+
+
+def node_capacity(init, diff):
+    """Number of node labels needed for a replicate's network (the largest label + 1)."""
+    return max([max_node_label(diff)] + [int(n) for n in init.nodes()]) + 1
+
+
+class NetworkReplay:
+
+    def __init__(self, init, diff, keyframe_interval=KEYFRAME_INTERVAL):
+        self.init = init
+        self.diff = diff
+        self.keyframe_interval = keyframe_interval
+
+        self.G = WorkforceGraph.from_networkx(init, node_capacity(init, diff))
+        self.timestep = 0
+        self.turnover_count = 0
+        self.keyframes = {0: (self.G.copy(), 0)}
+
+    def replays(self, networks):
+        return networks is not None and self.init is networks.get('init') and self.diff is networks.get('diff')
+
+    def step(self):
+        """Advances the network from self.timestep to self.timestep + 1."""
+        d = diff_arrays(self.diff, self.timestep + 2)
+        self.turnover_count += len(d['nodes_to_add'])
+        self.G.apply(**d)
+        self.timestep += 1
+
+        if self.timestep % self.keyframe_interval == 0 and self.timestep not in self.keyframes:
+            self.keyframes[self.timestep] = (self.G.copy(), self.turnover_count)
+
+    def restore(self, keyframe):
+        graph, turnover_count = self.keyframes[keyframe]
+        self.G = graph.copy()
+        self.turnover_count = turnover_count
+        self.timestep = keyframe
+
+    def seek(self, timestep):
+        """Puts the network into its state at timestep, from the nearest recorded state before it."""
+        keyframe = max(k for k in self.keyframes if k <= timestep)
+        if timestep < self.timestep or keyframe > self.timestep:
+            self.restore(keyframe)
+
+        while self.timestep < timestep:
+            self.step()
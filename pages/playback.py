@@ -0,0 +1,73 @@
+"""
+Wall-clock scheduling of the Simulation page playback.
+
+Timestep t of the playback is due at (t - start) * interval after playback starts, whatever the plot and
+network updates cost. The scheduler measures how long each frame takes to draw and, when drawing every
+timestep would fall behind, skips ahead to the timestep that will be due once the frame is drawn. The data
+for skipped timesteps is still delivered: each frame covers a range of timesteps, of which only the last
+is drawn (e.g. the network), while the charts add the rows for the whole range.
+"""
+import time
+
+# Weight of the latest frame in the running estimate of the cost of drawing a frame.
+FRAME_COST_SMOOTHING = 0.5
+
+
+class FrameScheduler:
+
+    def __init__(self, start, stop, interval, clock=time.perf_counter, sleep=time.sleep):
+        """Plays timesteps start to stop (inclusive), one every interval seconds."""
+        self.start = start
+        self.stop = stop
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+
+        self.started_at = None
+        self.elapsed = 0.0
+        self.frame_cost = 0.0
+        self.frames = 0
+        self.dropped = 0
+
+    def due(self, timestep):
+        return self.started_at + (timestep - self.start) * self.interval
+
+    def __iter__(self):
+        """
+        Yields (first, last) for each frame: the timesteps from first to last (inclusive) are due, and the
+        state at last should be drawn. The loop body is timed as the cost of the frame.
+        """
+        self.started_at = self.clock()
+        previous = self.start - 1
+
+        while previous < self.stop:
+            now = self.clock()
+            # The timestep that will be due once this frame has been drawn:
+            on_time = self.start + int((now + self.frame_cost - self.started_at) / self.interval)
+            timestep = min(max(previous + 1, on_time), self.stop)
+
+            wait = self.due(timestep) - self.frame_cost - now
+            if wait > 0:
+                self.sleep(wait)
+
+            self.dropped += timestep - previous - 1
+            frame_start = self.clock()
+            yield previous + 1, timestep
+
+            cost = self.clock() - frame_start
+            if self.frames == 0:
+                self.frame_cost = cost
+            else:
+                self.frame_cost = FRAME_COST_SMOOTHING * cost + (1 - FRAME_COST_SMOOTHING) * self.frame_cost
+            self.frames += 1
+            self.elapsed = self.clock() - self.started_at
+            previous = timestep
+
+    @property
+    def achieved_fps(self):
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    def report(self):
+        return "%.1f frames per second (%d of %d timesteps skipped)" % (
+            self.achieved_fps, self.dropped, self.frames + self.dropped
+        )
@@ -0,0 +1,150 @@
+"""
+Background loading of the other replicates of the Simulation page selection and of the combinations one
+step away from it, into the shared data cache.
+
+A session's prefetches in the cache or in flight are limited to config_params['prefetch_mb']. Queued loads
+that are no longer wanted are cancelled.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .catalog import get_catalog
+from .data_cache import get_data_cache
+from .data_paths import ALLOCATOR_DIRS, get_sub_dir
+from .metrics import PREFETCH_LOADS
+from .utilities import load_replicate
+
+# The files read by a load with networks (see utilities.read_replicate), for estimating its size.
+LOADED_FILES = ['model_vars', 'roi', 'network', 'network_diff', 'network_diff_json', 'network_metrics']
+
+_executor = None
+
+
+def get_executor(max_workers=2):
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='prefetch')
+    return _executor
+
+
+def option_index(options, value):
+    """Position of value in options (the nearest one for numbers, e.g. slider values)."""
+    if value in options:
+        return options.index(value)
+    return int(np.argmin([abs(option - value) for option in options]))
+
+
+def neighbour_selections(selection, options):
+    """The selections that differ from selection by one step (to an adjacent option) of one parameter."""
+    neighbours = []
+    for key, values in options.items():
+        i = option_index(values, selection[key])
+        for j in (i - 1, i + 1):
+            if 0 <= j < len(values):
+                neighbours.append(dict(selection, **{key: values[j]}))
+    return neighbours
+
+
+def selection_key(selection, preset_e=False):
+    """(sub_dir, allocator) for a sidebar selection (see simulation.SELECTION_KEYS)."""
+    parameters = dict(selection)
+    allocator = ALLOCATOR_DIRS[parameters.pop('team_allocation')]
+    return get_sub_dir(preset_e=preset_e, **parameters), allocator
+
+
+class Prefetcher:
+    """The prefetches of one session."""
+
+    def __init__(self, config):
+        self.workers = config.config_params['prefetch_workers']
+        self.max_bytes = config.config_params['prefetch_mb'] * 2 ** 20
+        self.max_rep = config.config_params['max_replicates']
+        # key -> future, and key -> (future, estimated size)
+        self.futures = {}
+        self.submitted = {}
+
+    def wanted(self, selection, rep, options, preset_e=False):
+        """The replicates to prefetch for selection, in order of priority (without duplicates)."""
+        sub_dir, allocator = selection_key(selection, preset_e)
+        catalog = get_catalog()
+
+        replicates = catalog.replicates(sub_dir, allocator) if catalog is not None else range(self.max_rep)
+        keys = [(sub_dir, allocator, r) for r in replicates if r < self.max_rep and r != rep]
+        # (A change of the selection reloads replicate 0.)
+        keys += [selection_key(neighbour, preset_e) + (0,) for neighbour in neighbour_selections(selection, options)]
+
+        keys = list(dict.fromkeys(keys))
+        if catalog is not None:
+            keys = [key for key in keys if catalog.has(*key)]
+        return keys
+
+    def estimate(self, key, cache):
+        """Estimated size in the cache of the replicate key (with networks), or None if there is no basis."""
+        size = cache.size(key + (True,))
+        if size is None:
+            stats = cache.stats()
+            size = stats['bytes'] / stats['entries'] if stats['entries'] else None
+        if size is None:
+            catalog = get_catalog()
+            files = catalog.files(*key) if catalog is not None else None
+            if files:
+                size = sum(files.get(kind, 0) for kind in LOADED_FILES)
+        return size
+
+    def held_bytes(self, cache):
+        """Estimated size of the session's prefetches that are still loading or in the cache."""
+        held = 0
+        for key, (future, estimate) in list(self.submitted.items()):
+            if not future.done():
+                held += estimate
+                continue
+            size = cache.size(key + (True,)) if not future.cancelled() else None
+            if size is None:
+                del self.submitted[key]
+            else:
+                held += size
+        return held
+
+    def update(self, selection, rep, options, preset_e=False):
+        """Starts prefetching for a new selection, and cancels the queued loads that are no longer wanted."""
+        if self.workers == 0 or self.max_bytes == 0:
+            return
+
+        cache = get_data_cache()
+        wanted = [key for key in self.wanted(selection, rep, options, preset_e) if key + (True,) not in cache]
+
+        for key, future in self.futures.items():
+            if key not in wanted and future.cancel():
+                PREFETCH_LOADS.labels('cancelled').inc()
+
+        current = selection_key(selection, preset_e) + (rep,)
+        estimate = self.estimate(current, cache)
+        if estimate is None:
+            return
+        budget = self.max_bytes - self.held_bytes(cache)
+
+        executor = get_executor(self.workers)
+        futures = {}
+        over_budget = 0
+        for key in wanted:
+            future = self.futures.get(key)
+            if future is not None and not future.done():
+                # Already submitted (and counted).
+                futures[key] = future
+                continue
+            if estimate > budget:
+                over_budget += 1
+                continue
+
+            future = executor.submit(load_replicate, *key)
+            PREFETCH_LOADS.labels('submitted').inc()
+            self.submitted[key] = (future, estimate)
+            budget -= estimate
+            futures[key] = future
+
+        PREFETCH_LOADS.labels('over_budget').inc(over_budget)
+        self.futures = futures
+
+    def pending(self):
+        return sum(not future.done() for future in self.futures.values())
@@ -0,0 +1,84 @@
+"""
+Background loading of the preset simulations, on a process-wide thread pool.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .data_paths import ALLOCATOR_DIRS, get_sub_dir
+from .metrics import PRELOAD_SECONDS
+
+_executor = None
+
+
+def get_executor(max_workers=4):
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='preload')
+    return _executor
+
+
+def preload_replicate(preset, sub_dir, allocator, rep):
+    # (Imported on the worker threads, off the first page's import path.)
+    from .utilities import load_replicate
+
+    with PRELOAD_SECONDS.labels(preset).time():
+        # (The Comparison page only needs model_vars.)
+        return load_replicate(sub_dir, allocator, rep, load_networks='lazy')
+
+
+class PresetPreload:
+
+    def __init__(self, config):
+        executor = get_executor(config.config_params['preload_workers'])
+
+        self.started_at = time.perf_counter()
+        self.futures = {}
+        for preset, parameters in config.simulation_presets.items():
+            sub_dir = get_sub_dir(
+                parameters['project_count'], parameters['dept_workload'], parameters['budget_func'],
+                parameters['skill_decay'], parameters['train_load'], preset_e=(preset == 'E')
+            )
+            allocator = ALLOCATOR_DIRS[parameters['team_allocation']]
+
+            self.futures[preset] = {
+                rep: executor.submit(preload_replicate, preset, sub_dir, allocator, rep)
+                for rep in range(config.config_params['max_replicates'])
+            }
+
+    def progress(self, preset):
+        futures = self.futures[preset].values()
+        return sum(f.done() for f in futures) / len(futures)
+
+    def preset_ready(self, preset):
+        return all(f.done() for f in self.futures[preset].values())
+
+    def ready_presets(self):
+        return [preset for preset in self.futures if self.preset_ready(preset)]
+
+    def complete(self):
+        return len(self.ready_presets()) == len(self.futures)
+
+    def elapsed(self):
+        return time.perf_counter() - self.started_at
+
+    def collect(self, comparison_data):
+        """Copies finished loads into comparison_data. Returns the presets that became complete."""
+        newly_ready = []
+        for preset, futures in self.futures.items():
+            if not self.preset_ready(preset):
+                continue
+            if not all(comparison_data[preset][rep] for rep in futures):
+                for rep, future in futures.items():
+                    comparison_data[preset][rep] = future.result()
+                newly_ready.append(preset)
+
+        return newly_ready
+
+    def wait_until_complete(self, on_progress=None):
+        """Blocks until all of the presets have finished loading. on_progress is called after every load."""
+        pending = [f for futures in self.futures.values() for f in futures.values() if not f.done()]
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            if on_progress is not None:
+                on_progress()
@@ -0,0 +1,193 @@
+"""
+All of the simulation results as one labelled N-dimensional array, built offline from the columnar store
+(see model_store.py).
+
+The cube is indexed by (project_count, skill_decay, dept_workload, train_load, budget_func, preset_e,
+allocator, rep, timestep, variable), with one coordinate for every value of each parameter that occurs in
+the data. It is saved as float32 in store/cube.npy (memory-mapped when loaded), with an explicit mask of
+the cells, i.e. (parameters, allocator, rep), that have data in store/cube_mask.npy: the missing cells,
+and any timesteps past the end of a shorter simulation, are NaN. The coordinates are listed in
+store/cube.json. The variables are those of the store (so they include the network metrics if that stage
+has run).
+
+Selections are made by label with ResultsCube.sel (a scalar label drops the dimension, a list of labels
+keeps it) and are reduced over dimensions with CubeView.mean, which skips the missing cells. A query over
+any set of combinations is then a few array operations rather than one load per replicate. (Values are
+float32, as in the aggregates, so means may differ from those of the float64 model_vars in the last
+digits.)
+
+Build with:  python data_pipeline.py store cube
+"""
+import os
+import json
+import warnings
+import numpy as np
+import pandas as pd
+
+from .data_paths import ALLOCATOR_DIRS, PRESET_E_PARAMETERS
+from .model_store import STORE_DIR, ModelStore
+
+CUBE_FILE = 'cube.npy'
+CUBE_MASK_FILE = 'cube_mask.npy'
+CUBE_INDEX_FILE = 'cube.json'
+# The dimensions of a cell, i.e. of one replicate simulation. Each cell holds (timestep, variable) values.
+CELL_DIMENSIONS = [
+    'project_count', 'skill_decay', 'dept_workload', 'train_load', 'budget_func', 'preset_e', 'allocator', 'rep'
+]
+
+
+def build_results_cube(store_dir=STORE_DIR, verbose=True):
+    store = ModelStore(store_dir)
+
+    coords = {dim: sorted(set(row[dim] for row in store.rows)) for dim in CELL_DIMENSIONS}
+    cell_shape = tuple(len(coords[dim]) for dim in CELL_DIMENSIONS)
+    # The position of each store row in the cube:
+    cells = tuple(
+        np.array([coords[dim].index(row[dim]) for row in store.rows], dtype=np.intp)
+        for dim in CELL_DIMENSIONS
+    )
+    # (The store pads shorter simulations with 0 for integer variables.)
+    past_end = np.arange(store.timesteps) >= np.array([row['length'] for row in store.rows])[:, None]
+
+    cube = np.full(cell_shape + (store.timesteps, len(store.variables)), np.nan, dtype=np.float32)
+    for v, variable in enumerate(store.variables):
+        values = np.asarray(store.array(variable), dtype=np.float32)
+        values[past_end] = np.nan
+        cube[cells + (slice(None), v)] = values
+
+    mask = np.zeros(cell_shape, dtype=bool)
+    mask[cells] = True
+
+    np.save(os.path.join(store_dir, CUBE_FILE), cube)
+    np.save(os.path.join(store_dir, CUBE_MASK_FILE), mask)
+    # The index is written last so that a partially written cube is never picked up by the app.
+    with open(os.path.join(store_dir, CUBE_INDEX_FILE), 'w') as ofile:
+        json.dump({'coords': coords, 'timesteps': store.timesteps, 'variables': store.variables}, ofile)
+
+    if verbose:
+        print(
+            "Wrote a %s cube (%.1f MB, %d of %d cells with data) to %s"
+            % (' x '.join(str(n) for n in cube.shape), cube.nbytes / 2 ** 20, mask.sum(), mask.size, store_dir)
+        )
+
+
+def cell_labels(project_count, dept_workload, budget_func, skill_decay, train_load, team_allocation,
+                preset_e=False):
+    """The cube labels of a parameter combination and team allocation method (cf. data_paths.get_sub_dir)."""
+    labels = dict(
+        project_count=project_count, dept_workload=dept_workload, budget_func=budget_func,
+        skill_decay=skill_decay, train_load=train_load, preset_e=preset_e,
+        allocator=ALLOCATOR_DIRS[team_allocation]
+    )
+    if preset_e:
+        # (The preset E simulations have their own fixed values of these.)
+        labels.update(PRESET_E_PARAMETERS)
+    return labels
+
+
+def is_scalar(label):
+    return label is not None and not isinstance(label, (list, tuple, np.ndarray))
+
+
+class CubeView:
+    """
+    A labelled selection from the results cube: values (a view of the cube where the selection allows),
+    its dims and coords, and the mask of the cells that have data (over the cell dims that remain).
+    """
+
+    def __init__(self, values, mask, dims, coords):
+        self.values = values
+        self.mask = mask
+        self.dims = dims
+        self.coords = coords
+
+    def position(self, dim, label):
+        labels = self.coords[dim]
+        if label in labels:
+            return labels.index(label)
+        if isinstance(label, float):
+            # Parameter values that went through arithmetic, e.g. slider steps.
+            close = [i for i, other in enumerate(labels) if np.isclose(other, label)]
+            if close:
+                return close[0]
+        raise KeyError("The results cube has no %s = %r" % (dim, label))
+
+    def sel(self, **labels):
+        """
+        Selects by label: a scalar drops the dimension, a list keeps it with those labels (in that order).
+        The dimensions not mentioned are kept whole.
+        """
+        for dim in labels:
+            if dim not in self.dims:
+                raise KeyError("The results cube has no dimension '%s'" % dim)
+
+        # Scalars first, with basic indexing (a view), then the lists one axis at a time.
+        values, mask = self.values, self.mask
+        index = tuple(self.position(dim, labels[dim]) if is_scalar(labels.get(dim)) else slice(None)
+                      for dim in self.dims)
+        values = values[index]
+        mask = mask[index[:mask.ndim]]
+        dims = [dim for dim in self.dims if not is_scalar(labels.get(dim))]
+
+        coords = {dim: self.coords[dim] for dim in dims}
+        for dim in dims:
+            if dim in labels:
+                positions = [self.position(dim, label) for label in labels[dim]]
+                axis = dims.index(dim)
+                values = np.take(values, positions, axis=axis)
+                if axis < mask.ndim:
+                    mask = np.take(mask, positions, axis=axis)
+                coords[dim] = list(labels[dim])
+
+        return CubeView(values, mask, dims, coords)
+
+    def mean(self, *dims):
+        """Mean over the given dims, of the cells that have data (NaN where none of them has)."""
+        axes = tuple(self.dims.index(dim) for dim in dims)
+        with warnings.catch_warnings():
+            # (All-NaN slices, i.e. combinations without data, are expected.)
+            warnings.simplefilter('ignore', RuntimeWarning)
+            values = np.nanmean(self.values, axis=axes)
+
+        cell_axes = tuple(axis for axis in axes if axis < self.mask.ndim)
+        mask = self.mask.any(axis=cell_axes) if cell_axes else self.mask
+        remaining = [dim for dim in self.dims if dim not in dims]
+        return CubeView(values, mask, remaining, {dim: self.coords[dim] for dim in remaining})
+
+    def frame(self):
+        """A (timestep, variable) selection as a DataFrame like model_vars (with a 'time' column)."""
+        if self.dims != ['timestep', 'variable']:
+            raise ValueError("Only a (timestep, variable) selection can be a frame, not %s" % (self.dims,))
+        data = pd.DataFrame(np.asarray(self.values, dtype=np.float64), columns=self.coords['variable'])
+        data['time'] = data.index
+        return data
+
+
+class ResultsCube(CubeView):
+
+    def __init__(self, store_dir=STORE_DIR):
+        with open(os.path.join(store_dir, CUBE_INDEX_FILE), 'r') as ifile:
+            index = json.load(ifile)
+
+        coords = dict(index['coords'])
+        coords['timestep'] = list(range(index['timesteps']))
+        coords['variable'] = index['variables']
+        super().__init__(
+            np.load(os.path.join(store_dir, CUBE_FILE), mmap_mode='r'),
+            np.load(os.path.join(store_dir, CUBE_MASK_FILE)),
+            CELL_DIMENSIONS + ['timestep', 'variable'],
+            coords
+        )
+        # Changes whenever the cube is rebuilt.
+        self.version = os.stat(os.path.join(store_dir, CUBE_FILE)).st_mtime_ns
+
+
+_results_cube = None
+
+
+def get_results_cube(store_dir=STORE_DIR):
+    """Process-wide ResultsCube, or None if the cube has not been built."""
+    global _results_cube
+    if _results_cube is None and os.path.isfile(os.path.join(store_dir, CUBE_INDEX_FILE)):
+        _results_cube = ResultsCube(store_dir)
+    return _results_cube
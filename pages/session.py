@@ -0,0 +1,50 @@
+"""
+Session state set-up shared by the application and the pages.
+
+This module only depends on Streamlit, so that the application can prepare a session without importing
+the pages (and their dependencies) that the session may not visit.
+"""
+import streamlit as st
+
+
+def create_session_state_variables():
+    if 'config' not in st.session_state:
+        from config import Config
+        st.session_state.config = Config()
+
+    if 'team_allocation' not in st.session_state:
+        st.session_state.team_allocation = "Random"
+
+    if 'replicate' not in st.session_state:
+        st.session_state.replicate = 0
+
+    if 'preset_active' not in st.session_state:
+        st.session_state.preset_active = False
+
+    if 'preset' not in st.session_state:
+        st.session_state.preset = None
+
+    if 'simulation_data' not in st.session_state:
+        st.session_state.simulation_data = {
+            'model_vars': None,
+            'networks': None
+        }
+
+    if 'display_net' not in st.session_state:
+        st.session_state.display_net = False
+
+    if 'data_load_complete' not in st.session_state:
+        st.session_state.data_load_complete = True
+
+
+def set_default_parameters():
+    if st.session_state.preset_active:
+        parameter_dict = st.session_state.config.simulation_presets[st.session_state.preset]
+        for key, value in parameter_dict.items():
+            st.session_state[key] = value
+
+    else:
+        parameter_dict = st.session_state.config.default_simulation_parameters
+        for key, value in parameter_dict.items():
+            if key not in st.session_state:
+                st.session_state[key] = value
@@ -1,13 +1,20 @@
 import streamlit as st
 import altair as alt
 import time
+import logging
 import numpy as np
-import networkx as nx
-import matplotlib.pyplot as plt
-from io import BytesIO
-import copy
 
 from .utilities import load_models
+from .session import set_default_parameters
+from .catalog import get_catalog
+from .data_paths import ALLOCATOR_DIRS, get_sub_dir
+from .network_replay import NetworkReplay
+from .network_render import RENDERER_VERSION, NetworkRenderer
+from .client_playback import client_playback
+from .chart_data import PlotSeries, available_plots
+from .playback import FrameScheduler
+from .prefetch import Prefetcher
+from .metrics import DRAW_GRAPH_SECONDS, PLAYBACK_FPS, PLAYBACK_FRAME_SECONDS, PLAYBACK_SKIPPED_TIMESTEPS
 
 
 @st.cache()
@@ -84,6 +91,72 @@ def handle_network_click():
     st.session_state.display_net = ~st.session_state.display_net
 
 
+def time_series_chart(chart_data, domain, range_, y_label, axis_scrolling=False):
+
+    _x = (
+        alt.X('time', axis=alt.Axis(title='timestep'))
+        if axis_scrolling else
+        alt.X('time', axis=alt.Axis(title='timestep'), scale=alt.Scale(domain=[0, 100]))
+    )
+
+    base = alt.Chart(chart_data)
+    points = base.mark_point(filled=True, size=40)
+    line = base.mark_line()
+
+    return (line + points).encode(
+        x=_x,
+        y=alt.Y('value', axis=alt.Axis(title=y_label)),
+        color=alt.Color('variable', scale=alt.Scale(domain=domain, range=range_)),
+        tooltip=['description', alt.Tooltip('value', format='.2f')]
+    )
+
+
+def combined_time_series_chart(chart_data, plots, width=600, height=200):
+    """
+    All of the plots (config.simulation_plots) as panels of one chart, drawn from a single long-format
+    dataset in which the 'plot' column selects the rows of each panel.
+    """
+    panels = [
+        time_series_chart(alt.Undefined, details['column_names'], details['column_colours'], details['y_label'])
+        .transform_filter(alt.datum.plot == plot)
+        .properties(title=plot, width=width, height=height)
+        for plot, details in plots.items()
+    ]
+    return alt.vconcat(*panels, data=chart_data).resolve_scale(y='independent', color='independent')
+
+
+def get_combined_plot_series(data_key):
+    """The plot series of the loaded data combined into one (kept in the session state for that data)."""
+    cached = st.session_state.get('combined_plot_series')
+    if cached is None or cached[0] != data_key:
+        cached = (data_key, PlotSeries.combine(st.session_state.simulation_data['plot_series']))
+        st.session_state.combined_plot_series = cached
+    return cached[1]
+
+
+class CombinedTimeSeriesPlot:
+    """
+    Alternative to one TimeSeriesPlot per plot (config_params['simulation_layout'] = 'combined'): a single
+    chart, so that each timestep is one add_rows that updates every panel.
+    """
+
+    def __init__(self, plots, data_key):
+
+        with st.expander("About these plots"):
+            for plot, details in plots.items():
+                st.write("**%s:** %s" % (plot, details['info']))
+
+        self.series = get_combined_plot_series(data_key)
+        chart = combined_time_series_chart(self.series.rows(0, st.session_state.global_time), plots)
+        self.chart = st.altair_chart(chart)
+
+    def update(self, timestep, first=None):
+        """Adds the rows for timesteps first (default: timestep) to timestep."""
+        self.chart.add_rows(
+            self.series.rows(timestep if first is None else first, timestep)
+        )
+
+
 class TimeSeriesPlot:
 
     def __init__(
@@ -114,58 +187,112 @@ class TimeSeriesPlot:
 
         self.domain = [s for s in column_selection]
         self.range_ = [domain_colours[d] for d in self.domain]
-        self.plot_series = ['time'] + [s for s in column_selection]
-        # note: updating 'selection' was messing with the contents of the slider variables
-        # hence creation of a new list 'plot_series'
-
-        _x = (
-            alt.X('time', axis=alt.Axis(title='timestep'))
-            if axis_scrolling else
-            alt.X('time', axis=alt.Axis(title='timestep'), scale=alt.Scale(domain=[0, 100]))
-        )
+        # The plot's columns in long format, prepared when the data was loaded (see chart_data.PlotSeries):
+        self.series = st.session_state.simulation_data['plot_series'][plot_name]
 
-        chart_data = st.session_state.simulation_data['model_vars'].loc[
-                     0:st.session_state.global_time,
-                     self.plot_series
-                     ].melt('time')
-
-        chart_data['description'] = [
-            st.session_state.config.simulation_variables.get(v, '(undefined)')
-            for v in chart_data.variable
-        ]
-
-        base = alt.Chart(chart_data)
-        points = base.mark_point(filled=True, size=40)
-        line = base.mark_line()
-
-        chart = (line + points).encode(
-            x=_x,
-            y=alt.Y('value', axis=alt.Axis(title=y_label)),
-            color=alt.Color('variable', scale=alt.Scale(domain=self.domain, range=self.range_)),
-            tooltip=['description', alt.Tooltip('value', format='.2f')]
+        chart = time_series_chart(
+            self.series.rows(0, st.session_state.global_time),
+            self.domain, self.range_, y_label, axis_scrolling
         )
         self.chart = st.altair_chart(chart, use_container_width=True)
 
-    def update(self, timestep):
-
-        chart_data = (
-            st.session_state.simulation_data['model_vars']
-              .loc[timestep:timestep, self.plot_series].melt('time')
+    def update(self, timestep, first=None):
+        """Adds the rows for timesteps first (default: timestep) to timestep."""
+        self.chart.add_rows(
+            self.series.rows(timestep if first is None else first, timestep)
         )
 
-        chart_data['description'] = [
-            st.session_state.config.simulation_variables.get(v, '(undefined)')
-            for v in chart_data.variable
-        ]
-        self.chart.add_rows(
-            chart_data
+
+def simulation_plots():
+    """The plots of config.simulation_plots that the loaded data can show."""
+    return available_plots(st.session_state.config.simulation_plots, st.session_state.simulation_data['model_vars'])
+
+
+def simulation_data_key():
+    """Identifies the loaded simulation data (parameter values and replicate)."""
+    return repr((
+        st.session_state.project_count, st.session_state.dept_workload, st.session_state.budget_func,
+        st.session_state.skill_decay, st.session_state.train_load, st.session_state.team_allocation,
+        preset_e_selected(), int(st.session_state.replicate)
+    ))
+
+
+def client_playback_plots(data_key):
+    """
+    Vega-Lite specs of the time series plots with the complete series, for client-side playback. These are
+    kept in the session state until different data is loaded.
+    """
+    cached = st.session_state.get('client_playback_plots')
+    if cached is not None and cached[0] == data_key:
+        return cached[1]
+
+    plots = []
+    if st.session_state.config.config_params['simulation_layout'] == 'combined':
+        chart = combined_time_series_chart(
+            get_combined_plot_series(data_key).data, simulation_plots()
         )
+        plots.append({
+            'title': '',
+            'info': '',
+            'spec': chart.transform_filter('datum.time <= t').to_dict()
+        })
+    else:
+        for plot, details in simulation_plots().items():
+            chart = time_series_chart(
+                st.session_state.simulation_data['plot_series'][plot].data,
+                details['column_names'], details['column_colours'], details['y_label']
+            )
+            plots.append({
+                'title': plot,
+                'info': details['info'],
+                'spec': chart.transform_filter('datum.time <= t').properties(width='container').to_dict()
+            })
+
+    st.session_state.client_playback_plots = (data_key, plots)
+    return plots
+
+
+def handle_playback_event(event):
+    """Applies a play, pause, seek or end event from client-side playback (once per event)."""
+    if event is None or event['id'] == st.session_state.get('playback_event_id'):
+        return
+
+    st.session_state.playback_event_id = event['id']
+    st.session_state.global_time = event['timestep']
+    st.session_state.playing = event['event'] == 'play'
+
+
+def get_network_replay(networks):
+    """
+    The replay (and its keyframes) is kept in the session state so that it survives reruns, and is
+    only rebuilt when different network data is loaded.
+    """
+    replay = st.session_state.get('network_replay')
+    if replay is None or not replay.replays(networks):
+        replay = NetworkReplay(networks['init'], networks['diff'])
+        st.session_state.network_replay = replay
+    return replay
 
 
-def circle_x_y(n, grow_circle=0.2):
-    theta = n * np.pi / 50
-    multiplier = 1 + (np.floor(n / 100) * grow_circle)
-    return multiplier * np.cos(theta), multiplier * np.sin(theta)
+_stale_frames = set()
+
+
+def usable_frames(frames):
+    """
+    The frame cache, if it was rendered at the configured DPI by the current renderer, otherwise None (so
+    that the network is rendered live). A stale cache is reported once per process.
+    """
+    if frames is None:
+        return None
+    if frames.matches(st.session_state.config.config_params['network_plot_dpi'], RENDERER_VERSION):
+        return frames
+    if frames.path not in _stale_frames:
+        _stale_frames.add(frames.path)
+        logging.getLogger(__name__).warning(
+            "Ignoring the network frame cache %s, which was not rendered with the current DPI and renderer. "
+            "Rebuild it with: python data_pipeline.py frames", frames.path
+        )
+    return None
 
 
 class NetworkPlot:
@@ -177,117 +304,67 @@ class NetworkPlot:
             node_scale=2
     ):
 
-        self.turnover_count = 0
-
-        self.edge_scale = edge_scale
-        self.circle_scale = circle_scale
-        self.node_scale = node_scale
-        self.G = copy.deepcopy(st.session_state.simulation_data['networks'].get('init', ''))
-        self.get_network_at_t(timestep)
-        self.max_node_count = max(
-            max(value["nodes_to_add"])
-            if value["nodes_to_add"]
-            else 0
-            for value in st.session_state.simulation_data['networks']['diff'].values()
-        )
-
-        self.all_pos = {
-            i: circle_x_y(i, self.circle_scale)
-            for i in range(self.max_node_count + 1)
-        }
+        networks = st.session_state.simulation_data['networks']
+        self.timestep = timestep
+        # When the frame cache exists for this replicate the stored frames are served, and the network
+        # is neither replayed nor rendered.
+        self.frames = usable_frames(networks.get('frames'))
+        # (None unless the network metrics have been computed.)
+        self.components = networks.get('components')
+        model_vars = st.session_state.simulation_data['model_vars']
+        self.turnover = model_vars['NetworkTurnover'].to_numpy() if 'NetworkTurnover' in model_vars else None
+
+        if self.frames is None:
+            self.replay = get_network_replay(networks)
+            self.get_network_at_t(timestep)
+            self.max_node_count = self.G.capacity - 1
 
         if st.session_state.display_net:
             st.write(info)
-            self.fig = plt.figure(figsize=(10, 10))
+            if self.frames is None:
+                self.renderer = NetworkRenderer(
+                    self.max_node_count,
+                    edge_scale=edge_scale, circle_scale=circle_scale, node_scale=node_scale,
+                    dpi=st.session_state.config.config_params['network_plot_dpi']
+                )
+                self.all_pos = self.renderer.positions
             self.placeholder = placeholder
             self.draw_graph()
 
+    @property
+    def G(self):
+        return self.replay.G
+
+    @property
+    def turnover_count(self):
+        if self.turnover is not None:
+            return int(self.turnover[self.timestep])
+        return self.replay.turnover_count
+
+    @property
+    def component(self):
+        return self.components[self.timestep] if self.components is not None else None
+
     def update_network(self, timestep):
         """
-        This method assumes that g is in the correct network state for t = timestep-1
+        This method assumes that G is in the correct network state for t = timestep-1
         and returns the updated state at t = timestep
         """
-        # old_widths = {(e[0], e[1]): e[2]['width'] for e in g.edges(data=True)}
-
-        diff = copy.deepcopy(st.session_state.simulation_data['networks'].get('diff', ''))
-        d = diff[str(timestep + 1)]
-
-        for n in d['nodes_to_add']:
-            try:
-                self.turnover_count += 1
-                self.G.add_node(n)
-            except:
-                print("Cannot add node %d" % n)
-        for n in d['nodes_to_remove']:
-            try:
-                self.G.remove_node(n)
-            except:
-                pass
-                # print("Cannot remove node %d" % n)
-        for e in d['edges_to_add']:
-            try:
-                self.G.add_edge(*e, width=1)
-            except:
-                print("Cannot add edge " + str(e))
-
-        for e in d['edges_to_increment']:
-            edge = e[0]
-            increment = e[1]
-            try:
-                self.G[edge[0]][edge[1]]['width'] += increment
-            except:
-                self.G.add_edge(edge[0], edge[1], width=increment)
-
-        # new_widths = {(e[0], e[1]): e[2]['width'] for e in g.edges(data=True)}
-        # for w in set(list(old_widths.keys())).intersection(list(new_widths.keys())):
-        #     if new_widths[w] < old_widths[w]:
-        #         print("Width decrease for edge " + str(w) + " at timestep " + str(timestep))
+        self.timestep = timestep
+        if self.frames is None:
+            self.replay.seek(timestep)
 
     def get_network_at_t(self, timestep):
-
-        if timestep == 0:
-            pass
-        else:
-            for t in range(1, timestep + 1):
-                self.update_network(t)
+        self.timestep = timestep
+        self.replay.seek(timestep)
 
     def draw_graph(self):
-
-        pos = {
-            n: self.all_pos[int(n)]
-            for n in self.G.nodes()
-        }
-        self.fig.clear()
-        cc = self.G.subgraph(max(nx.connected_components(self.G), key=len))
-
-        nx.draw_networkx(
-            cc, ax=self.fig.gca(),
-            pos=pos, with_labels=False,
-            width=[e[2]['width'] / self.edge_scale for e in self.G.edges(data=True)],
-            node_size=[10 + self.node_scale * self.G.degree[n] for n in cc.nodes()]
-        )
-
-        circle_size = 1 + self.circle_scale * (self.max_node_count / 100) + 0.1
-
-        font = {'family': 'serif',
-                'color': 'black',
-                'weight': 'normal',
-                'size': 13,
-                }
-        net_size = len(cc)
-        isolates = 100 - net_size
-        plt.text(
-            0.62 * circle_size, .85 * circle_size,
-            "Isolates: %d \nTurnover: %d\nNetwork size: %d" % (isolates, self.turnover_count, net_size),
-            fontdict=font,
-            bbox=dict(facecolor='blue', alpha=0.2, boxstyle='round')
-        )
-        plt.xlim([-circle_size, circle_size])
-        plt.ylim([-circle_size, circle_size])
-        plt.tight_layout()
-        buf = BytesIO()
-        self.fig.savefig(buf, format="png")
-        self.placeholder.image(buf)
+        if self.frames is not None:
+            with DRAW_GRAPH_SECONDS.labels('frames').time():
+                self.placeholder.image(self.frames[self.timestep])
+        else:
+            with DRAW_GRAPH_SECONDS.labels('render').time():
+                self.placeholder.image(self.renderer.render(self.G, self.turnover_count, self.component))
 
     def update(self, timestep):
         self.update_network(timestep)
@@ -334,17 +411,32 @@ def get_preset_details(value, detail='preset_name'):
     return preset_dict[detail]
 
 
-def set_default_parameters():
-    if st.session_state.preset_active:
-        parameter_dict = st.session_state.config.simulation_presets[st.session_state.preset]
-        for key, value in parameter_dict.items():
-            st.session_state[key] = value
+SELECTION_KEYS = ('project_count', 'dept_workload', 'budget_func', 'skill_decay', 'train_load', 'team_allocation')
+# The values offered by the sidebar widgets (in order).
+PARAMETER_OPTIONS = {
+    'team_allocation': ['Random', 'Optimised', 'Flexible start time'],
+    'budget_func': [True, False],
+    'project_count': [1, 2, 3, 5, 10],
+    'dept_workload': [0.1, 0.3],
+    'skill_decay': [0.950, 0.990, 0.995],
+    'train_load': [0.0, 0.1, 0.3, 2.0]
+}
 
-    else:
-        parameter_dict = st.session_state.config.default_simulation_parameters
-        for key, value in parameter_dict.items():
-            if key not in st.session_state:
-                st.session_state[key] = value
+
+def selection_sub_dir(**overrides):
+    """Data sub-directory and allocator for the sidebar selection, with the given parameter values changed."""
+    selection = {key: st.session_state[key] for key in SELECTION_KEYS}
+    selection.update(overrides)
+    allocator = ALLOCATOR_DIRS[selection.pop('team_allocation')]
+    return get_sub_dir(preset_e=preset_e_selected(), **selection), allocator
+
+
+def no_data_label(label, **overrides):
+    """Marks a sidebar option that, with the rest of the selection, has no data (according to the catalog)."""
+    catalog = get_catalog()
+    if catalog is None or catalog.available(*selection_sub_dir(**overrides)):
+        return label
+    return label + " (no data)"
 
 
 def create_sidebar_controls():
@@ -361,16 +453,23 @@ def create_sidebar_controls():
     with st.sidebar.expander("Expand for full parameter control"):
 
         set_default_parameters()
+        # Streamlit derives a widget's id from its option labels, which change with the rest of the selection
+        # (see no_data_label). A widget with a new id starts from its first option, unless its key was set
+        # through st.session_state beforehand, so the selected values are written back here. This has to
+        # come before any of the widgets is created: Streamlit raises if a widget's key is set after that.
+        for key in SELECTION_KEYS:
+            st.session_state[key] = st.session_state[key]
 
         row_0 = st.columns([2, 1])
 
         with row_0[0]:
             team_allocation = st.selectbox(
                 "Team allocation:",
-                options=['Random', 'Optimised', 'Flexible start time'],
+                options=PARAMETER_OPTIONS['team_allocation'],
                 key='team_allocation',
                 on_change=reload,
                 args=(True, False),
+                format_func=lambda x: no_data_label(x, team_allocation=x),
                 help="The method used for allocating a team of workers to each project.  \n"
                      "* Random: randomly assigned team.  \n"
                      "* Optimised: success probability optimised using basin-hopping algorithm.  \n"
@@ -380,11 +479,11 @@ def create_sidebar_controls():
         with row_0[-1]:
             budget_func = st.selectbox(
                 "Budget:",
-                options=[True, False],
+                options=PARAMETER_OPTIONS['budget_func'],
                 key='budget_func',
                 on_change=reload,
                 args=(True, False),
-                format_func=lambda x: 'On' if x else 'Off',
+                format_func=lambda x: no_data_label('On' if x else 'Off', budget_func=x),
                 help="Budgetary constraint on/off."
             )
 
@@ -393,43 +492,43 @@ def create_sidebar_controls():
         with row_1[0]:
             project_count = st.selectbox(
                 label="New projects:",
-                options=[1, 2, 3, 5, 10],
+                options=PARAMETER_OPTIONS['project_count'],
                 key='project_count',
                 on_change=reload,
                 args=(True, False),
+                format_func=lambda x: no_data_label(str(x), project_count=x),
                 help="Number of new projects created each time step."
             )
 
         with row_1[-1]:
-            dept_workload = st.slider(
+            dept_workload = st.select_slider(
                 "Departmental workload:",
-                min_value=0.1,
-                max_value=0.3,
-                step=0.2,
+                options=PARAMETER_OPTIONS['dept_workload'],
                 key='dept_workload',
                 on_change=reload,
                 args=(True, False),
+                format_func=lambda x: no_data_label('%.1f' % x, dept_workload=x),
                 help='Fraction of capacity that must be keep free to meet departmental workload.'
             )
 
         skill_decay = st.radio(
             "Skill decay:",
-            options=[0.950, 0.990, 0.995],
+            options=PARAMETER_OPTIONS['skill_decay'],
             key='skill_decay',
             on_change=reload,
             args=(True, False),
-            format_func=lambda x: '%.3f' % x,
+            format_func=lambda x: no_data_label('%.3f' % x, skill_decay=x),
             help="The multiplicative decay of worker unused hard skills.  \n"
                  "_Note: a lower value means faster decay._"
         )
 
         train_load = st.selectbox(
             "Training load:",
-            options=[0.0, 0.1, 0.3, 2.0],
+            options=PARAMETER_OPTIONS['train_load'],
             key='train_load',
             on_change=reload,
             args=(True, False),
-            format_func=lambda x: '%.1f' % x if x < 2 else 'Boost',
+            format_func=lambda x: no_data_label('%.1f' % x if x < 2 else 'Boost', train_load=x),
             help="Fraction of workforce that should be in training for any timestep.  \n"
                  "_Note: this cannot always be met if their is insufficient slack._"
         )
@@ -449,6 +548,8 @@ def create_sidebar_controls():
             preset_e=preset_e_selected()
         )
 
+    prefetch_neighbours()
+
     if 'playing' not in st.session_state:
         st.session_state.playing = False
 
@@ -467,25 +568,43 @@ def create_sidebar_controls():
             on_change=handle_speed_slider
         )
 
-        play = st.sidebar.button(
-            play_label(st.session_state.playing),
-            on_click=handle_play_click
-        )
+        if st.session_state.config.config_params['playback_mode'] == 'server':
+            play = st.sidebar.button(
+                play_label(st.session_state.playing),
+                on_click=handle_play_click
+            )
+
+
+def prefetch_neighbours():
+    """Loads the data for the likely next selections in the background (see prefetch.py)."""
+    if 'prefetcher' not in st.session_state:
+        st.session_state.prefetcher = Prefetcher(st.session_state.config)
+
+    st.session_state.prefetcher.update(
+        {key: st.session_state[key] for key in SELECTION_KEYS},
+        int(st.session_state.replicate),
+        PARAMETER_OPTIONS,
+        preset_e=preset_e_selected()
+    )
+
+
+def available_replicates(max_rep):
+    """The replicates below max_rep that have data for the sidebar selection (all of them without a catalog)."""
+    catalog = get_catalog()
+    if catalog is None:
+        return list(range(max_rep))
+    return [rep for rep in catalog.replicates(*selection_sub_dir()) if rep < max_rep]
 
 
 def select_replicate(verbose=False):
 
     max_rep = st.session_state.config.config_params['max_replicates']
     previous_rep = st.session_state.replicate
+    replicates = [rep for rep in available_replicates(max_rep) if rep != previous_rep]
 
-    if st.session_state.preset_active and max_rep > 1:
+    if st.session_state.preset_active and replicates:
 
-        st.session_state.replicate = np.random.choice(
-            [
-                i for i in range(max_rep)
-                if i != previous_rep
-            ]
-        )
+        st.session_state.replicate = np.random.choice(replicates)
     else:
         st.session_state.replicate = previous_rep
 
@@ -515,17 +634,35 @@ def page_code():
 
     if st.session_state.simulation_data['model_vars'] is not None:
 
+        client_side = st.session_state.config.config_params['playback_mode'] == 'client'
+
+        data_key = simulation_data_key()
         plot_list = []
-        for plot, details in st.session_state.config.simulation_plots.items():
+        if client_side:
+            # Playback runs in the browser: the network below is drawn at the timestep where it was last
+            # paused, stopped or seeked to.
+            handle_playback_event(client_playback(
+                lambda: client_playback_plots(data_key),
+                timestep=st.session_state.global_time,
+                speed=st.session_state.get('speed', 5),
+                data_key=data_key,
+                key='client_playback'
+            ))
+        elif st.session_state.config.config_params['simulation_layout'] == 'combined':
             plot_list.append(
-                TimeSeriesPlot(
-                    column_names=details['column_names'],
-                    column_colours=details['column_colours'],
-                    plot_name=plot,
-                    y_label=details['y_label'],
-                    info=details['info']
-                )
+                CombinedTimeSeriesPlot(simulation_plots(), data_key)
             )
+        else:
+            for plot, details in simulation_plots().items():
+                plot_list.append(
+                    TimeSeriesPlot(
+                        column_names=details['column_names'],
+                        column_colours=details['column_colours'],
+                        plot_name=plot,
+                        y_label=details['y_label'],
+                        info=details['info']
+                    )
+                )
 
         st.subheader('Social Network')
         st.button(
@@ -542,26 +679,50 @@ def page_code():
                 "due to inactivity, new workers are placed to fill concentric circles of increasing radius."
             )
         placeholder = st.empty()
-        net_plot = NetworkPlot(
-            timestep=st.session_state.global_time,
-            info="",
-            placeholder=placeholder
-        )
+        networks = st.session_state.simulation_data['networks']
+        if networks and 'init' in networks:
+            net_plot = NetworkPlot(
+                timestep=st.session_state.global_time,
+                info="",
+                placeholder=placeholder
+            )
+        else:
+            # The replicate's network files are missing (see read_replicate).
+            net_plot = None
+            if st.session_state.display_net:
+                placeholder.write("Sorry, we do not currently have the social network for this replicate.")
+
+        playback_report = st.empty()
+        if 'playback_report' in st.session_state:
+            playback_report.caption(st.session_state.playback_report)
 
-        if st.session_state.playing:
+        if st.session_state.playing and not client_side:
             start = st.session_state.global_time + 1
 
-            for t in range(start, 100):
+            # Playback keeps to 0.2 / speed seconds per timestep, skipping the drawing of timesteps when
+            # the updates take longer than that (see playback.py).
+            scheduler = FrameScheduler(start, 99, 0.2 / st.session_state.speed)
+            reported_at = 0
+            for first, t in scheduler:
+                frame_start = time.perf_counter()
 
                 for plot in plot_list:
-                    plot.update(t)
+                    plot.update(t, first=first)
 
-                time.sleep(0.2 / st.session_state.speed)
-                st.session_state.global_time += 1
+                st.session_state.global_time = t
 
-                if st.session_state.display_net:
+                if st.session_state.display_net and net_plot is not None:
                     net_plot.update(t)
 
-                if t == 99:
-                    st.session_state.playing = False
-                    st.experimental_rerun()
+                PLAYBACK_FRAME_SECONDS.observe(time.perf_counter() - frame_start)
+                PLAYBACK_SKIPPED_TIMESTEPS.inc(t - first)
+
+                if int(scheduler.elapsed) > reported_at:
+                    reported_at = int(scheduler.elapsed)
+                    playback_report.caption("Playback: " + scheduler.report())
+
+            if st.session_state.global_time == 99:
+                PLAYBACK_FPS.observe(scheduler.achieved_fps)
+                st.session_state.playback_report = "Playback: " + scheduler.report()
+                st.session_state.playing = False
+                st.experimental_rerun()
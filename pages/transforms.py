@@ -0,0 +1,98 @@
+"""
+Vectorised time series transforms.
+
+Each transform works along one axis (by default the last, i.e. time) of an array of any shape, so that
+many series can be transformed at once: e.g. the (replicates, timesteps) ROI array of the model store.
+
+The rolling transforms keep the edge semantics of the app's ROI moving average: position i holds the
+statistic of the window x[i:i + window], and the last window - 1 positions (whose window would run past
+the end of the series) hold the statistic of x[i - look_back:], i.e. of the final look_back + (n - i)
+values. With look_back=None they return only the n - window + 1 complete windows.
+"""
+import numpy as np
+
+
+def _tail_starts(n, window, look_back):
+    """Where the x[i - look_back:] window starts, for each position i past the last complete window."""
+    # Python slice semantics for x[i - look_back:]: a negative start counts from the end.
+    start = np.arange(max(n - window + 1, 0), n) - look_back
+    return np.where(start < 0, np.maximum(start + n, 0), start)
+
+
+def _window_sums(values, window, look_back):
+    """
+    Sums over the windows of values (along the last axis), as (sums, counts) broadcastable to the
+    output, using one cumulative sum.
+    """
+    n = values.shape[-1]
+    cumsum = np.zeros(values.shape[:-1] + (n + 1,))
+    np.cumsum(values, axis=-1, out=cumsum[..., 1:])
+
+    # (No complete windows when the window is longer than the series.)
+    sums = cumsum[..., window:] - cumsum[..., :max(n + 1 - window, 0)]
+    counts = np.full(max(n - window + 1, 0), float(window))
+
+    if look_back is not None:
+        start = _tail_starts(n, window, look_back)
+        sums = np.concatenate([sums, cumsum[..., n:] - cumsum[..., start]], axis=-1)
+        counts = np.concatenate([counts, n - start])
+
+    return sums, counts
+
+
+def rolling_mean(values, window, axis=-1, look_back=2):
+    values = np.moveaxis(np.asarray(values, dtype=np.float64), axis, -1)
+    sums, counts = _window_sums(values, int(window), look_back)
+    return np.moveaxis(sums / counts, -1, axis)
+
+
+def rolling_std(values, window, axis=-1, look_back=2, ddof=0):
+    """Two passes over each window (its mean, then the deviations), so window=1 gives exactly 0."""
+    values = np.moveaxis(np.asarray(values, dtype=np.float64), axis, -1)
+    window = int(window)
+    n = values.shape[-1]
+
+    if n >= window:
+        std = np.lib.stride_tricks.sliding_window_view(values, window, axis=-1).std(axis=-1, ddof=ddof)
+    else:
+        std = np.zeros(values.shape[:-1] + (0,))
+
+    if look_back is not None:
+        starts = _tail_starts(n, window, look_back)
+        counts = n - starts
+        # The x[i - look_back:] windows, padded to the longest of them and masked.
+        positions = starts[:, None] + np.arange(counts.max(initial=0))
+        valid = positions < n
+        tail = values[..., np.minimum(positions, n - 1)]
+        means = np.where(valid, tail, 0).sum(axis=-1) / counts
+        squares = np.where(valid, tail - means[..., None], 0) ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            variance = squares.sum(axis=-1) / np.maximum(counts - ddof, 0)
+        std = np.concatenate([std, np.sqrt(variance)], axis=-1)
+
+    return np.moveaxis(std, -1, axis)
+
+
+def ewma(values, alpha=None, span=None, axis=-1, adjust=True):
+    """
+    Exponentially weighted moving average, with smoothing factor alpha (or alpha = 2 / (span + 1)).
+    Matches pandas' ewm(alpha=alpha, adjust=adjust).mean() for series without missing values.
+
+    Computed as one product with an (n, n) weight matrix, so it is meant for series of up to a few
+    thousand timesteps.
+    """
+    if alpha is None:
+        alpha = 2 / (span + 1)
+
+    values = np.moveaxis(np.asarray(values, dtype=np.float64), axis, -1)
+    n = values.shape[-1]
+
+    lag = np.arange(n)[:, None] - np.arange(n)[None, :]
+    weights = np.where(lag >= 0, (1 - alpha) ** np.maximum(lag, 0), 0.0)
+    if adjust:
+        weights /= weights.sum(axis=1, keepdims=True)
+    else:
+        # y[0] = x[0], y[t] = (1 - alpha) y[t - 1] + alpha x[t]
+        weights[:, 1:] *= alpha
+
+    return np.moveaxis(values @ weights.T, -1, axis)
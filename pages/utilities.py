@@ -1,8 +1,20 @@
+import time
 import pickle
+from collections.abc import Mapping
 import numpy as np
+import pandas as pd
 import streamlit as st
-import networkx as nx
-import json
+
+from .catalog import get_catalog, probe_paths
+from .chart_data import build_plot_series
+from .data_cache import get_data_cache
+from .data_paths import ALLOCATOR_DIRS, get_sub_dir, replicate_path
+from .metrics import LOAD_MODELS_SECONDS, measure_read
+from .model_store import ROI_WINDOW, get_model_store
+from .network_diff import open_network_diff
+from .network_frames import NetworkFrames
+from .network_metrics import NETWORK_METRICS, merge_network_metrics, read_network_metrics
+from .transforms import rolling_mean
 
 
 def unpickle(file_path, data_type='df', silent=False):
@@ -20,130 +32,247 @@ def unpickle(file_path, data_type='df', silent=False):
 
     except FileNotFoundError:
         if not silent:
-            st.error("Sorry, we do not currently have data for that parameter combination. "
-                     "Please change your parameter selection. (%s)" % file_path)
+            data_not_found(file_path)
         return None
 
 
-@st.cache()
-def moving_average(interval, window_size, append_to_len=True, look_back=2):
-    window = np.ones(int(window_size)) / float(window_size)
+def data_not_found(file_path):
+    st.error("Sorry, we do not currently have data for that parameter combination. "
+             "Please change your parameter selection. (%s)" % file_path)
 
-    filtered = np.convolve(interval, window, 'valid')
 
-    if append_to_len:
-        filtered = list(filtered)
-        for i in range(len(filtered), len(interval)):
-            filtered.append(np.mean(interval[i - look_back:]))
+def replicate_paths(sub_dir, allocator, rep):
+    """{kind: path} of the files that a replicate has, from the catalog if it has been built."""
+    catalog = get_catalog()
+    if catalog is not None:
+        return catalog.paths(sub_dir, allocator, rep)
+    return probe_paths(sub_dir, allocator, rep)
 
-    return filtered
 
+def select_columns(model_vars, columns):
+    """The requested columns of model_vars that it has (and 'time'), or all of them if columns is None."""
+    if columns is None:
+        return model_vars
+    return model_vars[[c for c in model_vars.columns if c in columns or c == 'time']]
 
-def create_session_state_variables():
-    if 'config' not in st.session_state:
-        from config import Config
-        st.session_state.config = Config()
 
-    if 'team_allocation' not in st.session_state:
-        st.session_state.team_allocation = "Random"
+def read_only(frame):
+    """frame rebuilt on one read-only array per dtype, so that writing into its values raises."""
+    parts = []
+    for dtype in frame.dtypes.unique():
+        columns = frame.columns[frame.dtypes == dtype]
+        values = frame[columns].to_numpy()
+        values.flags.writeable = False
+        parts.append(pd.DataFrame(values, index=frame.index, columns=columns, copy=False))
+    return pd.concat(parts, axis=1, copy=False) if parts else frame
 
-    if 'replicate' not in st.session_state:
-        st.session_state.replicate = 0
 
-    if 'preset_active' not in st.session_state:
-        st.session_state.preset_active = False
+def read_replicate(sub_dir, allocator, rep, load_networks=True, columns=None):
+    """
+    Reads the data for a single replicate from disk. This has no Streamlit side effects, so that it can
+    be run from worker threads. (model_vars is None if there is no data for the replicate, and networks is
+    None if its network files are missing.)
 
-    if 'preset' not in st.session_state:
-        st.session_state.preset = None
+    With load_networks (i.e. for playback on the Simulation page) the time series plots are also prepared
+    in long format (see chart_data.PlotSeries). With columns, model_vars only has those variables (and
+    'time'), and only the files that they come from are read.
+    """
+    import networkx as nx
 
-    if 'simulation_data' not in st.session_state:
-        st.session_state.simulation_data = {
-            'model_vars': None,
-            'networks': None
-        }
+    return_data = {}
+    paths = replicate_paths(sub_dir, allocator, rep)
 
-    if 'display_net' not in st.session_state:
-        st.session_state.display_net = False
+    store = get_model_store()
+    store_row = store.row(sub_dir, allocator, rep) if store is not None else None
 
-    if 'data_load_complete' not in st.session_state:
-        st.session_state.data_load_complete = True
+    if store_row is not None:
+        with measure_read('store'):
+            return_data['model_vars'] = store.model_vars(store_row, columns)
+    elif 'model_vars' in paths:
+        with measure_read('model_vars', paths['model_vars']):
+            return_data['model_vars'] = unpickle(paths['model_vars'], silent=True)
+    else:
+        return_data['model_vars'] = None
+
+    diff_kind = 'network_diff' if 'network_diff' in paths else 'network_diff_json'
+    if return_data['model_vars'] is not None and load_networks and 'network' in paths and diff_kind in paths:
+        # We load the network for the first timestep and the 'network difference' file, which is used to
+        # update the network on each timestep. (The binary diff is read lazily, one timestep at a time.)
+        return_data['networks'] = {}
+        with measure_read('network', paths['network']):
+            return_data['networks']['init'] = nx.read_multiline_adjlist(paths['network'])
+
+        with measure_read('network_diff', paths[diff_kind]):
+            return_data['networks']['diff'] = open_network_diff(paths[diff_kind])
+        # Pre-rendered frames, if the frame cache has been built for this replicate:
+        return_data['networks']['frames'] = (
+            NetworkFrames(paths['network_frames']) if 'network_frames' in paths else None
+        )
+        # The largest component at each timestep, if the network metrics have been computed:
+        return_data['networks']['components'] = (
+            np.load(paths['network_components'], mmap_mode='r') if 'network_components' in paths else None
+        )
+
+    else:
+        # (Also when the replicate's network files are missing: the rest of its data can still be shown.)
+        return_data['networks'] = None
+
+    if return_data['model_vars'] is not None and store_row is None:
+        # We add ROI as this was computed and saved retrospectively (after simulations were run)
+        if columns is None or 'Roi' in columns:
+            roi = None
+            if 'roi' in paths:
+                with measure_read('roi', paths['roi']):
+                    roi = unpickle(paths['roi'], data_type='list', silent=True)
+            if roi is not None:
+                return_data['model_vars']['Roi'] = rolling_mean(roi, ROI_WINDOW)
+            else:
+                return_data['model_vars']['Roi'] = np.zeros(len(return_data['model_vars']))
+
+        if 'network_metrics' in paths and (columns is None or set(columns) & set(NETWORK_METRICS)):
+            with measure_read('network_metrics', paths['network_metrics']):
+                metrics = read_network_metrics(paths['network_metrics'])
+            return_data['model_vars'] = merge_network_metrics(return_data['model_vars'], metrics)
+
+        return_data['model_vars'] = read_only(select_columns(return_data['model_vars'], columns))
+
+    if return_data['model_vars'] is not None and load_networks:
+        return_data['plot_series'] = build_plot_series(return_data['model_vars'])
+
+    return return_data
+
+
+def shared_view(data, load_networks=True, columns=None):
+    """
+    New top-level containers over cached data: a shallow copy of model_vars (or of its columns, if given)
+    and of the networks dict. Callers can add or replace columns and keys without affecting other
+    sessions. The underlying arrays, graphs and diffs stay shared: the model_vars values are read-only
+    (writing into them in place raises), and the rest must not be modified in place.
+    """
+    model_vars = data['model_vars']
+    if model_vars is not None:
+        model_vars = select_columns(model_vars, columns) if columns is not None else model_vars.copy(deep=False)
+
+    view = {
+        'model_vars': model_vars,
+        'networks': dict(data['networks']) if load_networks and data['networks'] is not None else None
+    }
+    if load_networks and 'plot_series' in data:
+        view['plot_series'] = data['plot_series']
+    return view
+
+
+class LazyData(Mapping):
+    """
+    One of the network-dependent parts of a replicate's data ('networks' or 'plot_series'), which is only
+    loaded (with load_replicate, so through the data cache) when it is first used.
+    """
+
+    def __init__(self, sub_dir, allocator, rep, part):
+        self.key = (sub_dir, allocator, rep)
+        self.part = part
+        self._data = None
+
+    @property
+    def loaded(self):
+        return self._data is not None
+
+    def data(self):
+        if self._data is None:
+            # (Empty if the replicate does not have this part, e.g. when its network files are missing.)
+            self._data = load_replicate(*self.key, load_networks=True)[self.part] or {}
+        return self._data
+
+    def __getitem__(self, key):
+        return self.data()[key]
+
+    def __iter__(self):
+        return iter(self.data())
+
+    def __len__(self):
+        return len(self.data())
+
+
+def load_replicate(sub_dir, allocator, rep, load_networks=True, columns=None):
+    """
+    Returns the data for a single replicate from the process-wide data cache (keyed on the canonical data
+    path, load_networks and, without networks, the columns), reading it on a miss.
+
+    load_networks may be 'lazy', for the networks (and plot series) to be loaded only when they are used.
+    columns limits model_vars to those variables, which are all that is read if they are not cached yet.
+    """
+    catalog = get_catalog()
+    if catalog is not None and not catalog.has(sub_dir, allocator, rep):
+        # Known to have no data, so there is nothing to read (or cache).
+        return {'model_vars': None, 'networks': None}
+
+    if load_networks == 'lazy':
+        data = load_replicate(sub_dir, allocator, rep, load_networks=False, columns=columns)
+        if data['model_vars'] is not None:
+            data['networks'] = LazyData(sub_dir, allocator, rep, 'networks')
+            data['plot_series'] = LazyData(sub_dir, allocator, rep, 'plot_series')
+        return data
+
+    cache = get_data_cache()
+    if columns is not None:
+        columns = tuple(sorted(set(columns)))
+    if not load_networks:
+        # Serve from a fuller entry if it has already been loaded (rather than holding a second copy).
+        fuller = [(sub_dir, allocator, rep, True)] + ([(sub_dir, allocator, rep, False)] if columns else [])
+        for key in fuller:
+            # (Probed with 'in', which is not counted: the request is only a miss if it has to be read.)
+            cached = cache.get(key) if key in cache else None
+            if cached is not None:
+                return shared_view(cached, load_networks=False, columns=columns)
+
+    # (With networks the full model_vars is read, for the plots, and the columns are only selected.)
+    projected = columns is not None and not load_networks
+    key = (sub_dir, allocator, rep, load_networks) + ((columns,) if projected else ())
+    return shared_view(cache.get_or_load(
+        key,
+        lambda: read_replicate(
+            sub_dir, allocator, rep, load_networks=load_networks, columns=columns if projected else None
+        )
+    ), load_networks=load_networks, columns=columns)
 
 
-@st.cache()
 def load_models(
         project_count, dept_workload, budget_func,
         skill_decay, train_load, rep,
         team_allocation, duration=100,
         load_networks=True, preset_e=False,
-        use_preloaded_data=True
+        use_preloaded_data=True, columns=None
 ):
+    """
+    Returns the data for a replicate simulation. Caching is done by load_replicate, so this function only
+    deals with the session state: the preset shortcut and the data_load_complete flag.
+
+    Callers that only need some of the model variables should pass them as columns, and load_networks=False
+    (or 'lazy', if the networks might be needed), so that the rest is not read (see load_replicate).
+    """
+    start = time.perf_counter()
+    preloaded_data = None
     if (use_preloaded_data
             and 'preset_active' in st.session_state
             and 'preset' in st.session_state
             and st.session_state.preset_active):
-        return_data = st.session_state.comparison_data[st.session_state.preset][st.session_state.replicate]
+        # (Empty if the preset is still being loaded in the background, in which case we load it here.)
+        preloaded_data = st.session_state.comparison_data[st.session_state.preset][st.session_state.replicate]
+
+    if preloaded_data:
+        return_data = preloaded_data
     else:
 
         st.session_state.data_load_complete = False
-        return_data = {}
-
-        optimiser_dict = dict(zip(
-            ['Random', 'Optimised', 'Flexible start time'],
-            ['Random', 'Basin', 'Basin_w_flex']
-        ))
-
-        training_load = 0.1 if train_load == 2.0 else train_load
-        training_boost = True if train_load == 2.0 else False
-        training_flag = False if train_load == 0.0 else True
-
-        if preset_e:
-            sub_dir = (
-                    'preset_E_sd_%.3f_tl_%.1f_tf_%d_tb_%d_251021_v1.1'
-                    % (skill_decay, training_load, training_flag, training_boost)
-            )
-        else:
-            sub_dir = (
-                    'pps_%d_sd_%.3f_dw_%.1f_tl_%.1f_tf_%d_tb_%d_bf_%d_010921_v1.1'
-                    % (
-                        project_count, skill_decay, dept_workload,
-                        training_load, training_flag, training_boost, budget_func
-                    )
-            )
-
-        return_data['model_vars'] = unpickle(
-            "data/" + sub_dir + "/%s/model_vars_rep_%d.pickle" % (optimiser_dict[team_allocation], rep)
-        )
-        if return_data['model_vars'] is not None and load_networks:
-            # We load the network for the first timestep and the 'network difference' json file, which is used to
-            # update the network on each timestep.
-            return_data['networks'] = {}
-            t = 1
-            return_data['networks']['init'] = nx.read_multiline_adjlist(
-                "data/" + sub_dir + "/%s/network_rep_%d_timestep_%d.adjlist"
-                % (optimiser_dict[team_allocation], rep, t)
-            )
-            with open(
-                "data/" + sub_dir + "/%s/network_dfference_rep_%d.json"
-                % (optimiser_dict[team_allocation], rep),
-                'r'
-            ) as in_file:
-                return_data['networks']['diff'] = json.load(in_file)
-
-        else:
-            return_data['networks'] = None
-
-        if return_data['model_vars'] is not None:
-            # We add ROI as this was computed and saved retrospectively (after simulations were run)
-            roi = unpickle(
-                "data/" + sub_dir + "/%s/roi_rep_%d.pickle" % (optimiser_dict[team_allocation], rep),
-                data_type='list',
-                silent=True
-            )
-            if roi is not None:
-                return_data['model_vars']['Roi'] = moving_average(roi, window_size=10)
-            else:
-                return_data['model_vars']['Roi'] = np.zeros(len(return_data['model_vars']))
+
+        sub_dir = get_sub_dir(project_count, dept_workload, budget_func, skill_decay, train_load, preset_e)
+        allocator = ALLOCATOR_DIRS[team_allocation]
+        return_data = load_replicate(sub_dir, allocator, rep, load_networks=load_networks, columns=columns)
+
+        if return_data['model_vars'] is None:
+            data_not_found(replicate_path(sub_dir, allocator, "model_vars_rep_%d.pickle" % rep))
 
         st.session_state.data_load_complete = True
 
+    LOAD_MODELS_SECONDS.labels(networks=str(load_networks)).observe(time.perf_counter() - start)
     return return_data
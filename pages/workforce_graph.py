@@ -0,0 +1,113 @@
+"""
+Array-backed representation of the social network, for replaying it through the simulation timesteps.
+
+The workforce is a fixed, integer-labelled set of nodes, so the network is held as a boolean array of the
+nodes that are alive, and the edges as a sorted array of edge keys (u * capacity + v, with u <= v) with
+a parallel array of widths. A timestep's diff is applied in one batch of NumPy operations, with the same
+result as applying it edge by edge to a networkx.Graph (see apply), and copies (e.g. keyframes) are a few
+small arrays.
+
+Note: the initial networks are read with networkx, whose node labels are strings, while the diffs use
+integers. Here both are the same node.
+"""
+import numpy as np
+
+
+class WorkforceGraph:
+
+    def __init__(self, capacity, alive=None, keys=None, widths=None):
+        self.capacity = capacity
+        self.alive = np.zeros(capacity, dtype=bool) if alive is None else alive
+        self.keys = np.zeros(0, dtype=np.int64) if keys is None else keys
+        self.widths = np.zeros(0, dtype=np.int64) if widths is None else widths
+
+    @classmethod
+    def from_networkx(cls, G, capacity):
+        graph = cls(capacity)
+        graph.alive[[int(n) for n in G.nodes()]] = True
+
+        edges = np.array(
+            [(int(u), int(v), w) for u, v, w in G.edges(data='width', default=1)],
+            dtype=np.int64
+        ).reshape(-1, 3)
+        keys, inverse = np.unique(graph.edge_keys(edges[:, :2]), return_inverse=True)
+        graph.keys = keys
+        graph.widths = np.zeros(len(keys), dtype=np.int64)
+        graph.widths[inverse] = edges[:, 2]
+        return graph
+
+    def copy(self):
+        return WorkforceGraph(self.capacity, self.alive.copy(), self.keys.copy(), self.widths.copy())
+
+    def edge_keys(self, endpoints):
+        """Keys of the (n, 2) array of edge endpoints."""
+        endpoints = np.asarray(endpoints, dtype=np.int64).reshape(-1, 2)
+        return endpoints.min(axis=1) * self.capacity + endpoints.max(axis=1)
+
+    def edges(self):
+        """(u, v, width) arrays of the edges."""
+        return self.keys // self.capacity, self.keys % self.capacity, self.widths
+
+    def number_of_nodes(self):
+        return int(self.alive.sum())
+
+    def number_of_edges(self):
+        return len(self.keys)
+
+    def degrees(self):
+        """Degree of every node label (a self-loop counts twice, as in networkx)."""
+        u, v, _ = self.edges()
+        return np.bincount(np.concatenate([u, v]), minlength=self.capacity)
+
+    def apply(self, nodes_to_remove, nodes_to_add, edges_to_add, edges_to_increment):
+        """
+        Applies one timestep's diff (as from NetworkDiff.arrays). In order: the nodes are added, then
+        removed (with their edges), then the added edges are given width 1 and the increments are added
+        to the widths (starting from 0 for new edges). Edges add their endpoints.
+        """
+        self.alive[nodes_to_add] = True
+
+        if len(nodes_to_remove):
+            self.alive[nodes_to_remove] = False
+            u, v, _ = self.edges()
+            keep = ~(np.isin(u, nodes_to_remove) | np.isin(v, nodes_to_remove))
+            self.keys, self.widths = self.keys[keep], self.widths[keep]
+
+        edges_to_increment = np.asarray(edges_to_increment, dtype=np.int64).reshape(-1, 3)
+        added = self.edge_keys(edges_to_add)
+        incremented = self.edge_keys(edges_to_increment[:, :2])
+        if len(added) == 0 and len(incremented) == 0:
+            return
+
+        keys = np.union1d(self.keys, np.concatenate([added, incremented]))
+        widths = np.zeros(len(keys), dtype=np.int64)
+        widths[np.searchsorted(keys, self.keys)] = self.widths
+        widths[np.searchsorted(keys, added)] = 1
+        np.add.at(widths, np.searchsorted(keys, incremented), edges_to_increment[:, 2])
+        self.keys, self.widths = keys, widths
+
+        self.alive[np.asarray(edges_to_add, dtype=np.int64).ravel()] = True
+        self.alive[edges_to_increment[:, :2].ravel()] = True
+
+    def component_labels(self):
+        """For each node label, the smallest label in its connected component (-1 for nodes not alive)."""
+        labels = np.arange(self.capacity)
+        u, v, _ = self.edges()
+        while True:
+            previous = labels
+            # Propagate the smaller label across every edge, then jump to the label's own label.
+            smaller = np.minimum(labels[u], labels[v])
+            labels = labels.copy()
+            np.minimum.at(labels, u, smaller)
+            np.minimum.at(labels, v, smaller)
+            labels = labels[labels]
+            if np.array_equal(labels, previous):
+                break
+
+        return np.where(self.alive, labels, -1)
+
+    def largest_component(self):
+        """Boolean mask of the node labels in the largest connected component (the first, for ties)."""
+        labels = self.component_labels()
+        sizes = np.bincount(labels[labels >= 0], minlength=self.capacity)
+        return labels == np.argmax(sizes) if sizes.any() else np.zeros(self.capacity, dtype=bool)
@@ -1,13 +1,13 @@
 from application import Application
-from pages import simulation, comparison, about
 from streamlit import secrets
 import json
 
 app = Application()
-app.create_page("About", about)
-app.create_page("Simulation", simulation)
-# app.create_page("Hypotheses", hypotheses)
-app.create_page("Comparison", comparison)
+# (The pages are imported when they are first shown.)
+app.create_page("About", "pages.about")
+app.create_page("Simulation", "pages.simulation")
+# app.create_page("Hypotheses", "pages.hypotheses")
+app.create_page("Comparison", "pages.comparison", requires_presets=True)
 
 with open(secrets["FIRESTORE_KEY_FILE"], "w") as ofile:
     json.dump(secrets["FIRESTORE"], ofile, indent=4)
@@ -0,0 +1,75 @@
+"""
+Checks the rolling transforms against the app's original moving_average and against pandas.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from pages.transforms import rolling_mean, rolling_std
+
+WINDOWS = [1, 2, 3, 10, 99, 100, 101, 150]
+# Values around 1e3, where a sum-of-squares variance loses digits.
+SERIES = 1e3 + np.random.default_rng(0).normal(size=(4, 100)).cumsum(axis=1)
+
+
+def moving_average(interval, window_size, append_to_len=True, look_back=2):
+    """The app's moving average, before pages/transforms.py."""
+    window = np.ones(int(window_size)) / float(window_size)
+
+    filtered = np.convolve(interval, window, 'valid')
+
+    if append_to_len:
+        filtered = list(filtered)
+        for i in range(len(filtered), len(interval)):
+            filtered.append(np.mean(interval[i - look_back:]))
+
+    return filtered
+
+
+def moving_std(interval, window_size, look_back=2, ddof=0):
+    """The standard deviation with the same windows as moving_average, one window at a time."""
+    n = len(interval)
+    complete = [np.std(interval[i:i + window_size], ddof=ddof) for i in range(n - window_size + 1)]
+    return complete + [np.std(interval[i - look_back:], ddof=ddof) for i in range(len(complete), n)]
+
+
+@pytest.mark.parametrize('window', [w for w in WINDOWS if w <= 100])
+def test_rolling_mean_matches_moving_average(window):
+    expected = np.array([moving_average(values, window) for values in SERIES])
+    np.testing.assert_allclose(rolling_mean(SERIES, window), expected, rtol=0, atol=1e-9)
+
+
+# (With ddof=1 the single-value windows are NaN, with a warning from np.std.)
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('ddof', [0, 1])
+@pytest.mark.parametrize('window', WINDOWS)
+def test_rolling_std_matches_per_window_std(window, ddof):
+    if window == 1 and ddof == 1:
+        pytest.skip("No degrees of freedom in a single value.")
+    expected = np.array([moving_std(values, window, ddof=ddof) for values in SERIES])
+    np.testing.assert_allclose(rolling_std(SERIES, window, ddof=ddof), expected, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize('ddof', [0, 1])
+@pytest.mark.parametrize('window', [w for w in WINDOWS if 1 < w <= 100])
+def test_rolling_std_matches_pandas(window, ddof):
+    expected = np.array([
+        pd.Series(values).rolling(window).std(ddof=ddof).values[window - 1:] for values in SERIES
+    ])
+    np.testing.assert_allclose(rolling_std(SERIES, window, look_back=None, ddof=ddof), expected, rtol=0, atol=1e-4)
+
+
+def test_rolling_std_of_single_values_is_zero():
+    assert np.array_equal(rolling_std(SERIES, 1), np.zeros_like(SERIES))
+
+
+def test_window_longer_than_series():
+    # Only the x[i - look_back:] windows remain.
+    assert rolling_mean(SERIES, 150).shape == SERIES.shape
+    assert rolling_std(SERIES, 150).shape == SERIES.shape
+    assert rolling_mean(SERIES, 150, look_back=None).shape == (4, 0)
+    assert rolling_std(SERIES, 150, look_back=None).shape == (4, 0)
+
+
+def test_axis():
+    np.testing.assert_array_equal(rolling_std(SERIES.T, 10, axis=0), rolling_std(SERIES, 10).T)
@@ -0,0 +1,150 @@
+"""
+Checks the array-backed network replay (WorkforceGraph, NetworkReplay) against a replay of the same
+diffs on a networkx.Graph, for a sample of the bundled replicates, with json and binary diffs and with
+random seeks.
+"""
+import os
+import json
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from pages.data_paths import REPLICATE_FILES, list_replicates, replicate_path
+from pages.network_diff import NetworkDiff, encode_network_diff
+from pages.network_replay import NetworkReplay
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+SAMPLE_SIZE = 12
+SEEKS = 30
+
+
+def replicates_with_networks():
+    if not os.path.isdir(DATA_DIR):
+        return []
+    replicates = [
+        (sub_dir, allocator, rep) for sub_dir, allocator, rep in list_replicates(DATA_DIR)
+        if os.path.isfile(replicate_path(sub_dir, allocator, REPLICATE_FILES['network'] % rep, DATA_DIR))
+        and os.path.isfile(replicate_path(sub_dir, allocator, REPLICATE_FILES['network_diff_json'] % rep, DATA_DIR))
+    ]
+    return random.Random(0).sample(replicates, min(SAMPLE_SIZE, len(replicates)))
+
+
+def networkx_states(init, diff, relabel=True):
+    """
+    The network at every timestep, replayed edge by edge on a networkx.Graph (as NetworkReplay did
+    before WorkforceGraph), with the turnover count. With relabel, the initial labels are converted to
+    integers, as in WorkforceGraph (see test_initial_labels_are_the_diff_labels).
+    """
+    G = nx.relabel_nodes(init, int) if relabel else init.copy()
+    turnover_count = 0
+    states = [(G.copy(), turnover_count)]
+
+    for timestep in range(2, len(diff) + 2):
+        d = diff[str(timestep)]
+        for n in d['nodes_to_add']:
+            turnover_count += 1
+            G.add_node(n)
+        for n in d['nodes_to_remove']:
+            if n in G:
+                G.remove_node(n)
+        for e in d['edges_to_add']:
+            G.add_edge(*e, width=1)
+        for (u, v), increment in d['edges_to_increment']:
+            if G.has_edge(u, v):
+                G[u][v]['width'] += increment
+            else:
+                G.add_edge(u, v, width=increment)
+        states.append((G.copy(), turnover_count))
+
+    return states
+
+
+def assert_same_network(replay, expected):
+    G, turnover_count = expected
+    graph = replay.G
+
+    u, v, widths = graph.edges()
+    assert {(int(a), int(b)): int(w) for a, b, w in zip(u, v, widths)} == {
+        (min(a, b), max(a, b)): w for a, b, w in G.edges(data='width')
+    }
+    assert set(np.flatnonzero(graph.alive).tolist()) == set(G.nodes())
+    assert replay.turnover_count == turnover_count
+
+    # (Ties between equally sized components may pick different components, so only sizes compare.)
+    largest = max(nx.connected_components(G), key=len) if len(G) else set()
+    assert int(graph.largest_component().sum()) == len(largest)
+
+
+def read_network(sub_dir, allocator, rep):
+    init = nx.read_multiline_adjlist(replicate_path(sub_dir, allocator, REPLICATE_FILES['network'] % rep, DATA_DIR))
+    with open(replicate_path(sub_dir, allocator, REPLICATE_FILES['network_diff_json'] % rep, DATA_DIR)) as ifile:
+        diff = json.load(ifile)
+    return init, diff
+
+
+def open_diff(diff, form, tmp_path):
+    """The json diff as it is, or converted to a binary NetworkDiff."""
+    if form == 'json':
+        return diff
+    path = str(tmp_path / 'network_diff.npy')
+    np.save(path, encode_network_diff(diff))
+    return NetworkDiff(path)
+
+
+REPLICATES = pytest.mark.parametrize(
+    'replicate', replicates_with_networks(), ids=lambda replicate: '%s/%s/%d' % replicate
+)
+DIFF_FORMS = pytest.mark.parametrize('form', ['json', 'binary'])
+
+
+@REPLICATES
+@DIFF_FORMS
+def test_sequential_replay(replicate, form, tmp_path):
+    init, diff = read_network(*replicate)
+    states = networkx_states(init, diff)
+    replay = NetworkReplay(init, open_diff(diff, form, tmp_path))
+
+    assert_same_network(replay, states[0])
+    for timestep in range(1, len(states)):
+        replay.seek(timestep)
+        assert_same_network(replay, states[timestep])
+
+
+@REPLICATES
+@DIFF_FORMS
+def test_random_seeks(replicate, form, tmp_path):
+    init, diff = read_network(*replicate)
+    states = networkx_states(init, diff)
+    replay = NetworkReplay(init, open_diff(diff, form, tmp_path))
+
+    rng = random.Random(1)
+    for timestep in [rng.randrange(len(states)) for _ in range(SEEKS)]:
+        replay.seek(timestep)
+        assert_same_network(replay, states[timestep])
+
+
+def test_initial_labels_are_the_diff_labels():
+    """
+    The initial network's labels are strings (as read by networkx) and the diffs' are integers. The
+    networkx replay kept '1' and 1 as separate nodes; WorkforceGraph treats them as the same worker.
+    """
+    init = nx.Graph()
+    init.add_edge('0', '1', width=2)
+    diff = {'2': {
+        'nodes_to_remove': [], 'nodes_to_add': [2],
+        'edges_to_add': [[1, 2]], 'edges_to_increment': [[[0, 1], 3]]
+    }}
+
+    replay = NetworkReplay(init, diff)
+    replay.seek(1)
+    u, v, widths = replay.G.edges()
+    assert replay.G.number_of_nodes() == 3
+    assert dict(zip(zip(u.tolist(), v.tolist()), widths.tolist())) == {(0, 1): 5, (1, 2): 1}
+
+    G, _ = networkx_states(init, diff, relabel=False)[1]
+    assert G.number_of_nodes() == 5
+    assert {frozenset((u, v)): w for u, v, w in G.edges(data='width')} == {
+        frozenset(('0', '1')): 2, frozenset((1, 2)): 1, frozenset((0, 1)): 3
+    }